@@ -51,7 +51,7 @@ class AlphabetState(CharacterState, InputMixin):
     The string value of all program variables is unconstrained by default.
 
     When reading input data, the corresponding range assumptions
-    are stored in the class member ``inputs``, which is a map from each program point
+    are recorded in the log ``inputs``, which is a map from each program point
     to the list of range assumptions on the input data read at that point.
 
     .. document private methods
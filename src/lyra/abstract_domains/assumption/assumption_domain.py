@@ -9,7 +9,7 @@ Abstract domains to be used for **input data assumption analysis**.
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from enum import Enum
-from typing import List, Dict, Type, Any, Union, Tuple, Set, Optional
+from typing import List, Dict, Type, Any, Union, Tuple, Set, Optional, Sequence
 
 from lyra.abstract_domains.lattice import Lattice, BottomMixin, EnvironmentMixin
 from lyra.abstract_domains.stack import Stack
@@ -44,17 +44,43 @@ class JSONMixin(Lattice, metaclass=ABCMeta):
         """
 
 
+class InputLog(defaultdict):
+    """Map from each program point to the list of constraints on the input data read at that point.
+
+    The log is shared by all copies of the state it is created with,
+    and is thus owned by the analysis run that creates the (initial) state.
+    """
+
+    def __init__(self):
+        super().__init__(list)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return type(self), (), None, None, iter(self.items())
+
+
 class InputMixin(State, metaclass=ABCMeta):
     """Mixin to add a mechanism for recording and retrieving constraints on the input data.
 
-    Constraints are recorded in the class member ``inputs``, which is a map
-    from each program point to the list of constraints on the input data read at that point.
+    Constraints are recorded in the log ``inputs``, which is a map from each program point
+    to the list of constraints on the input data read at that point.
+    The log is created with the state and shared with all its copies, so that
+    analyses run concurrently (e.g., in different threads) do not interfere with each other.
     """
-    inputs: Dict[ProgramPoint, List[JSONMixin]]
 
     def __init__(self, precursory: State = None):
         super().__init__(precursory)
-        type(self).inputs = defaultdict(list)
+        self._inputs = InputLog()
+
+    @property
+    def inputs(self) -> Dict[ProgramPoint, List[JSONMixin]]:
+        """Log of the constraints on the input data recorded by the current analysis run."""
+        return self._inputs
 
     @abstractmethod
     def replace(self, variable: VariableIdentifier, expression: Expression) -> 'InputMixin':
@@ -101,13 +127,18 @@ class InputMixin(State, metaclass=ABCMeta):
         self.unify(other)
         return super().widening(other.unify(self))
 
+    @copy_docstring(State.widening_with_thresholds)
+    def widening_with_thresholds(self, other: 'InputMixin', thresholds: Sequence):
+        self.unify(other)
+        return super().widening_with_thresholds(other.unify(self), thresholds)
+
     def record(self, constraint: JSONMixin) -> 'InputMixin':
         """Record an constraint.
 
         :param constraint: constraint to be recorded
         :return: current state modified to record the constraint
         """
-        type(self).inputs[self.pp].append(constraint)
+        self.inputs[self.pp].append(constraint)
         return self
 
     def retrieve(self) -> List[JSONMixin]:
@@ -118,7 +149,7 @@ class InputMixin(State, metaclass=ABCMeta):
 
         :return: the list of constraints corresponding to the current program point
         """
-        return type(self).inputs.pop(self.pp, list())
+        return self.inputs.pop(self.pp, list())
 
 
 class AssumptionState(State):
@@ -896,6 +927,10 @@ class AssumptionState(State):
     def __repr__(self):
         return "{}".format(self.stack)
 
+    @copy_docstring(State._structure)
+    def _structure(self):
+        return self.stack
+
     @copy_docstring(State.bottom)
     def bottom(self) -> 'AssumptionState':
         for i, state in enumerate(self.states):
@@ -57,7 +57,7 @@ class QuantityState(SignState, InputMixin):
     Map from each program variable to the sign representing its value.
 
     When reading input data, the corresponding quantity assumptions
-    are stored in the class member ``inputs``, which is a map from each program point
+    are recorded in the log ``inputs``, which is a map from each program point
     to the list of quantity assumptions on the input data read at that point.
 
     .. document private methods
@@ -58,7 +58,7 @@ class RangeState(IntervalStateWithSummarization, InputMixin):
     The value of all program variables is represented by the unbounded range by default.
 
     When reading input data, the corresponding range assumptions
-    are stored in the class member ``inputs``, which is a map from each program point
+    are recorded in the log ``inputs``, which is a map from each program point
     to the list of range assumptions on the input data read at that point.
 
     .. document private methods
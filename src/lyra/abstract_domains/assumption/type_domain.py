@@ -116,6 +116,10 @@ class TypeLattice(BottomMixin, ArithmeticMixin, SequenceMixin, JSONMixin):
             return "⊥"
         return self.element.name
 
+    @copy_docstring(BottomMixin._structure)
+    def _structure(self):
+        return self.element
+
     def boolean(self) -> 'TypeLattice':
         """Integer lattice element.
 
@@ -410,7 +414,7 @@ class TypeState(Store, StateWithSummarization, InputMixin):
         we should always have m(x) ≤ TypeLattice.from_lyra_type(x.typ)
 
     When reading input data, the corresponding type assumptions
-    are stored in the class member ``inputs``, which is a map from each program point
+    are recorded in the log ``inputs``, which is a map from each program point
     to the list of type assumptions on the inputs read at that point.
 
     .. note:: Program variables storing collections are abstracted via summarization.
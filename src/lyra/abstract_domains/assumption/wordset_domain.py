@@ -49,7 +49,7 @@ class WordSetState(StringSetState, InputMixin):
     The default abstraction is the set of all possible string values.
 
     When reading input data, the corresponding range assumptions
-    are stored in the class member ``inputs``, which is a map from each program point
+    are recorded in the log ``inputs``, which is a map from each program point
     to the list of range assumptions on the input data read at that point.
 
     .. document private methods
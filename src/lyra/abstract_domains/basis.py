@@ -6,27 +6,88 @@ Interface of an abstract domain mapping variables to lattice elements.
 
 :Author: Caterina Urban
 """
+import threading
 from abc import ABCMeta
 from ast import literal_eval
+from collections import OrderedDict
 from copy import deepcopy
-from typing import Set, Dict, Type, Any, Union, List
+from typing import Set, Dict, Type, Any, Union, List, Optional, Tuple
 
 from lyra.abstract_domains.container.indexed_lattice import IndexedLattice
 from lyra.abstract_domains.lattice import Lattice, ArithmeticMixin, BooleanMixin, SequenceMixin
 from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
 from lyra.abstract_domains.state import State, StateWithSummarization
-from lyra.abstract_domains.store import Store
+from lyra.abstract_domains.store import Store, CopyOnWriteDict
 from lyra.core.expressions import VariableIdentifier, Expression, Subscription, Slicing, \
     BinaryBooleanOperation, ExpressionVisitor, Literal, LengthIdentifier, ListDisplay, \
     AttributeReference, Input, Range, UnaryArithmeticOperation, BinaryArithmeticOperation, \
     UnaryBooleanOperation, TupleDisplay, SetDisplay, DictDisplay, BinarySequenceOperation, Keys, \
-    Values, KeysIdentifier, ValuesIdentifier, CastOperation, BinaryComparisonOperation
+    Values, KeysIdentifier, ValuesIdentifier, CastOperation, BinaryComparisonOperation, walk
 from lyra.core.types import LyraType, BooleanLyraType, SequenceLyraType, DictLyraType, \
     ContainerLyraType, IntegerLyraType, FloatLyraType, StringLyraType, ListLyraType, SetLyraType, \
     TupleLyraType
 from lyra.core.utils import copy_docstring
 
 
+class EvaluationCache:
+    """Bounded cache of expression evaluations, shared by an analysis state and all its copies.
+
+    Evaluations are keyed by the evaluated expression and the versions of the values
+    of the variables it reads (cf. :meth:`CopyOnWriteDict.version`),
+    and the least recently used evaluations are evicted first.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """Create an empty evaluation cache.
+
+        :param capacity: maximum number of cached evaluations
+        """
+        self._capacity = capacity
+        self._evaluations: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def __len__(self):
+        return len(self._evaluations)
+
+    def get(self, expr: Expression, versions: Tuple[int, ...]) -> Optional[CopyOnWriteDict]:
+        """Cached evaluation of an expression.
+
+        :param expr: evaluated expression
+        :param versions: versions of the values of the variables read by the expression
+        :return: cached evaluation, or ``None`` if the evaluation is not cached
+        """
+        key = (id(expr), versions)
+        cached = self._evaluations.get(key)
+        if cached is None or cached[0] is not expr:     # identifiers are equal by name only
+            self.misses += 1
+            return None
+        self._evaluations.move_to_end(key)
+        self.hits += 1
+        return cached[1]
+
+    def put(self, expr: Expression, versions: Tuple[int, ...], evaluation: CopyOnWriteDict):
+        """Cache the evaluation of an expression.
+
+        :param expr: evaluated expression
+        :param versions: versions of the values of the variables read by the expression
+        :param evaluation: evaluation to cache
+        """
+        self._evaluations[(id(expr), versions)] = (expr, evaluation)
+        if len(self._evaluations) > self.capacity:
+            self._evaluations.popitem(last=False)
+
+    def __deepcopy__(self, memo):
+        return self     # shared among copies of a state
+
+    def __reduce__(self):
+        return EvaluationCache, (self.capacity,)    # versions are unique per process
+
+
 class Basis(Store, State, metaclass=ABCMeta):
     """Analysis basis state. A mutable element of a basis abstract domain.
     (MRO: Basis, State, Store, EnvironmentMixin, Lattice)
@@ -41,6 +102,12 @@ class Basis(Store, State, metaclass=ABCMeta):
                  precursory: State = None):
         super().__init__(variables, lattices, arguments)
         State.__init__(self, precursory)
+        self._evaluations = EvaluationCache()
+
+    @property
+    def evaluations(self) -> EvaluationCache:
+        """Cache of expression evaluations (shared with all copies of the current state)."""
+        return self._evaluations
 
     @copy_docstring(State._assign_variable)
     def _assign_variable(self, left: VariableIdentifier, right: Expression) -> 'Basis':
@@ -116,7 +183,110 @@ class Basis(Store, State, metaclass=ABCMeta):
     # expression evaluation
 
     class ExpressionEvaluation(ExpressionVisitor, metaclass=ABCMeta):
-        """Visitor that performs the evaluation of an expression in the lattice."""
+        """Visitor that performs the evaluation of an expression in the lattice.
+
+        The evaluation of expressions without side effects on the state is cached,
+        keyed by the versions of the values of the variables they read, and reused
+        (e.g., across fixpoint iterations) while these values are unchanged.
+        The returned evaluation shares its values with the cached one,
+        and copies them only when they are retrieved (for a possible modification).
+        """
+
+        # expressions (matched by exact type) whose evaluation has no side effects on the state
+        pure = {Literal, VariableIdentifier, LengthIdentifier, Input,
+                UnaryArithmeticOperation, UnaryBooleanOperation,
+                BinaryArithmeticOperation, BinaryBooleanOperation, BinaryComparisonOperation}
+
+        def __init__(self):
+            # the evaluations are shared by all states of a class (and thus by concurrent analyses)
+            self._flags = threading.local()
+
+        @property
+        def _nested(self) -> bool:
+            """Whether a subexpression is being evaluated (by the current thread)."""
+            return getattr(self._flags, 'nested', False)
+
+        @_nested.setter
+        def _nested(self, nested: bool):
+            self._flags.nested = nested
+
+        @property
+        def _pure(self) -> bool:
+            """Whether the expression evaluated by the current thread has no side effects."""
+            return getattr(self._flags, 'pure', False)
+
+        @_pure.setter
+        def _pure(self, pure: bool):
+            self._flags.pure = pure
+
+        def visit(self, expr, state=None, evaluation=None):
+            if self._nested or evaluation:
+                return super().visit(expr, state, evaluation)
+            self._nested = True
+            try:
+                reads = self._reads(expr)
+                if reads is None or state.is_bottom():
+                    return super().visit(expr, state, evaluation)
+                self._pure = True
+                cache = getattr(state, 'evaluations', None)
+                versions = self._versions(reads, state) if cache is not None else None
+                if versions is None:    # the evaluation cannot be cached
+                    return super().visit(expr, state, evaluation)
+                cached = cache.get(expr, versions)
+                if cached is None:
+                    cached = super().visit(expr, state, CopyOnWriteDict())
+                    cache.put(expr, versions, cached)
+                return cached.copy()
+            finally:
+                self._nested = self._pure = False
+
+        def _reads(self, expr: Expression) -> Optional[List[VariableIdentifier]]:
+            """Variables read by an expression.
+
+            :param expr: expression to be evaluated
+            :return: variables read by the expression, or ``None`` if its evaluation has
+                (or might have) side effects on the state
+            """
+            variables = list()
+            for e in walk(expr):
+                if type(e) not in self.pure:
+                    return None
+                if isinstance(e, VariableIdentifier):
+                    variables.append(e)
+            return variables
+
+        @staticmethod
+        def _versions(variables: List[VariableIdentifier], state) -> Optional[Tuple[int, ...]]:
+            """Versions of the values of some variables in a state.
+
+            :param variables: variables whose versions to retrieve
+            :param state: current state
+            :return: versions of the values, or ``None`` if any of them has no version
+            """
+            versions = list()
+            for variable in variables:
+                reads = [(state.store, variable)]
+                if variable.has_length:
+                    reads.append((state.lengths, variable.length))
+                    if variable.is_dictionary:
+                        reads.append((state.keys, variable.keys))
+                        reads.append((state.values, variable.values))
+                for mapping, key in reads:
+                    if not isinstance(mapping, CopyOnWriteDict) or key not in mapping:
+                        return None
+                    version = mapping.version(key)
+                    if version is None:
+                        return None
+                    versions.append(version)
+            return tuple(versions)
+
+        def _is_bottom(self, state) -> bool:
+            """Whether the state became bottom while evaluating a subexpression.
+
+            This cannot happen while evaluating an expression without side effects on the state
+            (checked once before the evaluation), in which case the check is skipped.
+            """
+            return not self._pure and state.is_bottom()
 
         @copy_docstring(ExpressionVisitor.visit_Literal)
         def visit_Literal(self, expr: Literal, state=None, evaluation=None):
@@ -131,12 +301,17 @@ class Basis(Store, State, metaclass=ABCMeta):
         def visit_VariableIdentifier(self, expr: VariableIdentifier, state=None, evaluation=None):
             if expr in evaluation:
                 return evaluation  # nothing to be done
-            evaluation[expr] = deepcopy(state.store[expr])
+            # copy-on-write evaluations share the values and copy them only when retrieved
+            share = isinstance(evaluation, CopyOnWriteDict)
+            reads = [(state.store, expr)]
             if expr.has_length:
-                evaluation[expr.length] = deepcopy(state.lengths[expr.length])
+                reads.append((state.lengths, expr.length))
                 if expr.is_dictionary:
-                    evaluation[expr.keys] = deepcopy(state.keys[expr.keys])
-                    evaluation[expr.values] = deepcopy(state.values[expr.values])
+                    reads.append((state.keys, expr.keys))
+                    reads.append((state.values, expr.values))
+            for mapping, key in reads:
+                value = state._peek(mapping, key)
+                evaluation[key] = value if share else deepcopy(value)
             return evaluation
 
         @copy_docstring(ExpressionVisitor.visit_LengthIdentifier)
@@ -185,7 +360,7 @@ class Basis(Store, State, metaclass=ABCMeta):
             if expr in evaluation:
                 return evaluation  # nothing to be done
             evaluated = self.visit(expr.expression, state, evaluation)
-            if state.is_bottom():
+            if self._is_bottom(state):
                 return evaluation
             value = evaluated[expr.expression]
             if expr.operator == UnaryArithmeticOperation.Operator.Add:
@@ -204,7 +379,7 @@ class Basis(Store, State, metaclass=ABCMeta):
             if expr in evaluation:
                 return evaluation  # nothing to be done
             evaluated = self.visit(expr.expression, state, evaluation)
-            if state.is_bottom():
+            if self._is_bottom(state):
                 return evaluation
             value = evaluated[expr.expression]
             if expr.operator == UnaryBooleanOperation.Operator.Neg:
@@ -220,10 +395,10 @@ class Basis(Store, State, metaclass=ABCMeta):
             if expr in evaluation:
                 return evaluation  # nothing to be done
             evaluated1 = self.visit(expr.left, state, evaluation)
-            if state.is_bottom():
+            if self._is_bottom(state):
                 return evaluation
             evaluated2 = self.visit(expr.right, state, evaluated1)
-            if state.is_bottom():
+            if self._is_bottom(state):
                 return evaluation
             value1 = evaluated2[expr.left]
             value2 = evaluated2[expr.right]
@@ -264,10 +439,10 @@ class Basis(Store, State, metaclass=ABCMeta):
             if expr in evaluation:
                 return evaluation  # nothing to be done
             evaluated1 = self.visit(expr.left, state, evaluation)
-            if state.is_bottom():
+            if self._is_bottom(state):
                 return evaluation
             evaluated2 = self.visit(expr.right, state, evaluated1)
-            if state.is_bottom():
+            if self._is_bottom(state):
                 return evaluation
             value1 = evaluated2[expr.left]
             value2 = evaluated2[expr.right]
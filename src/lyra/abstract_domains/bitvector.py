@@ -0,0 +1,240 @@
+"""
+Bit Vectors
+===========
+
+Packed mapping from variables to elements of a small finite lattice,
+to be used as the mappings of a store.
+
+The elements of the lattice are encoded by the values of its ``Status`` enumeration.
+Each bit of these codes is stored in a separate bitmask (or plane) over the slots of the variables,
+so that the point-wise lattice operations between stores become integer bit operations.
+
+:Author: Caterina Urban
+"""
+from collections.abc import MutableMapping
+from typing import Dict, Type, List, Sequence
+
+from lyra.abstract_domains.lattice import Lattice
+
+
+class BitVector(MutableMapping):
+    """Mapping from keys to elements of a finite lattice, storing their codes in bitmasks.
+
+    The lattice is expected to have a ``Status`` enumeration (of its elements) and to be built
+    from (and to expose via ``element``) one of its values, such that the bitwise or (resp. and)
+    of the codes of two elements is the code of their join (resp. meet).
+    The bottom element is encoded by zero and the top element by all ones.
+
+    Lattice elements retrieved by subscription (or set) are written back into the bitmasks
+    before the next copy or lattice operation, since the caller might modify them.
+    Lattice elements that are only read can be retrieved via ``peek()``.
+
+    .. warning::
+        Values retrieved for writing must not be modified after hashing or copying the mapping,
+        or after performing a lattice operation on it.
+    """
+
+    def __init__(self, lattice: Type[Lattice], data: Dict = None):
+        data = dict() if data is None else data
+        peek = getattr(data, 'peek', data.__getitem__)
+        self._lattice = lattice
+        codes = [status.value for status in lattice.Status.__members__.values()]
+        self._slots: Dict = {key: slot for slot, key in enumerate(data)}
+        self._planes: List[int] = [0] * max(codes).bit_length()
+        self._pending: Dict = dict()    # values retrieved for writing, not yet written back
+        for key, slot in self._slots.items():
+            self._write(slot, peek(key))
+
+    @property
+    def lattice(self) -> Type[Lattice]:
+        """Lattice of the values of the mapping."""
+        return self._lattice
+
+    @property
+    def _full(self) -> int:
+        """Bitmask with all slots set."""
+        return (1 << len(self._slots)) - 1
+
+    def _write(self, slot: int, value: Lattice):
+        code, bit = int(value.element.value), 1 << slot
+        for i, plane in enumerate(self._planes):
+            self._planes[i] = plane | bit if code >> i & 1 else plane & ~bit
+
+    def _read(self, slot: int) -> Lattice:
+        code = sum((plane >> slot & 1) << i for i, plane in enumerate(self._planes))
+        return self.lattice(self.lattice.Status(code))
+
+    def _sync(self):
+        """Write back the values retrieved for writing."""
+        for key, value in self._pending.items():
+            self._write(self._slots[key], value)
+        self._pending = dict()
+
+    def __getitem__(self, key):
+        value = self._pending.get(key)
+        if value is None:
+            value = self._pending[key] = self._read(self._slots[key])
+        return value
+
+    def __setitem__(self, key, value):
+        if key not in self._slots:
+            self._slots = dict(self._slots)     # the slots might be shared with copies
+            self._slots[key] = len(self._slots)
+        self._pending[key] = value
+
+    def __delitem__(self, key):
+        slot = self._slots[key]
+        self._pending.pop(key, None)
+        self._slots = {other: index if index < slot else index - 1
+                       for other, index in self._slots.items() if other != key}
+        low = (1 << slot) - 1
+        self._planes = [plane & low | plane >> (slot + 1) << slot for plane in self._planes]
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __iter__(self):
+        return iter(self._slots)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __repr__(self):
+        return repr({key: self.peek(key) for key in self._slots})
+
+    def __eq__(self, other):
+        if isinstance(other, BitVector):
+            mine = {key: self.peek(key) for key in self._slots}
+            return mine == {key: other.peek(key) for key in other._slots}
+        return super().__eq__(other)
+
+    def __hash__(self):
+        return hash(frozenset((key, self.peek(key)) for key in self._slots))
+
+    def peek(self, key) -> Lattice:
+        """Retrieve a value only to read it.
+
+        .. warning::
+            The retrieved value must not be modified.
+
+        :param key: key of the value to retrieve
+        :return: value
+        """
+        value = self._pending.get(key)
+        if value is None:
+            return self._read(self._slots[key])
+        return value
+
+    def copy(self) -> 'BitVector':
+        """Copy the mapping, sharing its slots with the copy.
+
+        :return: copy of the mapping
+        """
+        self._sync()
+        fork = self.__class__.__new__(self.__class__)
+        fork._lattice = self._lattice
+        fork._slots = self._slots
+        fork._planes = list(self._planes)
+        fork._pending = dict()
+        return fork
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __getstate__(self):
+        self._sync()
+        return dict(self.__dict__)
+
+    def _aligned(self, other: 'BitVector') -> List[int]:
+        """Bitmasks of the other mapping, ordered by the slots of the current mapping."""
+        other._sync()
+        if other._slots is self._slots or other._slots == self._slots:
+            return other._planes
+        planes = [0] * len(self._planes)
+        for key, slot in self._slots.items():
+            index = other._slots[key]
+            for i, plane in enumerate(other._planes):
+                planes[i] |= (plane >> index & 1) << slot
+        return planes
+
+    def bottoms(self) -> list:
+        """Keys mapped to the bottom element.
+
+        :return: list of keys
+        """
+        self._sync()
+        used = 0
+        for plane in self._planes:
+            used |= plane
+        return [key for key, slot in self._slots.items() if not used >> slot & 1]
+
+    def bottom(self) -> 'BitVector':
+        """Map all keys to the bottom element.
+
+        :return: current mapping modified
+        """
+        self._pending = dict()
+        self._planes = [0] * len(self._planes)
+        return self
+
+    def top(self) -> 'BitVector':
+        """Map all keys to the top element.
+
+        :return: current mapping modified
+        """
+        self._pending = dict()
+        self._planes = [self._full] * len(self._planes)
+        return self
+
+    def is_top(self) -> bool:
+        """Whether all keys map to the top element.
+
+        :return: whether all keys map to the top element
+        """
+        self._sync()
+        full = self._full
+        return all(plane == full for plane in self._planes)
+
+    def less_equal(self, other: 'BitVector') -> bool:
+        """Point-wise comparison between the elements of the current and the other mapping.
+
+        :param other: other mapping (with the same keys)
+        :return: whether the code of each element is included in the code of the other element
+        """
+        self._sync()
+        planes = self._aligned(other)
+        return all(mine & ~theirs == 0 for mine, theirs in zip(self._planes, planes))
+
+    def join(self, other: 'BitVector') -> 'BitVector':
+        """Point-wise join between the elements of the current and the other mapping.
+
+        :param other: other mapping (with the same keys)
+        :return: current mapping modified to be the join
+        """
+        self._sync()
+        planes = self._aligned(other)
+        self._planes = [mine | theirs for mine, theirs in zip(self._planes, planes)]
+        return self
+
+    def meet(self, other: 'BitVector') -> 'BitVector':
+        """Point-wise meet between the elements of the current and the other mapping.
+
+        :param other: other mapping (with the same keys)
+        :return: current mapping modified to be the meet
+        """
+        self._sync()
+        planes = self._aligned(other)
+        self._planes = [mine & theirs for mine, theirs in zip(self._planes, planes)]
+        return self
+
+    def widening(self, other: 'BitVector', thresholds: Sequence = ()) -> 'BitVector':
+        """Point-wise widening between the elements of the current and the other mapping.
+
+        :param other: other mapping (with the same keys)
+        :param thresholds: thresholds (ignored, since the lattice is finite)
+        :return: current mapping modified to be the widening
+        """
+        return self.join(other)
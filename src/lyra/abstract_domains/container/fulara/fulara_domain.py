@@ -151,6 +151,12 @@ class InRelationState(State, BottomMixin):
         result = "{" + ", ".join(str_tuples) + "}"
         return result
 
+    @copy_docstring(Lattice._structure)
+    def _structure(self):
+        if self.is_bottom():
+            return None
+        return frozenset(self.tuple_set)
+
     @copy_docstring(Lattice.top)
     def top(self):
         """The top lattice element is ``{}``."""
@@ -397,6 +403,10 @@ class BoolLattice(Lattice):
     def __repr__(self):
         return repr(self.value)
 
+    @copy_docstring(Lattice._structure)
+    def _structure(self):
+        return self.value
+
     @copy_docstring(Lattice.bottom)
     def bottom(self):
         """The bottom lattice element is ``False``."""
@@ -696,6 +706,16 @@ class FularaState(State):
         _scalar = "; ".join("{} -> {}".format(variable, value) for variable, value in _items)
         return f"{_scalar}, {self.dict_store}, {self.init_store}, {self.in_relations}"
 
+    @copy_docstring(Lattice._structure)
+    def _structure(self):
+        remove = set()
+        for variable in self.dict_store.store:
+            remove.add(KeysIdentifier(variable))
+            remove.add(ValuesIdentifier(variable))
+        items = Store._items(self.scalar_state.store)
+        _scalar = frozenset(item for item in items if item[0] not in remove)
+        return _scalar, self.dict_store, self.init_store, self.in_relations
+
     @copy_docstring(Lattice.bottom)
     def bottom(self) -> 'FularaState':
         """The bottom lattice element is defined point-wise."""
@@ -1475,15 +1495,11 @@ class FularaState(State):
 
         def default_visit(self, expr: Expression, state: 'FularaState' = None,
                           evaluation=None):
-            """default: visit & replace children (adapted from expressions._iter_child_exprs)"""
-            new_expr = copy(expr)
-            for name, field in new_expr.__dict__.items():
-                if isinstance(field, Expression):
-                    new_expr.__dict__[name] = self.visit(field, state, evaluation)  # replace
-                elif isinstance(field, list):
-                    for idx, item in enumerate(field):
-                        if isinstance(item, Expression):
-                            field[idx] = self.visit(item, state, evaluation)
-            return new_expr
+            """default: visit & replace children (expressions are immutable, thus rebuilt)"""
+            def visit(child):
+                if isinstance(child, Expression):
+                    return self.visit(child, state, evaluation)
+                return child
+            return expr.rebuild(visit)
 
     read_eval = DictReadEvaluation()  # static class member shared between all instances
@@ -7,8 +7,9 @@ Generic lattice to abstract dictionaries as a set of abstract segments
 :Authors: Lowis Engel
 """
 import itertools
+from bisect import bisect_left
 from copy import deepcopy, copy
-from typing import Tuple, Set, Type, Dict, Any
+from typing import Tuple, Set, Type, Dict, Any, Optional, Iterable, List
 
 from lyra.abstract_domains.container.fulara.key_wrapper import KeyWrapper
 from lyra.abstract_domains.lattice import Lattice, BottomMixin
@@ -16,6 +17,57 @@ from lyra.core.expressions import VariableIdentifier
 from lyra.core.utils import copy_docstring
 
 
+Segment = Tuple[KeyWrapper, Lattice]
+
+
+class SegmentIndex:
+    """Disjoint segments sorted by the lower bound of their keys
+    (for key domains with ordered keys, cf. :meth:`KeyWrapper.bounds`).
+
+    The segments overlapping a key are found by bisection, without computing any meet.
+    """
+
+    def __init__(self, entries: List[Tuple[Tuple[Any, Any], Segment]]):
+        """
+        :param entries: bounds of the key and segment, for each (disjoint) segment
+        """
+        entries.sort(key=lambda entry: entry[0])
+        self._entries = entries
+        self._uppers = [bounds[1] for bounds, _ in entries]   # sorted, since segments are disjoint
+
+    @classmethod
+    def of(cls, segments: Iterable[Segment]) -> Optional['SegmentIndex']:
+        """Index of disjoint segments.
+
+        :param segments: disjoint segments
+        :return: index of the segments (None if some key is not ordered)
+        """
+        entries = list()
+        for segment in segments:
+            bounds = segment[0].bounds()
+            if bounds is None:
+                return None
+            entries.append((bounds, segment))
+        return cls(entries)
+
+    def overlapping(self, key: KeyWrapper) -> Optional[List[Segment]]:
+        """Segments whose key overlaps with a given key (i.e. their meet is not bottom).
+
+        :param key: key to look for
+        :return: overlapping segments, sorted (None if the key is not ordered)
+        """
+        bounds = key.bounds()
+        if bounds is None:
+            return None
+        lower, upper = bounds
+        result = list()
+        i = bisect_left(self._uppers, lower)    # first segment not below the key
+        while i < len(self._entries) and self._entries[i][0][0] <= upper:
+            result.append(self._entries[i][1])
+            i += 1
+        return result
+
+
 class FularaLattice(BottomMixin):
     """Fulara lattice element::
 
@@ -104,6 +156,12 @@ class FularaLattice(BottomMixin):
         result = "{" + ", ".join(str_segments) + "}"
         return result
 
+    @copy_docstring(BottomMixin._structure)
+    def _structure(self):
+        if self.is_bottom():
+            return None
+        return frozenset(self.segments)
+
     @copy_docstring(BottomMixin.top)
     def top(self) -> 'FularaLattice':
         """The top lattice element is ``{(top, top)}``."""
@@ -145,30 +203,44 @@ class FularaLattice(BottomMixin):
         else:
             # all segments of self need to be contained in some segment of other
             # & their value must be less_equal
+            index = SegmentIndex.of(other.segments)
             for (k1, v1) in self.segments:
-                for (k2, v2) in other.segments:
-                    k_meet = deepcopy(k1).meet(k2)
-                    if not k_meet.is_bottom():      # segments overlap
-                        if k1.less_equal(k2) and v1.less_equal(v2):
-                            break   # self segment can only be contained in one other segment
-                        return False  # (k1, v1) not fully contained in (k2, v2)
-                else:   # (k1, v1) does not overlap with any segment of other
+                overlapping = self._overlapping(k1, other.segments, index)
+                if not overlapping:     # (k1, v1) does not overlap with any segment of other
                     return False
+                # self segment can only be contained in one other segment
+                if not any(k1.less_equal(k2) and v1.less_equal(v2) for (k2, v2) in overlapping):
+                    return False  # (k1, v1) not fully contained in (k2, v2)
 
             return True
 
+    @staticmethod
+    def _overlapping(key: KeyWrapper, segments: Set[Segment],
+                     index: Optional[SegmentIndex] = None) -> List[Segment]:
+        """Segments whose key overlaps with a given key (i.e. their meet is not bottom),
+        found by bisection if the (disjoint) segments are indexed.
+
+        :param key: key to look for
+        :param segments: segments to search
+        :param index: index of the segments (if their keys are ordered)
+        :return: overlapping segments
+        """
+        if index is not None:
+            overlapping = index.overlapping(key)
+            if overlapping is not None:
+                return overlapping
+        return [s for s in segments if not deepcopy(key).meet(s[0]).is_bottom()]
+
     @copy_docstring(BottomMixin._meet)
     def _meet(self, other: 'FularaLattice') -> 'FularaLattice':
         """Point-wise meet of overlapping segments"""
         new_segments = set()
-        other_segments = copy(other.segments)
+        index = SegmentIndex.of(other.segments)
         for (k1, v1) in self.segments:
-            for (k2, v2) in other_segments:
-                if (k1, v1) == (k2, v2):
-                    new_segments.add((k1, v1))
-                    other_segments.remove((k2, v2))     # cannot overlap again
-                    break   # there cannot be more segments in other that overlap with (k1, v1)
-
+            if (k1, v1) in other.segments:
+                new_segments.add((k1, v1))
+                continue    # there cannot be more segments in other that overlap with (k1, v1)
+            for (k2, v2) in self._overlapping(k1, other.segments, index):
                 k_meet = deepcopy(k1).meet(deepcopy(k2))
                 if not k_meet.is_bottom():
                     v_meet = deepcopy(v1).meet(deepcopy(v2))
@@ -200,19 +272,17 @@ class FularaLattice(BottomMixin):
         # imprecise version
         segment_set = copy(self.segments)     # cond. 2
         o_add_segment = False   # other has a segment, which does not overlap with any of self
+        index = SegmentIndex.of(self.segments)
         for o in other.segments:
-            o_overlaps = False
-            for s in self.segments:
-                s_meet_o = deepcopy(s[0]).meet(o[0])
-                if not s_meet_o.is_bottom():    # segments overlap (cond. 1)
-                    o_overlaps = True
-                    # overlaps with some o (not cond. 2) -> needs to be widened
-                    segment_set.discard(s)
-                    # point-wise widening
-                    r = (deepcopy(s[0]).widening(deepcopy(o[0])),
-                         deepcopy(s[1]).widening(deepcopy(o[1])))
-                    segment_set.add(r)
-            if not o_overlaps:
+            overlapping = self._overlapping(o[0], self.segments, index)
+            for s in overlapping:   # segments overlap (cond. 1)
+                # overlaps with some o (not cond. 2) -> needs to be widened
+                segment_set.discard(s)
+                # point-wise widening
+                r = (deepcopy(s[0]).widening(deepcopy(o[0])),
+                     deepcopy(s[1]).widening(deepcopy(o[1])))
+                segment_set.add(r)
+            if not overlapping:
                 segment_set.add(o)      # cond. 3 (key will be set to top later)
                 o_add_segment = True
 
@@ -237,18 +307,17 @@ class FularaLattice(BottomMixin):
         (strong update)"""
         if not self.is_bottom():
             new_segments = copy(self.segments)
-            for s in self.segments:
-                s_meet_key = deepcopy(s[0]).meet(key)
-                if not s_meet_key.is_bottom():
-                    # segments overlap -> partition, s.t. overlapping part is removed
-                    decompostion = s[0].decomp(key)
-                    if decompostion is None:
-                        # strong update not possible -> perform weak update (without partitioning)
-                        self.normalized_add(key, value)
-                        return
-                    new_segments.remove(s)
-                    non_overlapping = {(m, s[1]) for m in decompostion if not m.is_bottom()}
-                    new_segments.update(non_overlapping)       # union
+            index = SegmentIndex.of(self.segments)
+            for s in self._overlapping(key, self.segments, index):
+                # segments overlap -> partition, s.t. overlapping part is removed
+                decompostion = s[0].decomp(key)
+                if decompostion is None:
+                    # strong update not possible -> perform weak update (without partitioning)
+                    self.normalized_add(key, value)
+                    return
+                new_segments.remove(s)
+                non_overlapping = {(m, s[1]) for m in decompostion if not m.is_bottom()}
+                new_segments.update(non_overlapping)       # union
             if not (key.is_bottom() or value.is_bottom()):
                 new_segments.add((key, value))
             self.segments.clear()
@@ -362,7 +431,29 @@ def d_norm(segment_set: Set[Tuple[KeyWrapper, Lattice]],
     """disjoint normalization function:
     Computes a partition such that no two abstract keys overlap (i.e. their meet is bottom)
     (and the keys are minimal)"""
-    # TODO: make faster? (sorted segments?)
+    entries = [(s[0].bounds(), s) for s in itertools.chain(segment_set, known_disjoint or ())]
+    if all(bounds is not None for bounds, _ in entries):
+        # ordered keys: sweep the segments sorted by the lower bound of their keys
+        entries.sort(key=lambda entry: entry[0])
+        result_set = set()
+        current, upper, joined = None, None, False
+        for (s_lower, s_upper), s in entries:
+            if current is not None and s_lower <= upper:    # not disjoint -> join segments
+                if s == current:
+                    continue
+                if not joined:      # the joined segment is a copy
+                    current, joined = (deepcopy(current[0]), deepcopy(current[1])), True
+                current[0].join(s[0])
+                current[1].join(s[1])
+                upper = max(upper, s_upper)
+            else:
+                if current is not None:
+                    result_set.add(current)
+                current, upper, joined = s, s_upper, False
+        if current is not None:
+            result_set.add(current)
+        return result_set
+
     if known_disjoint:      # not empty & not None
         result_set = copy(known_disjoint)
     else:
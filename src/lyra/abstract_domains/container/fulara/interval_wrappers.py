@@ -102,6 +102,13 @@ class IntervalKWrapper(KeyWrapper, IntervalSWrapper):
         key_interval = self.store[self.k_var]
         return (not key_interval.is_bottom()) and (key_interval.lower == key_interval.upper)
 
+    @copy_docstring(KeyWrapper.bounds)
+    def bounds(self):
+        key_interval = self.store.peek(self.k_var)
+        if key_interval.is_bottom():
+            return None
+        return key_interval.lower, key_interval.upper
+
     @copy_docstring(KeyWrapper.__lt__)
     def __lt__(self, other):
         if isinstance(other, IntervalKWrapper):
@@ -117,6 +124,10 @@ class IntervalKWrapper(KeyWrapper, IntervalSWrapper):
         # other variables do not matter, since it the state is not relational
         return repr(self.store[self.k_var])
 
+    @copy_docstring(IntervalSWrapper._structure)
+    def _structure(self):
+        return self.store.peek(self.k_var)
+
     @copy_docstring(KeyWrapper.is_bottom)
     def is_bottom(self):
         return self.store[self.k_var].is_bottom()
@@ -135,6 +146,10 @@ class IntervalVWrapper(ValueWrapper, IntervalSWrapper):
         # other variables do not matter, since it the state is not relational
         return repr(self.store[self.v_var])
 
+    @copy_docstring(IntervalSWrapper._structure)
+    def _structure(self):
+        return self.store.peek(self.v_var)
+
     @copy_docstring(ValueWrapper.is_bottom)
     def is_bottom(self):
         return self.store[self.v_var].is_bottom()
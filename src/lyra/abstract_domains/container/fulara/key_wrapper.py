@@ -1,6 +1,6 @@
 from abc import ABCMeta, abstractmethod
 
-from typing import Set, Optional
+from typing import Set, Optional, Tuple, Any
 
 # (Class) Adapter pattern
 from lyra.abstract_domains.lattice import EnvironmentMixin
@@ -55,6 +55,16 @@ class KeyWrapper(metaclass=ABCMeta):
         :return: decomposition/partition of 'state' avoiding 'exclude'
         """
 
+    def bounds(self) -> Optional[Tuple[Any, Any]]:
+        """
+        Returns the lower and upper bound of the values of k_var, if the keys are ordered
+        (e.g., for intervals) such that two abstract keys overlap (i.e. their meet is not bottom)
+        exactly when their bounds intersect. This allows indexing segments by their bounds.
+
+        :return: bounds of the keys (None if the keys are not ordered, or bottom)
+        """
+        return None
+
     @abstractmethod
     def __lt__(self, other):
         """Used to order disjoint segements for their unique representation.
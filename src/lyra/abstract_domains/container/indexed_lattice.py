@@ -293,6 +293,12 @@ class IndexedLattice(BottomMixin, SequenceMixin):
         items = sorted(self.index.items(), key=lambda x: order(x[0]))
         return ', '.join('{}@{}'.format(idx, itv) for idx, itv in items)
 
+    @copy_docstring(BottomMixin._structure)
+    def _structure(self):
+        if self.is_bottom():
+            return None
+        return frozenset(self.index.items())
+
     @copy_docstring(BottomMixin.top)
     def top(self):
         """The top lattice element is ``_ -> [-oo, +oo]``"""
@@ -10,7 +10,7 @@ Interface of a lattice. Lattice elements support lattice operations.
 from abc import ABCMeta, abstractmethod
 from enum import Enum
 from functools import reduce
-from typing import List
+from typing import Hashable, List, Sequence
 
 from lyra.core.expressions import VariableIdentifier
 from lyra.core.utils import copy_docstring
@@ -24,16 +24,33 @@ class Lattice(metaclass=ABCMeta):
 
         Subclasses are expected to provide consistent method implementations for
         ``bottom()``, ``is_bottom()``, ``top()`` and ``is_top()``.
+
+    Equality and hashing are structural and are defined in terms of ``_structure()``.
     """
 
     def __eq__(self, other: 'Lattice'):
-        return isinstance(other, self.__class__) and repr(self) == repr(other)
+        if self is other:
+            return True
+        return isinstance(other, self.__class__) and self._structure() == other._structure()
 
     def __ne__(self, other: 'Lattice'):
         return not (self == other)
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash(self._structure())
+
+    def _structure(self) -> Hashable:
+        """Hashable structural representation of the current lattice element.
+
+        Two lattice elements of the same class are equal if and only if
+        their structural representations are equal. Subclasses are expected to override
+        this method consistently with ``__repr__()``. By default, the unambiguous string
+        representation of the current lattice element is used.
+
+        :return: hashable structural representation
+
+        """
+        return repr(self)
 
     @abstractmethod
     def __repr__(self):
@@ -185,6 +202,45 @@ class Lattice(metaclass=ABCMeta):
         else:
             return self._widening(other)
 
+    def _widening_with_thresholds(self, other: 'Lattice', thresholds: Sequence):
+        """Widening between default lattice elements, bounded by thresholds.
+
+        By default, the thresholds are ignored.
+
+        :param other: other lattice element
+        :param thresholds: sorted (numerical) thresholds
+        :return: current lattice element modified to be the widening
+
+        """
+        return self._widening(other)
+
+    def widening_with_thresholds(self, other: 'Lattice', thresholds: Sequence):
+        """Widening between lattice elements, bounded by thresholds.
+
+        :param other: other lattice element
+        :param thresholds: sorted (numerical) thresholds
+        :return: current lattice element modified to be the widening
+
+        """
+        if self.is_bottom() or other.is_top():
+            return self._replace(other)
+        elif other.is_bottom() or self.is_top():
+            return self
+        else:
+            return self._widening_with_thresholds(other, thresholds)
+
+    def narrowing(self, other: 'Lattice'):
+        """Narrowing between lattice elements.
+
+        By default, the narrowing is the greatest lower bound,
+        which is enough to refine the result of a widening with a bounded number of iterations.
+
+        :param other: other lattice element
+        :return: current lattice element modified to be the narrowing
+
+        """
+        return self.meet(other)
+
     def _replace(self, other: 'Lattice') -> 'Lattice':
         """Replace this instance with another lattice element.
 
@@ -618,6 +674,14 @@ class EnvironmentMixin(Lattice, metaclass=ABCMeta):
         else:
             return self.unify(other)._widening(other.unify(self))
 
+    def widening_with_thresholds(self, other: 'EnvironmentMixin', thresholds: Sequence):
+        if self.is_bottom() or other.is_top():
+            return self._replace(other)
+        elif other.is_bottom() or self.is_top():
+            return self
+        else:
+            return self.unify(other)._widening_with_thresholds(other.unify(self), thresholds)
+
     @abstractmethod
     def add_variable(self, variable: VariableIdentifier) -> 'EnvironmentMixin':
         """Add a variable.
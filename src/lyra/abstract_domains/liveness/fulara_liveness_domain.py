@@ -124,6 +124,10 @@ class FularaLivenessState(State):
     def __repr__(self):
         return f"{self.scalar_liveness}, {self.dict_liveness}"
 
+    @copy_docstring(Lattice._structure)
+    def _structure(self):
+        return self.scalar_liveness, self.dict_liveness
+
     @copy_docstring(Lattice.bottom)
     def bottom(self) -> 'FularaLivenessState':
         """Point-wise, setting all elements to 'Dead'"""
@@ -59,6 +59,10 @@ class LivenessLattice(Lattice):
     def __repr__(self):
         return self.element.name
 
+    @copy_docstring(Lattice._structure)
+    def _structure(self):
+        return self.element
+
     @copy_docstring(Lattice.bottom)
     def bottom(self) -> 'LivenessLattice':
         """The bottom lattice element is ``Dead``."""
@@ -107,6 +111,10 @@ class LivenessState(Store, State):
 
     .. note:: Program variables storing lists are abstracted via summarization.
 
+    .. note::
+        The liveness statuses can be packed into a bit vector (cf. :class:`BitVector`),
+        which turns the lattice operations into integer bit operations.
+
     .. document private methods
     .. automethod:: LivenessState._assign
     .. automethod:: LivenessState._assume
@@ -114,14 +122,18 @@ class LivenessState(Store, State):
     .. automethod:: LivenessState._substitute
     """
 
-    def __init__(self, variables: Set[VariableIdentifier], precursory: State = None):
+    def __init__(self, variables: Set[VariableIdentifier], precursory: State = None,
+                 bitvectors: bool = False):
         """Map each program variable to its liveness status.
 
         :param variables: set of program variables
+        :param bitvectors: whether to pack the liveness statuses into bit vectors
         """
         lattices = defaultdict(lambda: LivenessLattice)
         super().__init__(variables, lattices)
         State.__init__(self, precursory)
+        if bitvectors:
+            self.bitvectors(LivenessLattice)
 
     @copy_docstring(Lattice.is_bottom)
     def is_bottom(self) -> bool:
@@ -10,15 +10,17 @@ is represented by a conjunction of (more of less complex) linear constraints.
 """
 from abc import ABCMeta
 from copy import deepcopy
-from typing import Set, Type, Union
+from typing import Set, Type, Union, Dict, FrozenSet, List
 
 from apronpy.abstract1 import PyAbstract1
-from apronpy.coeff import PyMPQIntervalCoeff
+from apronpy.coeff import PyMPQIntervalCoeff, Coeff, CoeffDiscr
 from apronpy.environment import PyEnvironment
 from apronpy.interval import PyMPQInterval
-from apronpy.lincons1 import PyLincons1Array
+from apronpy.lincons1 import PyLincons1Array, PyLincons1
+from apronpy.linexpr0 import LinexprDiscr
 from apronpy.linexpr1 import PyLinexpr1
 from apronpy.manager import PyManager
+from apronpy.scalar import Scalar, ScalarDiscr
 from apronpy.tcons1 import PyTcons1Array, PyTcons1
 from apronpy.texpr1 import PyTexpr1
 from apronpy.var import PyVar
@@ -30,6 +32,44 @@ from lyra.core.expressions import VariableIdentifier, Expression, \
 from lyra.core.utils import copy_docstring
 
 
+def _zero(scalar: Scalar) -> bool:
+    """Whether an APRON scalar is zero (checked on its C representation when possible)."""
+    if scalar.discr == ScalarDiscr.AP_SCALAR_MPQ:
+        return scalar.val.mpq_ptr.contents._mp_num._mp_size == 0
+    if scalar.discr == ScalarDiscr.AP_SCALAR_DOUBLE:
+        return scalar.val.dbl == 0
+    return str(scalar) == '0'
+
+
+def _nonzero(coeff: Coeff) -> bool:
+    """Whether an APRON coefficient is not zero."""
+    if coeff.discr == CoeffDiscr.AP_COEFF_SCALAR:
+        return not _zero(coeff.val.scalar.contents)
+    interval = coeff.val.interval.contents
+    return not (_zero(interval.inf.contents) and _zero(interval.sup.contents))
+
+
+def _involving(array: PyLincons1Array, dims: Set[int]) -> List[PyLincons1]:
+    """Constraints with a non-zero coefficient for any of the given dimensions.
+
+    :param array: array of constraints
+    :param dims: dimensions (of the environment of the constraints)
+    :return: list of the constraints involving the given dimensions
+    """
+    constraints = list()
+    lincons0_array = array.lincons1array.lincons0_array
+    for i in range(lincons0_array.size):
+        linexpr0 = lincons0_array.p[i].linexpr0.contents
+        if linexpr0.discr == LinexprDiscr.AP_LINEXPR_DENSE:
+            involved = any(_nonzero(linexpr0.p.coeff[dim]) for dim in dims if dim < linexpr0.size)
+        else:   # sparse linear expression
+            terms = (linexpr0.p.linterm[j] for j in range(linexpr0.size))
+            involved = any(term.dim.value in dims and _nonzero(term.coeff) for term in terms)
+        if involved:
+            constraints.append(array.get(i))
+    return constraints
+
+
 class Lyra2APRONWithSummarization(Lyra2APRON):
 
     @copy_docstring(Lyra2APRON.visit_LengthIdentifier)
@@ -218,63 +258,40 @@ class APRONStateWithSummarization(StateWithSummarization, metaclass=ABCMeta):
     @copy_docstring(StateWithSummarization._weak_update)
     def _weak_update(self, variables: Set[VariableIdentifier], previous: 'APRONStateWithSummarization'):
         given_names = {var.name for var in variables}
-        # find constraints involving the given variables
-        current_array: PyLincons1Array = self.state.to_lincons
-        current_unstable = list()
-        for i in range(len(current_array)):
-            lincons1 = current_array.get(i)
-            for name in given_names:
-                if str(lincons1.get_coeff(PyVar(name))) != '0':
-                    current_unstable.append(i)
-                    break
-        previous_array: PyLincons1Array = previous.state.to_lincons
-        previous_unstable = list()
-        for i in range(len(previous_array)):
-            lincons1 = previous_array.get(i)
-            for name in given_names:
-                if str(lincons1.get_coeff(PyVar(name))) != '0':
-                    previous_unstable.append(i)
-                    break
-        # join the constraints involving the given variables
-        all_names = set()
-        for i in range(len(self.environment)):
-            all_names.add(self.environment.environment.contents.var_of_dim[i].decode('utf-8'))
-        other_names = all_names - given_names
-
-        current_lincons1s = list()
-        for i in current_unstable:
-            current_lincons1s.append(current_array.get(i))
-        current_given = deepcopy(self.state).forget([PyVar(name) for name in other_names])
-        current_given_array = current_given.to_lincons
-        for i in range(len(current_given_array)):
-            current_lincons1s.append(current_given_array.get(i))
-        current_array1 = PyLincons1Array(current_lincons1s, self.environment)
-        current_abstract1 = self.domain(self.manager, self.environment, array=current_array1)
-
-        previous_lincons1s = list()
-        for i in previous_unstable:
-            previous_lincons1s.append(previous_array.get(i))
-        previous_given = deepcopy(previous.state).forget([PyVar(name) for name in other_names])
-        previous_given_array = previous_given.to_lincons
-        for i in range(len(previous_given_array)):
-            previous_lincons1s.append(previous_given_array.get(i))
-        previous_array1 = PyLincons1Array(previous_lincons1s, self.environment)
-        previous_abstract1 = self.domain(self.manager, self.environment, array=previous_array1)
-
-        joined_abstract1 = current_abstract1.join(previous_abstract1)
-        joined_array = joined_abstract1.to_lincons
-        # add the stable constraints to the result
-        lincons1s = list()
-        for i in range(len(joined_array)):
-            lincons1s.append(joined_array.get(i))
-        stable = deepcopy(self.state).forget([PyVar(name) for name in given_names])
-        stable_array = stable.to_lincons
-        for i in range(len(stable_array)):
-            lincons1s.append(stable_array.get(i))
-        abstract1 = self.domain(self.manager, self.environment, array=PyLincons1Array(lincons1s, self.environment))
-        self.state = abstract1
+        self.state = self._weaken(self.environment, self.state, previous.state, given_names)
         return self
-    
+
+    def _weaken(self, environment: PyEnvironment, current: PyAbstract1, previous: PyAbstract1,
+                given_names: Set[str]) -> PyAbstract1:
+        """Weaken a strong update of some variables within an APRON abstract value.
+
+        The constraints involving the given variables (and the constraints among the given
+        variables only) are joined, while the constraints among the other variables are kept.
+
+        :param environment: environment of the abstract values
+        :param current: abstract value after the strong update
+        :param previous: abstract value before the strong update
+        :param given_names: names of the variables involved in the weak update
+        :return: abstract value after a weak update (instead of a strong one)
+        """
+        env = environment.environment.contents
+        dims = {env.var_of_dim[i].decode('utf-8'): i for i in range(len(environment))}
+        given = {dims[name] for name in given_names if name in dims}
+        if not given:
+            return current
+        others = [PyVar(name) for name, dim in dims.items() if dim not in given]
+
+        def unstable(abstract1: PyAbstract1) -> PyAbstract1:
+            involving = _involving(abstract1.to_lincons, given)
+            projected = abstract1.forget(others) if others else abstract1
+            if involving:
+                projected = projected.meet(PyLincons1Array(involving, environment))
+            return projected
+
+        joined = unstable(current).join(unstable(previous))
+        stable = current.forget([PyVar(name) for name, dim in dims.items() if dim in given])
+        return joined.meet(stable)
+
     def _assume_any_comparison(self, condition: BinaryComparisonOperation):
         cond = self._lyra2apron.visit(condition, self.environment)
         if isinstance(cond, PyTcons1):
@@ -398,3 +415,241 @@ class APRONStateWithSummarization(StateWithSummarization, metaclass=ABCMeta):
     _negation_free = NegationFreeExpression()
     _lyra2apron = Lyra2APRONWithSummarization()
     manager: PyManager
+
+
+class APRONStateWithPacking(APRONStateWithSummarization, metaclass=ABCMeta):
+    """Analysis state based on APRON, with variable packing. An element of the abstract domain.
+
+    Program variables are partitioned into packs, and each pack is constrained by
+    a separate (and smaller) APRON abstract value. Constraints only relate variables
+    within the same pack. Packs are merged when a statement relates variables of different packs.
+    The state is bottom if any of its packs is bottom.
+
+    .. note:: Program variables storing collections are abstracted via summarization.
+
+    .. note:: The packs of the other state of a binary lattice operation might be merged
+        (without changing the represented state) to match the packs of the current state.
+    """
+
+    def __init__(self, domain: Type[PyAbstract1], variables: Set[VariableIdentifier],
+                 packs: List[Set[str]] = None, precursory: State = None):
+        """Create an APRON state with variable packing.
+
+        :param domain: APRON abstract domain of the packs
+        :param variables: program variables
+        :param packs: initial packs of variable names (e.g., computed by :class:`Packing`),
+            variables not in any pack form a pack on their own
+        :param precursory: precursory state
+        """
+        StateWithSummarization.__init__(self, precursory=precursory)
+        self.domain = domain
+        self.packs: Dict[FrozenSet[str], PyAbstract1] = dict()
+        self.environments: Dict[FrozenSet[str], PyEnvironment] = dict()
+        self._packs: Dict[str, FrozenSet[str]] = dict()    # pack of each variable name
+        for pack in (packs or list()):
+            self._add(frozenset(pack))
+        for variable in variables:
+            if variable.name not in self._packs:
+                self._add(frozenset({variable.name}))
+        if not self.packs:  # needed to represent bottom
+            self._add(frozenset())
+
+    def _add(self, pack: FrozenSet[str], state: PyAbstract1 = None):
+        """Add a pack of variables (unconstrained by default)."""
+        environment = PyEnvironment([], [PyVar(name) for name in sorted(pack)])
+        self.environments[pack] = environment
+        self.packs[pack] = self.domain(self.manager, environment) if state is None else state
+        for name in pack:
+            self._packs[name] = pack
+
+    def _merge(self, names: Set[str]) -> FrozenSet[str]:
+        """Merge the packs of some variables.
+
+        :param names: names of the variables
+        :return: merged pack containing all the variables
+        """
+        for name in names:
+            if name not in self._packs:
+                self._add(frozenset({name}))
+        packs = {self._packs[name] for name in names}
+        if not packs:   # any pack will do
+            return next(iter(self.packs))
+        if len(packs) == 1:
+            return packs.pop()
+        merged = frozenset().union(*packs)
+        environment = PyEnvironment([], [PyVar(name) for name in sorted(merged)])
+        state = self.domain(self.manager, environment)
+        for pack in packs:
+            lifted = deepcopy(self.packs.pop(pack))
+            lifted.environment = environment    # the added variables are unconstrained
+            state = state.meet(lifted)
+            del self.environments[pack]
+        self._add(merged, state)
+        return merged
+
+    def _unify(self, other: 'APRONStateWithPacking'):
+        """Merge the packs of the current and the other state until they coincide."""
+        for pack in list(other.packs):
+            self._merge(set(pack))
+        for pack in list(self.packs):
+            other._merge(set(pack))
+
+    def _names(self, expression: Expression) -> Set[str]:
+        return {identifier.name for identifier in expression.ids()}
+
+    @property
+    def environment(self) -> PyEnvironment:
+        """Environment of all variables (of all packs)."""
+        names = sorted(self._packs)
+        return PyEnvironment([], [PyVar(name) for name in names])
+
+    @property
+    def state(self) -> PyAbstract1:
+        """APRON abstract value of all variables (combining all packs)."""
+        environment = self.environment
+        state = self.domain(self.manager, environment)
+        for pack in self.packs.values():
+            lifted = deepcopy(pack)
+            lifted.environment = environment
+            state = state.meet(lifted)
+        return state
+
+    @copy_docstring(State.bottom)
+    def bottom(self):
+        for pack, environment in self.environments.items():
+            self.packs[pack] = self.domain.bottom(self.manager, environment)
+        return self
+
+    @copy_docstring(State.top)
+    def top(self):
+        for pack, environment in self.environments.items():
+            self.packs[pack] = self.domain.top(self.manager, environment)
+        return self
+
+    def __repr__(self):
+        if self.is_bottom():
+            return "⊥"
+        packs = sorted(self.packs.items(), key=lambda item: min(item[0], default=''))
+        return ' ∧ '.join('{}'.format(state) for _, state in packs if not state.is_top())
+
+    @copy_docstring(State.is_bottom)
+    def is_bottom(self) -> bool:
+        return any(state.is_bottom() for state in self.packs.values())
+
+    @copy_docstring(State.is_top)
+    def is_top(self) -> bool:
+        return all(state.is_top() for state in self.packs.values())
+
+    def bound_variable(self, variable: PyVar):
+        return self.packs[self._merge({variable.var})].bound_variable(variable)
+
+    @copy_docstring(State._replace)
+    def _replace(self, other: 'APRONStateWithPacking') -> 'APRONStateWithPacking':
+        super()._replace(other)
+        self.packs = dict(other.packs)  # the packs are modified in place
+        self.environments = dict(other.environments)
+        self._packs = dict(other._packs)
+        return self
+
+    @copy_docstring(State._less_equal)
+    def _less_equal(self, other: 'APRONStateWithPacking') -> bool:
+        if self.is_bottom():
+            return True
+        if other.is_bottom():
+            return False
+        self._unify(other)
+        return all(state <= other.packs[pack] for pack, state in self.packs.items())
+
+    @copy_docstring(State._join)
+    def _join(self, other: 'APRONStateWithPacking') -> 'APRONStateWithPacking':
+        if other.is_bottom():
+            return self
+        if self.is_bottom():
+            return self._replace(other)
+        self._unify(other)
+        for pack, state in self.packs.items():
+            self.packs[pack] = state.join(other.packs[pack])
+        return self
+
+    @copy_docstring(State._meet)
+    def _meet(self, other: 'APRONStateWithPacking') -> 'APRONStateWithPacking':
+        self._unify(other)
+        for pack, state in self.packs.items():
+            self.packs[pack] = state.meet(other.packs[pack])
+        return self
+
+    @copy_docstring(State._widening)
+    def _widening(self, other: 'APRONStateWithPacking') -> 'APRONStateWithPacking':
+        if other.is_bottom():
+            return self
+        if self.is_bottom():
+            return self._replace(other)
+        self._unify(other)
+        for pack, state in self.packs.items():
+            self.packs[pack] = state.widening(other.packs[pack])
+        return self
+
+    @copy_docstring(State._assign_variable)
+    def _assign_variable(self, left: VariableIdentifier,
+                         right: Expression) -> 'APRONStateWithPacking':
+        pack = self._merge({left.name} | self._names(right))
+        current, environment = self.packs[pack], self.environments[pack]
+        expr = self._lyra2apron.visit(right, environment)
+        if isinstance(expr, PyTexpr1):
+            self.packs[pack] = current.assign(PyVar(left.name), expr)
+        else:
+            assert isinstance(expr, Set)
+            state = deepcopy(current).bottom(self.manager, environment)
+            for item in expr:
+                state = state.join(deepcopy(current).assign(PyVar(left.name), item))
+            self.packs[pack] = state
+        return self
+
+    @copy_docstring(StateWithSummarization._weak_update)
+    def _weak_update(self, variables: Set[VariableIdentifier], previous: 'APRONStateWithPacking'):
+        given_names = {var.name for var in variables}
+        self._unify(previous)
+        for pack, state in self.packs.items():
+            if given_names & pack:
+                environment = self.environments[pack]
+                given = given_names & pack
+                self.packs[pack] = self._weaken(environment, state, previous.packs[pack], given)
+        return self
+
+    def _assume_any_comparison(self, condition: BinaryComparisonOperation):
+        pack = self._merge(self._names(condition))
+        current, environment = self.packs[pack], self.environments[pack]
+        cond = self._lyra2apron.visit(condition, environment)
+        if isinstance(cond, PyTcons1):
+            array = PyTcons1Array([cond])
+            self.packs[pack] = current.meet(array)
+        else:
+            assert isinstance(cond, Set)
+            state = deepcopy(current).bottom(self.manager, environment)
+            for item in cond:
+                array = PyTcons1Array([item])
+                state = state.join(deepcopy(current).meet(array))
+            self.packs[pack] = state
+        return self
+
+    @copy_docstring(State.forget_variable)
+    def forget_variable(self, variable: VariableIdentifier) -> 'APRONStateWithPacking':
+        pack = self._merge({variable.name})
+        self.packs[pack] = self.packs[pack].forget([PyVar(variable.name)])
+        return self
+
+    @copy_docstring(State._substitute_variable)
+    def _substitute_variable(self, left: VariableIdentifier,
+                             right: Expression) -> 'APRONStateWithPacking':
+        pack = self._merge({left.name} | self._names(right))
+        current, environment = self.packs[pack], self.environments[pack]
+        expr = self._lyra2apron.visit(right, environment)
+        if isinstance(expr, PyTexpr1):
+            self.packs[pack] = current.substitute(PyVar(left.name), expr)
+        else:
+            assert isinstance(expr, Set)
+            state = deepcopy(current).bottom(self.manager, environment)
+            for item in expr:
+                state = state.join(deepcopy(current).substitute(PyVar(left.name), item))
+            self.packs[pack] = state
+        return self
@@ -0,0 +1,270 @@
+"""
+Interval Arrays
+===============
+
+Array-backed mapping from variables to intervals, to be used as the mappings of a store.
+
+The lower and upper bounds of all intervals are stored in two NumPy arrays of floats,
+indexed by a map from each variable to its slot, so that the point-wise lattice operations
+between stores become whole-array operations.
+
+:Author: Caterina Urban
+"""
+from collections.abc import MutableMapping
+from math import inf, isinf
+from typing import Dict, Sequence
+
+from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class IntervalArray(MutableMapping):
+    """Mapping from keys to intervals, storing their bounds in arrays.
+
+    The empty interval is stored as ``[+oo, -oo]``, which is neutral for joins.
+    A flag marks the intervals with (finite) float bounds,
+    bounds of the other intervals are retrieved as integers.
+
+    Intervals retrieved by subscription (or set) are written back into the arrays
+    before the next copy or lattice operation, since the caller might modify them.
+    Intervals that are only read can be retrieved via ``peek()``.
+
+    .. warning::
+        Values retrieved for writing must not be modified after hashing or copying the mapping,
+        or after performing a lattice operation on it.
+
+    .. note:: Integer bounds are exact up to ``2**53``.
+    """
+
+    def __init__(self, data: Dict = None):
+        if numpy is None:
+            raise ImportError("Array-backed interval mappings require NumPy!")
+        data = dict() if data is None else data
+        peek = getattr(data, 'peek', data.__getitem__)
+        self._slots: Dict = {key: slot for slot, key in enumerate(data)}
+        self._lower = numpy.full(len(self._slots), inf)
+        self._upper = numpy.full(len(self._slots), -inf)
+        self._float = numpy.zeros(len(self._slots), dtype=bool)
+        self._pending: Dict = dict()    # values retrieved for writing, not yet written back
+        for key, slot in self._slots.items():
+            self._write(slot, peek(key))
+
+    def _write(self, slot: int, value: IntervalLattice):
+        if value.is_bottom():
+            self._lower[slot], self._upper[slot], self._float[slot] = inf, -inf, False
+        else:
+            lower, upper = value.lower, value.upper
+            self._lower[slot], self._upper[slot] = lower, upper
+            floats = (isinstance(lower, float) and not isinf(lower),
+                      isinstance(upper, float) and not isinf(upper))
+            self._float[slot] = any(floats)
+
+    def _read(self, slot: int) -> IntervalLattice:
+        lower, upper = float(self._lower[slot]), float(self._upper[slot])
+        if upper < lower:
+            return IntervalLattice().bottom()
+        if not self._float[slot]:
+            lower = lower if isinf(lower) else int(lower)
+            upper = upper if isinf(upper) else int(upper)
+        return IntervalLattice(lower, upper)
+
+    def _sync(self):
+        """Write back the values retrieved for writing."""
+        for key, value in self._pending.items():
+            self._write(self._slots[key], value)
+        self._pending = dict()
+
+    def __getitem__(self, key):
+        value = self._pending.get(key)
+        if value is None:
+            value = self._pending[key] = self._read(self._slots[key])
+        return value
+
+    def __setitem__(self, key, value):
+        if key not in self._slots:
+            self._slots = dict(self._slots)     # the slots might be shared with copies
+            self._slots[key] = len(self._slots)
+            self._lower = numpy.append(self._lower, inf)
+            self._upper = numpy.append(self._upper, -inf)
+            self._float = numpy.append(self._float, False)
+        self._pending[key] = value
+
+    def __delitem__(self, key):
+        slot = self._slots[key]
+        self._pending.pop(key, None)
+        self._slots = {other: index if index < slot else index - 1
+                       for other, index in self._slots.items() if other != key}
+        self._lower = numpy.delete(self._lower, slot)
+        self._upper = numpy.delete(self._upper, slot)
+        self._float = numpy.delete(self._float, slot)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __iter__(self):
+        return iter(self._slots)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __repr__(self):
+        return repr({key: self.peek(key) for key in self._slots})
+
+    def __eq__(self, other):
+        if isinstance(other, IntervalArray):
+            mine = {key: self.peek(key) for key in self._slots}
+            return mine == {key: other.peek(key) for key in other._slots}
+        return super().__eq__(other)
+
+    def __hash__(self):
+        return hash(frozenset((key, self.peek(key)) for key in self._slots))
+
+    def peek(self, key) -> IntervalLattice:
+        """Retrieve a value only to read it.
+
+        .. warning::
+            The retrieved value must not be modified.
+
+        :param key: key of the value to retrieve
+        :return: value
+        """
+        value = self._pending.get(key)
+        if value is None:
+            return self._read(self._slots[key])
+        return value
+
+    def copy(self) -> 'IntervalArray':
+        """Copy the mapping, sharing its slots with the copy.
+
+        :return: copy of the mapping
+        """
+        self._sync()
+        fork = IntervalArray.__new__(IntervalArray)
+        fork._slots = self._slots
+        fork._lower, fork._upper = self._lower.copy(), self._upper.copy()
+        fork._float = self._float.copy()
+        fork._pending = dict()
+        return fork
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __getstate__(self):
+        self._sync()
+        return dict(self.__dict__)
+
+    def _aligned(self, other: 'IntervalArray'):
+        """Bounds and flags of the other mapping, ordered by the slots of the current mapping."""
+        other._sync()
+        if other._slots is self._slots or other._slots == self._slots:
+            return other._lower, other._upper, other._float
+        slots = (other._slots[key] for key in self._slots)
+        index = numpy.fromiter(slots, dtype=int, count=len(self))
+        return other._lower[index], other._upper[index], other._float[index]
+
+    def bottoms(self) -> list:
+        """Keys mapped to the empty interval.
+
+        :return: list of keys
+        """
+        self._sync()
+        keys = list(self._slots)
+        return [keys[slot] for slot in numpy.flatnonzero(self._upper < self._lower)]
+
+    def bottom(self) -> 'IntervalArray':
+        """Map all keys to the empty interval.
+
+        :return: current mapping modified
+        """
+        self._pending = dict()
+        self._lower[:], self._upper[:], self._float[:] = inf, -inf, False
+        return self
+
+    def top(self, lower=-inf) -> 'IntervalArray':
+        """Map all keys to the unbounded interval (or to the interval with the given lower bound).
+
+        :param lower: lower bound of the interval
+        :return: current mapping modified
+        """
+        self._pending = dict()
+        self._lower[:], self._upper[:], self._float[:] = lower, inf, False
+        return self
+
+    def is_top(self, lower=-inf) -> bool:
+        """Whether all keys map to a superset of the unbounded interval
+        (or of the interval with the given lower bound).
+
+        :param lower: lower bound of the interval
+        :return: whether all keys map to a superset of the interval
+        """
+        self._sync()
+        return bool(numpy.all((self._lower <= lower) & (self._upper == inf)))
+
+    def less_equal(self, other: 'IntervalArray') -> bool:
+        """Point-wise inclusion between the intervals of the current and the other mapping.
+
+        :param other: other mapping (with the same keys)
+        :return: whether each interval is included in the corresponding interval
+        """
+        self._sync()
+        lower, upper, _ = self._aligned(other)
+        return bool(numpy.all((lower <= self._lower) & (self._upper <= upper)))
+
+    def join(self, other: 'IntervalArray') -> 'IntervalArray':
+        """Point-wise join between the intervals of the current and the other mapping.
+
+        :param other: other mapping (with the same keys)
+        :return: current mapping modified to be the join
+        """
+        self._sync()
+        lower, upper, floats = self._aligned(other)
+        numpy.minimum(self._lower, lower, out=self._lower)
+        numpy.maximum(self._upper, upper, out=self._upper)
+        numpy.logical_or(self._float, floats, out=self._float)
+        return self
+
+    def meet(self, other: 'IntervalArray') -> 'IntervalArray':
+        """Point-wise meet between the intervals of the current and the other mapping.
+
+        :param other: other mapping (with the same keys)
+        :return: current mapping modified to be the meet
+        """
+        self._sync()
+        lower, upper, floats = self._aligned(other)
+        numpy.maximum(self._lower, lower, out=self._lower)
+        numpy.minimum(self._upper, upper, out=self._upper)
+        numpy.logical_or(self._float, floats, out=self._float)
+        empty = self._upper < self._lower
+        self._lower[empty], self._upper[empty], self._float[empty] = inf, -inf, False
+        return self
+
+    def widening(self, other: 'IntervalArray', thresholds: Sequence = ()) -> 'IntervalArray':
+        """Point-wise widening between the intervals of the current and the other mapping.
+
+        Unstable bounds are widened to the closest threshold (if any), rather than to infinity.
+
+        :param other: other mapping (with the same keys)
+        :param thresholds: sorted thresholds
+        :return: current mapping modified to be the widening
+        """
+        self._sync()
+        lower, upper, floats = self._aligned(other)
+        empty = self._upper < self._lower
+        below, above = lower < self._lower, self._upper < upper
+        # pad the thresholds with infinities, to select them when no threshold is suitable
+        bounds = numpy.concatenate(([-inf], numpy.asarray(thresholds, dtype=float), [inf]))
+        lowers = bounds[numpy.searchsorted(bounds, lower[below], side='right') - 1]
+        uppers = bounds[numpy.searchsorted(bounds, upper[above], side='left')]
+        self._lower[below], self._upper[above] = lowers, uppers
+        for mask, values in ((below, lowers), (above, uppers)):    # thresholds with fractions
+            self._float[mask] |= numpy.isfinite(values) & (values != numpy.floor(values))
+        self._lower[empty], self._upper[empty] = lower[empty], upper[empty]
+        self._float[empty] = floats[empty]
+        return self
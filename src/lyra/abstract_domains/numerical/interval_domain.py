@@ -158,6 +158,10 @@ class IntervalStateWithSummarization(IntervalStateMixin, BasisWithSummarization)
 
     .. note:: Program variables storing sequences and containers are abstracted via summarization.
 
+    .. note::
+        The intervals can be stored in NumPy arrays (cf. :class:`IntervalArray`),
+        which speeds up lattice operations on states with many variables.
+
     .. document private methods
     .. automethod:: IntervalState._assign
     .. automethod:: IntervalState._assume
@@ -166,13 +170,17 @@ class IntervalStateWithSummarization(IntervalStateMixin, BasisWithSummarization)
 
     """
 
-    def __init__(self, variables: Set[VariableIdentifier], precursory: State = None):
+    def __init__(self, variables: Set[VariableIdentifier], precursory: State = None,
+                 arrays: bool = False):
         """Map each program variable to the interval representing its value.
 
         :param variables: set of program variables
+        :param arrays: whether to store the intervals in arrays
         """
         lattices = defaultdict(lambda: IntervalLattice)
         super().__init__(variables, lattices, precursory=precursory)
+        if arrays:
+            self.arrays()
 
     @copy_docstring(BasisWithSummarization._assume_subscription)
     def _assume_subscription(self, condition: Subscription, neg: bool = False):
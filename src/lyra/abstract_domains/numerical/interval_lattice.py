@@ -5,8 +5,9 @@ Interval Lattice
 :Authors: Caterina Urban and Simon Wehrli
 """
 
+from bisect import bisect_left, bisect_right
 from math import inf
-from typing import List
+from typing import List, Sequence
 
 from lyra.abstract_domains.lattice import BottomMixin, ArithmeticMixin, BooleanMixin, SequenceMixin
 from lyra.core.expressions import Literal
@@ -26,6 +27,7 @@ class IntervalLattice(BottomMixin, ArithmeticMixin, BooleanMixin, SequenceMixin)
     .. automethod:: IntervalLattice._meet
     .. automethod:: IntervalLattice._join
     .. automethod:: IntervalLattice._widening
+    .. automethod:: IntervalLattice._widening_with_thresholds
     .. automethod:: IntervalLattice._neg
     .. automethod:: IntervalLattice._add
     .. automethod:: IntervalLattice._sub
@@ -108,6 +110,12 @@ class IntervalLattice(BottomMixin, ArithmeticMixin, BooleanMixin, SequenceMixin)
             return "⊥"
         return f"[{self.lower}, {self.upper}]"
 
+    @copy_docstring(BottomMixin._structure)
+    def _structure(self):
+        if self.is_bottom():
+            return None
+        return self.lower, self.upper
+
     @copy_docstring(BottomMixin.top)
     def top(self) -> 'IntervalLattice':
         """The top lattice element is ``[-oo,+oo]``."""
@@ -150,6 +158,19 @@ class IntervalLattice(BottomMixin, ArithmeticMixin, BooleanMixin, SequenceMixin)
             upper = inf
         return self._replace(type(self)(lower, upper))
 
+    @copy_docstring(BottomMixin._widening_with_thresholds)
+    def _widening_with_thresholds(self, other: 'IntervalLattice', thresholds: Sequence):
+        """Unstable bounds are widened to the closest threshold instead of ``-oo`` or ``+oo``."""
+        lower = self.lower
+        upper = self.upper
+        if other.lower < self.lower:
+            index = bisect_right(thresholds, other.lower)
+            lower = thresholds[index - 1] if index > 0 else -inf
+        if self.upper < other.upper:
+            index = bisect_left(thresholds, other.upper)
+            upper = thresholds[index] if index < len(thresholds) else inf
+        return self._replace(type(self)(lower, upper))
+
     # arithmetic operations
 
     @copy_docstring(ArithmeticMixin._neg)
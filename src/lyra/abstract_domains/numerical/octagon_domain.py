@@ -8,12 +8,13 @@ is represented by a conjunction of linear constraints.
 
 :Authors: Caterina Urban
 """
-from typing import Set
+from typing import Set, List
 
 from apronpy.manager import PyManager, PyOctMPQManager
 from apronpy.oct import PyOct
 
-from lyra.abstract_domains.numerical.apron_domain import APRONStateWithSummarization
+from lyra.abstract_domains.numerical.apron_domain import APRONStateWithSummarization, \
+    APRONStateWithPacking
 from lyra.abstract_domains.state import State
 from lyra.core.expressions import VariableIdentifier
 
@@ -33,3 +34,22 @@ class OctagonStateWithSummarization(APRONStateWithSummarization):
         super().__init__(PyOct, variables, precursory=precursory)
 
     manager: PyManager = PyOctMPQManager()
+
+
+class OctagonStateWithPacking(APRONStateWithPacking):
+    """Octagon analysis state based on APRON, with variable packing.
+    An element of the octagon abstract domain.
+
+    .. document private methods
+    .. automethod:: OctagonStateWithPacking._assign
+    .. automethod:: OctagonStateWithPacking._assume
+    .. automethod:: OctagonStateWithPacking._output
+    .. automethod:: OctagonStateWithPacking._substitute
+
+    """
+
+    def __init__(self, variables: Set[VariableIdentifier], packs: List[Set[str]] = None,
+                 precursory: State = None):
+        super().__init__(PyOct, variables, packs=packs, precursory=precursory)
+
+    manager: PyManager = OctagonStateWithSummarization.manager
@@ -8,11 +8,12 @@ is represented by a conjunction of linear constraints.
 
 :Authors: Caterina Urban
 """
-from typing import Set
+from typing import Set, List
 
 from apronpy.polka import PyPolkaMPQstrictManager, PyPolka
 
-from lyra.abstract_domains.numerical.apron_domain import APRONStateWithSummarization
+from lyra.abstract_domains.numerical.apron_domain import APRONStateWithSummarization, \
+    APRONStateWithPacking
 from lyra.abstract_domains.state import State
 from lyra.core.expressions import VariableIdentifier
 
@@ -32,3 +33,22 @@ class PolyhedraStateWithSummarization(APRONStateWithSummarization):
         super().__init__(PyPolka, variables, precursory=precursory)
 
     manager = PyPolkaMPQstrictManager()
+
+
+class PolyhedraStateWithPacking(APRONStateWithPacking):
+    """Polyhedra analysis state based on APRON, with variable packing.
+    An element of the polyhedra abstract domain.
+
+    .. document private methods
+    .. automethod:: PolyhedraStateWithPacking._assign
+    .. automethod:: PolyhedraStateWithPacking._assume
+    .. automethod:: PolyhedraStateWithPacking._output
+    .. automethod:: PolyhedraStateWithPacking._substitute
+
+    """
+
+    def __init__(self, variables: Set[VariableIdentifier], packs: List[Set[str]] = None,
+                 precursory: State = None):
+        super().__init__(PyPolka, variables, packs=packs, precursory=precursory)
+
+    manager = PolyhedraStateWithSummarization.manager
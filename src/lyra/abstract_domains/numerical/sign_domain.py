@@ -161,6 +161,10 @@ class SignLattice(ArithmeticMixin, BooleanMixin, SequenceMixin):
         else:  # self.is_bottom()
             return "⊥"
 
+    @copy_docstring(ArithmeticMixin._structure)
+    def _structure(self):
+        return self.negative, self.zero, self.positive
+
     @copy_docstring(ArithmeticMixin.bottom)
     def bottom(self) -> 'SignLattice':
         return self._replace(type(self)(False, False, False))
@@ -47,6 +47,10 @@ class Stack(BoundedLattice, metaclass=ABCMeta):
     def __repr__(self):
         return " | ".join(map(repr, reversed(self.stack)))
 
+    @copy_docstring(BoundedLattice._structure)
+    def _structure(self):
+        return tuple(self.stack)
+
     @abstractmethod
     def push(self):
         """Push an element on the current stack."""
@@ -12,7 +12,7 @@ Abstract domain elements support lattice operations and program statements.
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from copy import deepcopy
-from typing import Set, Optional, List, Type, Dict, Any, Union
+from typing import Set, Optional, List, Type, Dict, Any, Union, Sequence
 
 from lyra.abstract_domains.lattice import Lattice
 from lyra.core.expressions import Expression, VariableIdentifier, Subscription, Slicing, \
@@ -616,6 +616,12 @@ class ProductState(State):
             return "⊥"
         return "\n".join(str(state) for state in self.states)
 
+    @copy_docstring(State._structure)
+    def _structure(self):
+        if self.is_bottom():
+            return None
+        return tuple(self.states)
+
     @copy_docstring(State.bottom)
     def bottom(self) -> 'ProductState':
         for i, state in enumerate(self.states):
@@ -658,6 +664,12 @@ class ProductState(State):
             self.states[i] = state.widening(other.states[i])
         return self
 
+    @copy_docstring(State._widening_with_thresholds)
+    def _widening_with_thresholds(self, other: 'ProductState', thresholds: Sequence):
+        for i, state in enumerate(self.states):
+            self.states[i] = state.widening_with_thresholds(other.states[i], thresholds)
+        return self
+
     @copy_docstring(State._assign_variable)
     def _assign_variable(self, left: VariableIdentifier, right: Expression) -> 'ProductState':
         for i, state in enumerate(self.states):
@@ -8,8 +8,12 @@ Lifting of a lattice to a set of program variables.
 """
 import itertools
 from collections import defaultdict
-from typing import Dict, Any, Type, Set
+from collections.abc import MutableMapping
+from copy import copy, deepcopy
+from typing import Dict, Any, Type, Set, Optional, Sequence
 
+from lyra.abstract_domains.bitvector import BitVector
+from lyra.abstract_domains.numerical.interval_array import IntervalArray
 from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
 from lyra.core.expressions import VariableIdentifier, LengthIdentifier, KeysIdentifier, \
     ValuesIdentifier
@@ -19,6 +23,146 @@ from lyra.core.types import LyraType, SequenceLyraType, ContainerLyraType, DictL
 from lyra.core.utils import copy_docstring
 
 
+_versions = itertools.count()     # versions of the values of copy-on-write dictionaries
+_packed = (IntervalArray, BitVector)    # mappings performing lattice operations on all values
+
+
+class CopyOnWriteDict(MutableMapping):
+    """Dictionary sharing its values with its copies until they are accessed for writing.
+
+    Copying the dictionary (with ``copy()`` or ``deepcopy()``) only copies the mapping itself.
+    A shared value is (deep) copied the first time it is retrieved by subscription
+    or through any other method returning values (e.g., ``get()``, ``items()``, ``values()``),
+    since the caller might modify it. Values that are only read can be retrieved without
+    copying them via ``peek()``.
+
+    Values shared with several keys remain shared among the same keys once copied.
+
+    The dictionary is hashable. Its hash is cached until the dictionary is modified
+    or one of its values is retrieved for writing.
+
+    Each value that is shared with a copy has a version, which is unique among all dictionaries
+    and changes whenever the value is (potentially) modified. Values retrieved for writing
+    (or set) since the last copy have no version, since they might still be modified.
+
+    .. warning::
+        Values retrieved for writing must not be modified after hashing or copying the dictionary.
+    """
+
+    def __init__(self, data: Dict = None):
+        self._data = dict() if data is None else dict(data)
+        self._owned = set(self._data)   # keys whose values are not shared with any copy
+        self._hash = None               # cached hash, reset on every (potential) modification
+        self._versions = dict()         # versions of the values (of keys not owned)
+        self._memo = None               # copies of the shared values retrieved for writing
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        self._hash = None
+        if key not in self._owned:
+            if self._memo is None:
+                self._memo = dict()
+            value = self._data[key] = deepcopy(value, self._memo)
+            self._owned.add(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._owned.add(key)
+        self._hash = None
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self._owned.discard(key)
+        self._versions.pop(key, None)
+        self._hash = None
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, CopyOnWriteDict):
+            return self._data == other._data
+        return super().__eq__(other)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def peek(self, key):
+        """Retrieve a value only to read it, without copying it if it is shared.
+
+        .. warning::
+            The retrieved value must not be modified.
+
+        :param key: key of the value to retrieve
+        :return: value (possibly shared with copies of the dictionary)
+        """
+        return self._data[key]
+
+    def version(self, key) -> Optional[int]:
+        """Version of a value, which changes whenever the value is (potentially) modified.
+
+        :param key: key of the value
+        :return: version of the value, or ``None`` if the value has been retrieved for writing
+            (or set) since the last copy of the dictionary
+        """
+        if key in self._owned:
+            return None
+        return self._versions.get(key)
+
+    def copy(self) -> 'CopyOnWriteDict':
+        """Copy the dictionary, sharing all its values with the copy.
+
+        :return: copy of the dictionary
+        """
+        for key in self._owned:     # the values are not modified anymore
+            self._versions[key] = next(_versions)
+        fork = CopyOnWriteDict.__new__(CopyOnWriteDict)
+        fork._data = dict(self._data)
+        fork._owned = set()
+        fork._hash = self._hash
+        fork._versions = dict(self._versions)
+        fork._memo = None
+        self._owned = set()
+        self._memo = None
+        return fork
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __getstate__(self):
+        """State of the dictionary for pickling, without versions (unique per process)."""
+        state = dict(self.__dict__)
+        state['_owned'] = set(self._data)
+        state['_versions'] = dict()
+        state['_memo'] = None
+        return state
+
+
+class _Default:
+    """Default factory returning (a copy of) a fixed value, which (unlike lambdas) pickles."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def __call__(self):
+        return copy(self._value)
+
+
 class Store(EnvironmentMixin):
     """Mutable element of a store ``Var -> L``,
     lifting a lattice ``L`` to a set of program variables ``Var``.
@@ -26,10 +170,18 @@ class Store(EnvironmentMixin):
     .. warning::
         Lattice operations modify the current store.
 
+    .. note::
+        The mappings of a store are copy-on-write: copies of a store share the lattice
+        elements of the variables that have not (yet) been retrieved for modification.
+        Stores of intervals can instead use array-backed mappings (cf. :meth:`Store.arrays`),
+        and stores of small finite lattices can use bit vectors (cf. :class:`BitVector`).
+        The lattice operations on these mappings are performed on all their values at once.
+
     .. document private methods
     .. automethod:: Store._less_equal
     .. automethod:: Store._meet
     .. automethod:: Store._join
+    .. automethod:: Store._widening_with_thresholds
     """
 
     def __init__(self, variables: Set[VariableIdentifier],
@@ -46,8 +198,9 @@ class Store(EnvironmentMixin):
         self._lattices = lattices
         self._arguments = defaultdict(lambda: dict()) if arguments is None else arguments
         try:
-            self._store = {v: lattices[v.typ](**self._arguments[v.typ]) for v in variables}
-            self._lengths, self._keys, self._values = dict(), dict(), dict()
+            _store = {v: lattices[v.typ](**self._arguments[v.typ]) for v in variables}
+            self._store = CopyOnWriteDict(_store)
+            self._lengths, self._keys, self._values = [CopyOnWriteDict() for _ in range(3)]
             for v in variables:
                 if v.has_length:
                     self._lengths[v.length] = IntervalLattice(lower=0)
@@ -60,6 +213,36 @@ class Store(EnvironmentMixin):
             error = f"Missing lattice for variable type {repr(key.args[0])}!"
             raise ValueError(error)
 
+    def __deepcopy__(self, memo):
+        """Copy the store, sharing its lattice elements with the copy until they are modified.
+
+        The lattice and argument dictionaries are shared as well, since they are never modified.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        for name, value in self.__dict__.items():
+            if name in ('_lattices', '_arguments'):
+                result.__dict__[name] = value
+            elif name == '_variables':
+                result.__dict__[name] = set(value)
+            else:
+                result.__dict__[name] = deepcopy(value, memo)
+        return result
+
+    def __getstate__(self):
+        """State of the store for pickling.
+
+        The default factories of the lattice and argument dictionaries are usually lambdas,
+        which cannot be pickled. They are replaced by factories returning the same defaults.
+        """
+        state = dict(self.__dict__)
+        for name in ('_lattices', '_arguments'):
+            mapping = state[name]
+            if isinstance(mapping, defaultdict) and mapping.default_factory is not None:
+                state[name] = defaultdict(_Default(mapping.default_factory()), mapping)
+        return state
+
     @property
     def variables(self):
         """Variables of the current store."""
@@ -95,51 +278,118 @@ class Store(EnvironmentMixin):
         """Current mapping from variable values to their corresponding lattice element."""
         return self._values
 
+    def arrays(self) -> 'Store':
+        """Switch the mappings of the current store to array-backed mappings of intervals.
+
+        .. note:: All lattice elements of the store are expected to be intervals.
+
+        :return: current store modified to use array-backed mappings
+        """
+        self._store = IntervalArray(self._store)
+        self._lengths = IntervalArray(self._lengths)
+        self._keys = IntervalArray(self._keys)
+        self._values = IntervalArray(self._values)
+        return self
+
+    def bitvectors(self, lattice: Type[Lattice], mapping: Type[BitVector] = BitVector) -> 'Store':
+        """Switch the mappings of the variables, keys, and values of the store to bit vectors.
+
+        .. note:: All their lattice elements are expected to belong to the given (finite) lattice.
+
+        :param lattice: lattice of the lattice elements of the store
+        :param mapping: type of the bit vectors to use
+        :return: current store modified to use bit vectors
+        """
+        self._store = mapping(lattice, self._store)
+        self._keys = mapping(lattice, self._keys)
+        self._values = mapping(lattice, self._values)
+        return self
+
+    @staticmethod
+    def _items(mapping):
+        """Items of a mapping of the store, retrieved only to be read."""
+        if isinstance(mapping, (CopyOnWriteDict,) + _packed):
+            return ((key, mapping.peek(key)) for key in mapping)
+        return mapping.items()
+
+    @staticmethod
+    def _peek(mapping, key):
+        """Value of a mapping of the store, retrieved only to be read."""
+        if isinstance(mapping, (CopyOnWriteDict,) + _packed):
+            return mapping.peek(key)
+        return mapping[key]
+
+    @staticmethod
+    def _frozen(mapping):
+        """Hashable version of a mapping of the store."""
+        if isinstance(mapping, (CopyOnWriteDict,) + _packed):
+            return mapping
+        return frozenset(mapping.items())
+
+    @copy_docstring(Lattice._structure)
+    def _structure(self):
+        mappings = (self.store, self.lengths, self.keys, self.values)
+        return tuple(self._frozen(mapping) for mapping in mappings)
+
     def __repr__(self):
-        _store = self.store.items()
-        _lengths, _keys, _values = self.lengths.items(), self.keys.items(), self.values.items()
+        _store = self._items(self.store)
+        _lengths, _keys = self._items(self.lengths), self._items(self.keys)
+        _values = self._items(self.values)
         chain = itertools.chain(_store, _lengths, _keys, _values)
         items = sorted(chain, key=lambda x: x[0].name)
         return "; ".join("{} -> {}".format(variable, value) for variable, value in items if not isinstance(variable, LengthIdentifier))
 
     @copy_docstring(Lattice.bottom)
     def bottom(self) -> 'Store':
-        for var in self.store:
-            self.store[var].bottom()
-        for var in self.lengths:
-            self.lengths[var].bottom()
-        for var in self.keys:
-            self.keys[var].bottom()
-        for var in self.values:
-            self.values[var].bottom()
+        for mapping in (self.store, self.lengths, self.keys, self.values):
+            if isinstance(mapping, _packed):
+                mapping.bottom()
+                continue
+            for var in mapping:
+                if not self._peek(mapping, var).is_bottom():
+                    mapping[var].bottom()
         return self
 
     @copy_docstring(Lattice.top)
     def top(self) -> 'Store':
-        for var in self.store:
-            self.store[var].top()
-        for var in self.lengths:
-            self.lengths[var] = IntervalLattice(lower=0)
-        for var in self.keys:
-            self.keys[var].top()
-        for var in self.values:
-            self.values[var].top()
+        for mapping in (self.store, self.keys, self.values):
+            if isinstance(mapping, _packed):
+                mapping.top()
+                continue
+            for var in mapping:
+                mapping[var].top()
+        if isinstance(self.lengths, IntervalArray):
+            self.lengths.top(lower=0)
+        else:
+            for var in self.lengths:
+                self.lengths[var] = IntervalLattice(lower=0)
         return self
 
     @copy_docstring(Lattice.is_bottom)
     def is_bottom(self) -> bool:
         """The current store is bottom if `any` of its variables map to a bottom element."""
-        for variable, element in self.store.items():
-            if not variable.has_length and element.is_bottom():
+        if isinstance(self.store, _packed):
+            if any(not variable.has_length for variable in self.store.bottoms()):
                 return True
-        return any(element.is_bottom() for element in self.lengths.values())
+        else:
+            for variable, element in self._items(self.store):
+                if not variable.has_length and element.is_bottom():
+                    return True
+        if isinstance(self.lengths, IntervalArray):
+            return bool(self.lengths.bottoms())
+        return any(element.is_bottom() for _, element in self._items(self.lengths))
 
     @copy_docstring(Lattice.is_top)
     def is_top(self) -> bool:
         """The current store is top if `all` of its variables map to a top element."""
-        _store = all(element.is_top() for element in self.store.values())
+        if isinstance(self.store, _packed):
+            _store = self.store.is_top()
+        else:
+            _store = all(element.is_top() for _, element in self._items(self.store))
+        if isinstance(self.lengths, IntervalArray):
+            return _store and self.lengths.is_top(lower=0)
         _top = IntervalLattice(lower=0)
-        _lengths = all(_top.less_equal(element) for element in self.lengths.values())
+        _lengths = all(_top.less_equal(element) for _, element in self._items(self.lengths))
         return _store and _lengths
 
     @copy_docstring(EnvironmentMixin.unify)
@@ -149,52 +399,81 @@ class Store(EnvironmentMixin):
                 self.add_variable(variable)
         return self
 
+    def _mappings(self, other: 'Store'):
+        """Corresponding mappings of the current and the other store.
+
+        :param other: other store
+        :return: pairs of corresponding mappings
+        """
+        return ((self.store, other.store), (self.lengths, other.lengths),
+                (self.keys, other.keys), (self.values, other.values))
+
+    def _pairs(self, mine, theirs):
+        """Lattice elements of two corresponding mappings for each variable.
+
+        :param mine: mapping of the current store
+        :param theirs: corresponding mapping of the other store
+        :return: variable and lattice elements (retrieved only to be read)
+        """
+        for var in mine:
+            yield var, self._peek(mine, var), self._peek(theirs, var)
+
+    @staticmethod
+    def _both_packed(mine, theirs) -> bool:
+        """Whether two corresponding mappings are both packed (into arrays or bit vectors)."""
+        return isinstance(mine, _packed) and isinstance(theirs, type(mine))
+
     @copy_docstring(Lattice._less_equal)
     def _less_equal(self, other: 'Store') -> bool:
         """The comparison is performed point-wise for each variable."""
-        _store = all(self.store[var].less_equal(other.store[var]) for var in self.store)
-        _lengths = all(self.lengths[var].less_equal(other.lengths[var]) for var in self.lengths)
-        _keys = all(self.keys[var].less_equal(other.keys[var]) for var in self.keys)
-        _values = all(self.values[var].less_equal(other.values[var]) for var in self.values)
-        return _store and _lengths and _keys and _values
+        for mine, theirs in self._mappings(other):
+            if self._both_packed(mine, theirs):
+                if not mine.less_equal(theirs):
+                    return False
+            elif not all(left is right or left.less_equal(right)
+                         for _, left, right in self._pairs(mine, theirs)):
+                return False
+        return True
 
     @copy_docstring(Lattice._meet)
     def _meet(self, other: 'Store'):
         """The meet is performed point-wise for each variable."""
-        for var in self.store:
-            self.store[var].meet(other.store[var])
-        for var in self.lengths:
-            self.lengths[var].meet(other.lengths[var])
-        for var in self.keys:
-            self.keys[var].meet(other.keys[var])
-        for var in self.values:
-            self.values[var].meet(other.values[var])
+        for mine, theirs in self._mappings(other):
+            if self._both_packed(mine, theirs):
+                mine.meet(theirs)
+                continue
+            for var, left, right in self._pairs(mine, theirs):
+                if left is not right:   # shared elements are left untouched
+                    mine[var].meet(right)
         return self
 
     @copy_docstring(Lattice._join)
     def _join(self, other: 'Store') -> 'Store':
         """The join is performed point-wise for each variable."""
-        for var in self.store:
-            self.store[var].join(other.store[var])
-        for var in self.lengths:
-            self.lengths[var].join(other.lengths[var])
-        for var in self.keys:
-            self.keys[var].join(other.keys[var])
-        for var in self.values:
-            self.values[var].join(other.values[var])
+        for mine, theirs in self._mappings(other):
+            if self._both_packed(mine, theirs):
+                mine.join(theirs)
+                continue
+            for var, left, right in self._pairs(mine, theirs):
+                if left is not right:   # shared elements are left untouched
+                    mine[var].join(right)
         return self
 
     @copy_docstring(Lattice._widening)
     def _widening(self, other: 'Store'):
         """The widening is performed point-wise for each variable."""
-        for var in self.store:
-            self.store[var].widening(other.store[var])
-        for var in self.lengths:
-            self.lengths[var].widening(other.lengths[var])
-        for var in self.keys:
-            self.keys[var].widening(other.keys[var])
-        for var in self.values:
-            self.values[var].widening(other.values[var])
+        return self._widening_with_thresholds(other, ())
+
+    @copy_docstring(Lattice._widening_with_thresholds)
+    def _widening_with_thresholds(self, other: 'Store', thresholds: Sequence):
+        """The widening is performed point-wise for each variable."""
+        for mine, theirs in self._mappings(other):
+            if self._both_packed(mine, theirs):
+                mine.widening(theirs, thresholds)
+                continue
+            for var, left, right in self._pairs(mine, theirs):
+                if left is not right:   # shared elements are left untouched
+                    mine[var].widening_with_thresholds(right, thresholds)
         return self
 
     @copy_docstring(EnvironmentMixin.add_variable)
@@ -85,6 +85,12 @@ class CharacterLattice(BottomMixin, SequenceMixin):
             return "⊥"
         return "(" + do(self.certainly) + ", " + do(self.maybe) + ")"
 
+    @copy_docstring(BottomMixin._structure)
+    def _structure(self):
+        if self.is_bottom():
+            return None
+        return frozenset(self.certainly), frozenset(self.maybe)
+
     @copy_docstring(BottomMixin.top)
     def top(self):
         """The top lattice element is ``(∅, Σ)``."""
@@ -67,6 +67,12 @@ class StringSetLattice(TopMixin, SequenceMixin):
         stringlist = sorted(self.strings, key=lambda x: x)
         return "{" + ", ".join("'{}'".format(string) for string in stringlist) + "}"
 
+    @copy_docstring(TopMixin._structure)
+    def _structure(self):
+        if self.is_top():
+            return None
+        return frozenset(self.strings)
+
     def bottom(self):
         """The bottom lattice element is ``∅``."""
         return self._replace(type(self)(set()))
@@ -24,6 +24,8 @@ class DataFrameColumnType(LyraType):
     """Dummy type for names of columns of dataframes.
     No Python expression shall actually have this type."""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "DataFrameColumn"
 
@@ -52,6 +54,8 @@ class DataFrameColumnIdentifier(VariableIdentifier):
     """Fake "variable" identifier for the sole purpose of embedding column
     names into VariableIdentifier and to reuse Store."""
 
+    __slots__ = ('_kind',)
+
     ColumnName = Union[str, None, "DataFrameColumnIdentifier"]
 
     def __init__(self, name: ColumnName, kind: DataFrameColumnKind = None):
@@ -130,6 +130,16 @@ class FularaUsageLattice(Lattice):
         _scalar = "; ".join("{} -> {}".format(variable, value) for variable, value in _items)
         return f"{_scalar}, {self.dict_usage}"
 
+    @copy_docstring(Lattice._structure)
+    def _structure(self):
+        remove = set()
+        for variable in self.dict_usage.store:
+            remove.add(KeysIdentifier(variable))
+            remove.add(ValuesIdentifier(variable))
+        items = Store._items(self.scalar_usage.store)
+        _scalar = frozenset(item for item in items if item[0] not in remove)
+        return _scalar, self.dict_usage
+
     @copy_docstring(Lattice.bottom)
     def bottom(self) -> 'FularaUsageLattice':
         """Point-wise, setting all elements to N"""
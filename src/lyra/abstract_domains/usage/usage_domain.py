@@ -11,6 +11,7 @@ from collections import defaultdict
 from copy import deepcopy
 from typing import Dict, Type, Set
 
+from lyra.abstract_domains.bitvector import BitVector
 from lyra.abstract_domains.lattice import Lattice
 from lyra.abstract_domains.stack import Stack
 from lyra.abstract_domains.state import State
@@ -22,6 +23,38 @@ from lyra.core.types import LyraType, DictLyraType
 from lyra.core.utils import copy_docstring
 
 
+class UsageBitVector(BitVector):
+    """Bit vector of usage statuses.
+
+    The statuses are encoded by two bitmasks: the first marks the variables
+    that are written (``W``) or used (``U``), the second those that are scoped (``S``) or used.
+    """
+
+    def increase(self) -> 'UsageBitVector':
+        """Increase the nesting level, point-wise for each key.
+
+        :return: current mapping modified to reflect an increased nesting level
+        """
+        self._sync()
+        self._planes[0] = 0     # U becomes S and W becomes N
+        return self
+
+    def decrease(self, other: 'UsageBitVector') -> 'UsageBitVector':
+        """Decrease the nesting level by combining usage statuses, point-wise for each key.
+
+        :param other: other mapping (with the same keys), higher nesting level
+        :return: current mapping modified to reflect a decreased nesting level
+        """
+        self._sync()
+        planes = self._aligned(other)
+        written, scoped = self._planes
+        # statuses replaced by the other ones: N, or where the other status is W or U
+        replaced = planes[0] | self._full & ~(written | scoped)
+        self._planes = [mine & ~replaced | theirs & replaced
+                        for mine, theirs in zip(self._planes, planes)]
+        return self
+
+
 class UsageStore(Store):
     """An element of a store mapping each program variable to its usage status.
 
@@ -44,6 +77,8 @@ class UsageStore(Store):
     @copy_docstring(Store.is_bottom)
     def is_bottom(self) -> bool:
         """The current store is bottom if `all` of its variables map to a bottom element."""
+        if isinstance(self.store, BitVector):
+            return len(self.store.bottoms()) == len(self.store)
         return all(element.is_bottom() for element in self.store.values())
 
     def increase(self) -> 'UsageStore':
@@ -53,6 +88,9 @@ class UsageStore(Store):
 
         The increase is performed point-wise for each variable.
         """
+        if isinstance(self.store, UsageBitVector):
+            self.store.increase()
+            return self
         for var in self.store:
             self.store[var].increase()
         return self
@@ -65,6 +103,9 @@ class UsageStore(Store):
 
         The decrease is performed point-wise for each variable.
         """
+        if isinstance(self.store, UsageBitVector) and isinstance(other.store, UsageBitVector):
+            self.store.decrease(other.store)
+            return self
         for var in self.store:
             self.store[var].decrease(other.store[var])
         return self
@@ -77,19 +118,26 @@ class SimpleUsageStore(UsageStore):
 
     .. note:: Program variables storing lists are abstracted via summarization.
 
+    .. note::
+        The usage statuses can be packed into bit vectors (cf. :class:`UsageBitVector`),
+        which turns the lattice operations into integer bit operations.
+
     .. document private methods
     .. automethod:: SimpleUsageStore._less_equal
     .. automethod:: SimpleUsageStore._meet
     .. automethod:: SimpleUsageStore._join
     """
 
-    def __init__(self, variables: Set[VariableIdentifier]):
+    def __init__(self, variables: Set[VariableIdentifier], bitvectors: bool = False):
         """Map each program variable to its usage status.
 
         :param variables: set of program variables
+        :param bitvectors: whether to pack the usage statuses into bit vectors
         """
         lattices = defaultdict(lambda: UsageLattice)
         super().__init__(variables, lattices)
+        if bitvectors:
+            self.bitvectors(UsageLattice, UsageBitVector)
 
 
 class SimpleUsageState(Stack, State):
@@ -108,8 +156,9 @@ class SimpleUsageState(Stack, State):
     .. automethod:: SimpleUsageState._substitute
     """
 
-    def __init__(self, variables: Set[VariableIdentifier], precursory: State = None):
-        super().__init__(SimpleUsageStore, {'variables': variables})
+    def __init__(self, variables: Set[VariableIdentifier], precursory: State = None,
+                 bitvectors: bool = False):
+        super().__init__(SimpleUsageStore, {'variables': variables, 'bitvectors': bitvectors})
         State.__init__(self, precursory)
 
     @copy_docstring(Stack.push)
@@ -145,7 +194,7 @@ class SimpleUsageState(Stack, State):
     def _assume_any(self, condition: Expression) -> 'SimpleUsageState':
         effect = False  # effect of the current nesting level on the outcome of the program
         for variable in self.lattice.variables:
-            value = self.lattice.store[variable]
+            value = self.lattice._peek(self.lattice.store, variable)
             if value.is_written() or value.is_top():
                 effect = True
                 break
@@ -61,6 +61,10 @@ class UsageLattice(Lattice):
     def __repr__(self):
         return self.element.name
 
+    @copy_docstring(Lattice._structure)
+    def _structure(self):
+        return self.element
+
     @copy_docstring(Lattice.bottom)
     def bottom(self):
         """The bottom lattice element is ``N`` (not used)."""
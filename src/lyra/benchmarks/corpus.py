@@ -0,0 +1,206 @@
+"""
+Corpus Benchmarks
+=================
+
+Performance of the analyses over the programs of the unit tests and of the Code Jam corpus.
+
+Each program is analyzed headless (without rendering or checking its result) in a fresh
+worker process, several times. For each program, the benchmark records the best wall time,
+the peak resident set size of the worker process, and the number of node visits
+and of loop head iterations of the analysis. The results are stored as JSON baselines,
+which can be compared to flag regressions beyond a threshold.
+
+Usage::
+
+    python -m lyra.benchmarks.corpus run [--corpus NAME ...] [--repeat R] [--output FILE]
+    python -m lyra.benchmarks.corpus compare BASELINE CURRENT [--threshold T]
+
+:Author: Caterina Urban
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Tuple, Type
+
+from lyra.engine.assumption.assumption_analysis import TypeRangeAssumptionAnalysis
+from lyra.engine.container.fulara.fulara_analysis import FularaIntervalAnalysis
+from lyra.engine.liveness.liveness_analysis import StrongLivenessAnalysis
+from lyra.engine.numerical.interval_analysis import ForwardIntervalAnalysisWithSummarization, \
+    BackwardIntervalAnalysisWithSummarization
+from lyra.engine.numerical.octagon_analysis import ForwardOctagonAnalysis
+from lyra.engine.numerical.polyhedra_analysis import ForwardPolyhedraAnalysis
+from lyra.engine.numerical.sign_analysis import ForwardSignAnalysis
+from lyra.engine.profiling import Profile
+from lyra.engine.runner import Runner
+from lyra.engine.usage.usage_analysis import SimpleUsageAnalysis
+
+try:
+    import resource
+except ImportError:     # the resource module is only available on Unix platforms
+    resource = None
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+corpora: Dict[str, Tuple[Type[Runner], str]] = {
+    'intervals': (ForwardIntervalAnalysisWithSummarization,
+                  'unittests/numerical/interval/forward/**/*.py'),
+    'intervals-backward': (BackwardIntervalAnalysisWithSummarization,
+                           'unittests/numerical/interval/backward/**/*.py'),
+    'signs': (ForwardSignAnalysis, 'unittests/numerical/sign/forward/**/*.py'),
+    'octagons': (ForwardOctagonAnalysis, 'unittests/numerical/octagon/**/*.py'),
+    'polyhedra': (ForwardPolyhedraAnalysis, 'unittests/numerical/polyhedra/forward/**/*.py'),
+    'assumption': (TypeRangeAssumptionAnalysis, 'unittests/assumption/type+range/**/*.py'),
+    'usage': (SimpleUsageAnalysis, 'unittests/usage/*.py'),
+    'liveness': (StrongLivenessAnalysis, 'unittests/liveness/**/*.py'),
+    'fulara': (FularaIntervalAnalysis, 'unittests/container/fulara/**/*.py'),
+    'code_jam': (SimpleUsageAnalysis, 'tests/code_jam/**/*.py')
+}
+"""Analysis and (glob pattern of the) programs of each corpus, relative to the Lyra package."""
+
+metrics = ('time', 'rss', 'visits', 'iterations')
+"""Metrics recorded for each program (where larger is worse)."""
+
+_noise = {'time': 0.001}     # differences below which a metric is not compared
+
+
+def files(corpus: str) -> List[str]:
+    """Programs of a corpus.
+
+    :param corpus: name of the corpus
+    :return: sorted list of paths of the programs (relative to the Lyra package)
+    """
+    pattern = os.path.join(_root, corpora[corpus][1])
+    paths = glob.glob(pattern, recursive=True)
+    return sorted(os.path.relpath(path, _root) for path in paths
+                  if os.path.basename(path) != '__init__.py')
+
+
+def measure(corpus: str, path: str, repeat: int) -> Dict[str, Any]:
+    """Analyze a program several times (within a fresh worker process).
+
+    :param corpus: name of the corpus of the program
+    :param path: path of the program (relative to the Lyra package)
+    :param repeat: number of repetitions of the analysis
+    :return: record of the measurements
+    """
+    record = {'status': 'ok'}
+    try:
+        analysis = corpora[corpus][0]
+        runner = analysis().headless()
+        runner.load(os.path.join(_root, path))
+        times = list()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _, interpreter = runner.analyze()
+            times.append(time.perf_counter() - start)
+        runner.profile = Profile()      # counting run, not timed
+        runner.analyze()
+        record['time'] = min(times)
+        record['times'] = times
+        record['visits'] = interpreter.visits
+        iterations = runner.profile.iterations.values()
+        record['iterations'] = sum(sum(nodes.values()) for nodes in iterations)
+    except Exception as error:
+        record['status'] = 'error'
+        record['error'] = f"{type(error).__name__}: {error}"
+        record['traceback'] = traceback.format_exc()
+    if resource is not None:    # peak resident set size (in kilobytes on Linux, bytes on macOS)
+        record['rss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return record
+
+
+def run(names: List[str], repeat: int) -> Dict[str, Any]:
+    """Run the benchmarks of some corpora.
+
+    :param names: names of the corpora
+    :param repeat: number of repetitions of the analysis of each program
+    :return: baseline of the measurements
+    """
+    results = dict()
+    for corpus in names:
+        results[corpus] = dict()
+        for path in files(corpus):
+            try:
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    record = executor.submit(measure, corpus, path, repeat).result()
+            except BrokenProcessPool:
+                record = {'status': 'crashed'}
+            results[corpus][path] = record
+            print(corpus, path, record['status'], '{:.3f}s'.format(record.get('time', 0)),
+                  file=sys.stderr)
+    meta = {'python': platform.python_version(), 'platform': platform.platform(), 'repeat': repeat}
+    return {'meta': meta, 'results': results}
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float) -> List[str]:
+    """Compare the measurements of two baselines.
+
+    :param baseline: previous baseline
+    :param current: current baseline
+    :param threshold: relative increase of a metric above which it is a regression
+    :return: description of the regressions
+    """
+    regressions = list()
+    for corpus, records in current['results'].items():
+        previous = baseline['results'].get(corpus, dict())
+        for path, record in sorted(records.items()):
+            if path not in previous:
+                continue
+            before = previous[path]
+            if before['status'] != record['status']:
+                if before['status'] == 'ok':
+                    change = f"{before['status']} -> {record['status']}"
+                    regressions.append(f"{corpus} {path}: {change}")
+                continue
+            for metric in metrics:
+                old, new = before.get(metric), record.get(metric)
+                if old is None or new is None or new - old <= _noise.get(metric, 0):
+                    continue
+                if new > old * (1 + threshold):
+                    increase = f"+{(new - old) / old:.0%}" if old else "new"
+                    change = f"{old:g} -> {new:g} ({increase})"
+                    regressions.append(f"{corpus} {path}: {metric} {change}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    commands = parser.add_subparsers(dest='command', required=True)
+    running = commands.add_parser('run', help='run the benchmarks and write a baseline')
+    running.add_argument('--corpus', nargs='+', choices=sorted(corpora), default=sorted(corpora),
+                         help='corpora to run (default: all)')
+    running.add_argument('--repeat', type=int, default=3, help='number of repetitions')
+    running.add_argument('--output', help='JSON baseline file (default: standard output)')
+    comparing = commands.add_parser('compare', help='compare two baselines')
+    comparing.add_argument('baseline', help='JSON file of the previous baseline')
+    comparing.add_argument('current', help='JSON file of the current baseline')
+    comparing.add_argument('--threshold', type=float, default=0.1,
+                           help='relative increase above which a metric regressed (default: 0.1)')
+    args = parser.parse_args()
+    if args.command == 'run':
+        baseline = run(args.corpus, args.repeat)
+        if args.output:
+            with open(args.output, 'w') as output:
+                json.dump(baseline, output, indent=2)
+        else:
+            json.dump(baseline, sys.stdout, indent=2)
+    else:
+        with open(args.baseline) as baseline, open(args.current) as current:
+            regressions = compare(json.load(baseline), json.load(current), args.threshold)
+        for regression in regressions:
+            print(regression)
+        print(f"{len(regressions)} regression(s)", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
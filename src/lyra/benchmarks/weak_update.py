@@ -0,0 +1,147 @@
+"""
+Weak Update Micro-Benchmark
+===========================
+
+Time of the polyhedra and octagon analyses of a generated list-heavy program,
+whose conditions on list elements require weak updates of the summarized lists,
+with the current weak update and with the previous one (filtering the constraints involving
+the summarized variables through the string representation of their coefficients,
+and rebuilding abstract values from arrays of constraints).
+
+Usage::
+
+    python -m lyra.benchmarks.weak_update [--lists N] [--repeat R]
+
+:Author: Caterina Urban
+"""
+
+import argparse
+import ast
+import time
+from copy import deepcopy
+from typing import Set, Type
+
+from apronpy.abstract1 import PyAbstract1
+from apronpy.environment import PyEnvironment
+from apronpy.lincons1 import PyLincons1Array
+from apronpy.var import PyVar
+
+from lyra.abstract_domains.numerical.apron_domain import APRONStateWithSummarization
+from lyra.abstract_domains.numerical.octagon_domain import OctagonStateWithSummarization
+from lyra.abstract_domains.numerical.polyhedra_domain import PolyhedraStateWithSummarization
+from lyra.engine.forward import ForwardInterpreter
+from lyra.frontend.cfg_generator import ast_to_cfgs, ast_to_fargs
+from lyra.semantics.forward import DefaultForwardSemantics
+
+
+def program(lists: int) -> str:
+    """Source of a list-heavy program.
+
+    :param lists: number of lists in the program
+    :return: source of the program
+    """
+    lines = ['x: int = int(input())', 'y: int = int(input())']
+    for i in range(lists):
+        lines.append(f'l{i}: List[int] = [x, x + {i}, y]')
+    for i in range(lists):
+        lines.append(f'if l{i}[1] > x + y:')
+        lines.append(f'    x = x + 1')
+        lines.append(f'if l{i}[0] <= y:')
+        lines.append(f'    y = y - 1')
+    return '\n'.join(lines) + '\n'
+
+
+class StringFiltering:
+    """Previous weak update of APRON-based states (mixin)."""
+
+    def _weaken(self, environment: PyEnvironment, current: PyAbstract1, previous: PyAbstract1,
+                given_names: Set[str]) -> PyAbstract1:
+        # find constraints involving the given variables
+        current_array: PyLincons1Array = current.to_lincons
+        current_unstable = list()
+        for i in range(len(current_array)):
+            lincons1 = current_array.get(i)
+            for name in given_names:
+                if str(lincons1.get_coeff(PyVar(name))) != '0':
+                    current_unstable.append(i)
+                    break
+        previous_array: PyLincons1Array = previous.to_lincons
+        previous_unstable = list()
+        for i in range(len(previous_array)):
+            lincons1 = previous_array.get(i)
+            for name in given_names:
+                if str(lincons1.get_coeff(PyVar(name))) != '0':
+                    previous_unstable.append(i)
+                    break
+        # join the constraints involving the given variables
+        all_names = set()
+        for i in range(len(environment)):
+            all_names.add(environment.environment.contents.var_of_dim[i].decode('utf-8'))
+        other_names = all_names - given_names
+
+        current_lincons1s = [current_array.get(i) for i in current_unstable]
+        current_given = deepcopy(current).forget([PyVar(name) for name in other_names])
+        current_given_array = current_given.to_lincons
+        for i in range(len(current_given_array)):
+            current_lincons1s.append(current_given_array.get(i))
+        current_array1 = PyLincons1Array(current_lincons1s, environment)
+        current_abstract1 = self.domain(self.manager, environment, array=current_array1)
+
+        previous_lincons1s = [previous_array.get(i) for i in previous_unstable]
+        previous_given = deepcopy(previous).forget([PyVar(name) for name in other_names])
+        previous_given_array = previous_given.to_lincons
+        for i in range(len(previous_given_array)):
+            previous_lincons1s.append(previous_given_array.get(i))
+        previous_array1 = PyLincons1Array(previous_lincons1s, environment)
+        previous_abstract1 = self.domain(self.manager, environment, array=previous_array1)
+
+        joined_abstract1 = current_abstract1.join(previous_abstract1)
+        joined_array = joined_abstract1.to_lincons
+        # add the stable constraints to the result
+        lincons1s = [joined_array.get(i) for i in range(len(joined_array))]
+        stable = deepcopy(current).forget([PyVar(name) for name in given_names])
+        stable_array = stable.to_lincons
+        for i in range(len(stable_array)):
+            lincons1s.append(stable_array.get(i))
+        array = PyLincons1Array(lincons1s, environment)
+        return self.domain(self.manager, environment, array=array)
+
+
+class StringFilteringPolyhedraState(StringFiltering, PolyhedraStateWithSummarization):
+    pass
+
+
+class StringFilteringOctagonState(StringFiltering, OctagonStateWithSummarization):
+    pass
+
+
+def analyze(source: str, state: Type[APRONStateWithSummarization], repeat: int):
+    """Analyze a program, and return the best analysis time and the final state."""
+    cfgs, fargs = ast_to_cfgs(ast.parse(source)), ast_to_fargs(ast.parse(source))
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        interpreter = ForwardInterpreter(cfgs, fargs, DefaultForwardSemantics(), 3)
+        start = time.perf_counter()
+        result = interpreter.analyze(cfgs[''], state(cfgs[''].variables))
+        best = min(best, time.perf_counter() - start)
+    final = next(iter(result.get_node_result(cfgs[''].out_node).values()))[-1]
+    return best, final
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--lists', type=int, default=20, help='number of lists in the program')
+    parser.add_argument('--repeat', type=int, default=3, help='number of repetitions')
+    args = parser.parse_args()
+    source = program(args.lists)
+    benchmarks = [('polyhedra', StringFilteringPolyhedraState, PolyhedraStateWithSummarization),
+                  ('octagon', StringFilteringOctagonState, OctagonStateWithSummarization)]
+    for name, before, after in benchmarks:
+        previous, expected = analyze(source, before, args.repeat)
+        current, actual = analyze(source, after, args.repeat)
+        same = 'same result' if str(expected) == str(actual) else 'DIFFERENT result'
+        print(f'{name}: {previous:.3f}s -> {current:.3f}s ({previous / current:.1f}x, {same})')
+
+
+if __name__ == '__main__':
+    main()
@@ -8,8 +8,8 @@ Lyra's internal representation of a Python program.
 """
 
 from abc import ABCMeta, abstractmethod
+from collections import defaultdict, deque
 from enum import Enum
-from queue import Queue
 from typing import Dict, List, Set, Tuple, Optional
 
 from lyra.core.expressions import VariableIdentifier, LengthIdentifier, KeysIdentifier, \
@@ -189,6 +189,25 @@ class ControlFlowGraph:
         self._in_node = in_node
         self._out_node = out_node
         self._edges = {(edge.source, edge.target): edge for edge in edges}
+        self.index()
+
+    def index(self):
+        """(Re-)build the adjacency indexes of the control flow graph.
+
+        .. warning::
+            The indexes must be rebuilt whenever the edges of the control flow graph change.
+        """
+        in_edges, out_edges = defaultdict(set), defaultdict(set)
+        for (source, target), edge in self.edges.items():
+            out_edges[source].add(edge)
+            in_edges[target].add(edge)
+        self._in_edges = {node: frozenset(edges) for node, edges in in_edges.items()}
+        self._out_edges = {node: frozenset(edges) for node, edges in out_edges.items()}
+        self._predecessors = {node: frozenset(edge.source for edge in edges)
+                              for node, edges in self._in_edges.items()}
+        self._successors = {node: frozenset(edge.target for edge in edges)
+                            for node, edges in self._out_edges.items()}
+        self._variables: Optional[Set[VariableIdentifier]] = None
 
     @property
     def nodes(self) -> Dict[int, Node]:
@@ -208,11 +227,15 @@ class ControlFlowGraph:
 
     @property
     def variables(self) -> Set[VariableIdentifier]:
+        if self._variables is None:
+            self._variables = self._collect_variables()
+        return set(self._variables)
+
+    def _collect_variables(self) -> Set[VariableIdentifier]:
         variables = set()
-        visited, worklist = set(), Queue()
-        worklist.put(self.in_node)
-        while not worklist.empty():
-            current = worklist.get()
+        visited, worklist = set(), deque([self.in_node])
+        while worklist:
+            current = worklist.popleft()
             if current.identifier not in visited:
                 visited.add(current.identifier)
                 for stmt in current.stmts:
@@ -225,12 +248,10 @@ class ControlFlowGraph:
                         #         variables.add(KeysIdentifier(variable))
                         #         variables.add(ValuesIdentifier(variable))
                 if isinstance(current, Loop):
-                    edges = self.edges.items()
                     conds = list()
-                    for nodes, edge in edges:
-                        if nodes[0] == current:
-                            assert isinstance(edge, Conditional)
-                            conds.append(edge.condition)
+                    for edge in self.out_edges(current):
+                        assert isinstance(edge, Conditional)
+                        conds.append(edge.condition)
                     for cond in [c for c in conds if isinstance(c, Call)]:
                         for arg in cond.arguments:
                             if isinstance(arg, VariableAccess):
@@ -244,8 +265,7 @@ class ControlFlowGraph:
                             elif isinstance(arg, TupleDisplayAccess):
                                 for i in arg.items:
                                     variables.add(i.variable)
-                for node in self.successors(current):
-                    worklist.put(node)
+                worklist.extend(self.successors(current))
         return variables
 
     def in_edges(self, node: Node) -> Set[Edge]:
@@ -254,7 +274,7 @@ class ControlFlowGraph:
         :param node: given node
         :return: set of ingoing edges of the node
         """
-        return {self.edges[(source, target)] for (source, target) in self.edges if target == node}
+        return self._in_edges.get(node, frozenset())
 
     def predecessors(self, node: Node) -> Set[Node]:
         """Predecessors of a given node.
@@ -262,7 +282,7 @@ class ControlFlowGraph:
         :param node: given node
         :return: set of predecessors of the node
         """
-        return {edge.source for edge in self.in_edges(node)}
+        return self._predecessors.get(node, frozenset())
 
     def out_edges(self, node: Node) -> Set[Edge]:
         """Outgoing edges of a given node.
@@ -270,7 +290,7 @@ class ControlFlowGraph:
         :param node: given node
         :return: set of outgoing edges of the node
         """
-        return {self.edges[(source, target)] for (source, target) in self.edges if source == node}
+        return self._out_edges.get(node, frozenset())
 
     def successors(self, node: Node) -> Set[Node]:
         """Successors of a given node.
@@ -278,4 +298,4 @@ class ControlFlowGraph:
         :param node: given node
         :return: set of successors of the node
         """
-        return {edge.target for edge in self.out_edges(node)}
+        return self._successors.get(node, frozenset())
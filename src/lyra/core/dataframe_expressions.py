@@ -18,6 +18,8 @@ class Concat(Expression):
     see https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.concat.html
     """
 
+    __slots__ = ('_items',)
+
     def __init__(self, items: List[Expression] = None):
         """Dataframe concat construction.
 
@@ -45,6 +47,8 @@ class Loc(Expression):
     see https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.loc.html
     """
 
+    __slots__ = ('_target', '_rows', '_cols')
+
     def __init__(self, target: Expression, rows: Expression, cols: Set[Expression] = None):
         """Dataframe loc construction.
         For target.loc[rows, cols]
@@ -85,6 +89,8 @@ class Loc(Expression):
 class UnknownCall(Call):
     """Unknown function call representation."""
 
+    __slots__ = ('_fname', '_fargs')
+
     def __init__(self, typ: LyraType, fname: str, fargs: List[Expression] = None):
         """Unknown call construction.
 
@@ -106,7 +112,7 @@ class UnknownCall(Call):
         return self.typ == other.typ and self.fname == other.fname and self.fargs == self.fargs
 
     def __hash__(self):
-        return hash((self.typ, self.fname, (hash(arg) for arg in self.fargs)))
+        return hash((self.typ, self.fname, tuple(self.fargs)))
 
     def __str__(self):
         return "{}({})".format(self.fname, ",".join([str(arg) for arg in self.fargs]))
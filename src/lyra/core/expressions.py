@@ -19,17 +19,22 @@ from apronpy.texpr0 import TexprOp, TexprRtype, TexprRdir
 from apronpy.texpr1 import PyTexpr1
 from apronpy.var import PyVar
 
+from lyra.core.interning import Interned
 from lyra.core.types import LyraType, StringLyraType, IntegerLyraType, BooleanLyraType, \
     DictLyraType, SetLyraType, ListLyraType, TupleLyraType, SequenceLyraType, ContainerLyraType
 from lyra.core.utils import copy_docstring
 
 
-class Expression(metaclass=ABCMeta):
+class Expression(Interned):
     """Expression representation.
 
+    Expressions are immutable and hash-consed: structurally equal expressions are shared.
+
     https://docs.python.org/3.4/reference/expressions.html
     """
 
+    __slots__ = ('_typ',)
+
     def __init__(self, typ: LyraType):
         """Expression construction.
 
@@ -84,7 +89,8 @@ def _iter_child_exprs(expr: Expression):
     that is, all fields that are expressions
     and all items of fields that are lists of expressions.
     """
-    for _, field in expr.__dict__.items():
+    for name in expr._fields:
+        field = getattr(expr, name, None)
         if isinstance(field, Expression):
             yield field
         elif isinstance(field, list):
@@ -639,6 +645,8 @@ class Literal(Expression):
     https://docs.python.org/3.4/reference/expressions.html#literals
     """
 
+    __slots__ = ('_val',)
+
     def __init__(self, typ: LyraType, val: str):
         """Literal construction.
 
@@ -670,6 +678,8 @@ class Identifier(Expression, metaclass=ABCMeta):
     https://docs.python.org/3.4/reference/expressions.html#atom-identifiers
     """
 
+    __slots__ = ('_name', '_special')
+
     def __init__(self, typ: LyraType, name: str, special: bool = False):
         """Identifier construction.
 
@@ -702,6 +712,8 @@ class Identifier(Expression, metaclass=ABCMeta):
 class VariableIdentifier(Identifier):
     """Variable identifier representation."""
 
+    __slots__ = ()
+
     def __init__(self, typ: LyraType, name: str):
         """Variable identifier construction.
 
@@ -748,6 +760,8 @@ class VariableIdentifier(Identifier):
 class LengthIdentifier(Identifier):
     """Sequence or collection length representation."""
 
+    __slots__ = ('_expression',)
+
     def __init__(self, expression: Expression):
         """Sequence or collection length construction.
 
@@ -765,6 +779,8 @@ class LengthIdentifier(Identifier):
 class KeysIdentifier(Identifier):
     """Dictionary keys identifier representation."""
 
+    __slots__ = ('_expression',)
+
     def __init__(self, expression: Expression):
         """Dictionary keys identifier construction.
 
@@ -784,6 +800,8 @@ class KeysIdentifier(Identifier):
 class ValuesIdentifier(Identifier):
     """Dictionary values identifier representation."""
 
+    __slots__ = ('_expression',)
+
     def __init__(self, expression: Expression):
         """Dictionary values identifier construction.
 
@@ -802,6 +820,8 @@ class ValuesIdentifier(Identifier):
 class AttributeIdentifier(Identifier):
     """Attribute name identifier representation."""
 
+    __slots__ = ()
+
     def __init__(self, typ: LyraType, name: str):
         """Attribute name identifier construction.
 
@@ -816,6 +836,8 @@ class ListDisplay(Expression):
     https://docs.python.org/3/reference/expressions.html#list-displays
     """
 
+    __slots__ = ('_items',)
+
     def __init__(self, typ: ListLyraType, items: List[Expression] = None):
         """List display construction.
 
@@ -846,6 +868,8 @@ class TupleDisplay(Expression):
     https://docs.python.org/3/reference/expressions.html#expression-lists
     """
 
+    __slots__ = ('_items',)
+
     def __init__(self, typ: TupleLyraType, items: List[Expression] = None):
         """Tuple construction.
 
@@ -878,6 +902,8 @@ class SetDisplay(Expression):
     https://docs.python.org/3/reference/expressions.html#set-displays
     """
 
+    __slots__ = ('_items',)
+
     def __init__(self, typ: SetLyraType, items: List[Expression] = None):
         """Set display construction.
 
@@ -908,6 +934,8 @@ class DictDisplay(Expression):
     https://docs.python.org/3/reference/expressions.html#dictionary-displays
     """
 
+    __slots__ = ('_keys', '_values')
+
     def __init__(self, typ: DictLyraType, keys: List[Expression] = None,
                  values: List[Expression] = None):
         """Dictionary display construction.
@@ -951,6 +979,8 @@ class AttributeReference(Expression):
     https://docs.python.org/3.4/reference/expressions.html#attribute-references
     """
 
+    __slots__ = ('_target', '_attribute')
+
     def __init__(self, typ: LyraType, target: Expression, attribute: Identifier):
         """Attribute reference construction.
 
@@ -989,6 +1019,8 @@ class Subscription(Expression):
     https://docs.python.org/3.4/reference/expressions.html#subscriptions
     """
 
+    __slots__ = ('_target', '_key')
+
     def __init__(self, typ: LyraType, target: Expression, key: Expression):
         """Subscription construction.
 
@@ -1031,6 +1063,8 @@ class Slicing(Expression):
     https://docs.python.org/3.4/reference/expressions.html#slicings
     """
 
+    __slots__ = ('_target', '_lower', '_upper', '_stride')
+
     def __init__(self, typ: LyraType, target: Expression,
                  lower: Expression, upper: Expression = None, stride: Expression = None):
         """Slicing construction.
@@ -1088,10 +1122,14 @@ class Call(Expression, metaclass=ABCMeta):
     https://docs.python.org/3.4/reference/expressions.html#calls
     """
 
+    __slots__ = ()
+
 
 class Input(Call):
     """Input call representation."""
 
+    __slots__ = ()
+
     def __init__(self, typ: LyraType):
         """Input call construction.
 
@@ -1112,6 +1150,8 @@ class Input(Call):
 class Range(Call):
     """Range call representation."""
 
+    __slots__ = ('_start', '_stop', '_step')
+
     def __init__(self, typ: LyraType, start: Expression, stop: Expression, step: Expression):
         """Range call construction.
 
@@ -1154,6 +1194,8 @@ class Range(Call):
 class Items(Call):
     """Items call representation"""
 
+    __slots__ = ('_target_dict',)
+
     def __init__(self, typ: LyraType, target_dict: Expression):
         """Items() call expression construction.
 
@@ -1181,6 +1223,8 @@ class Items(Call):
 class Keys(Call):
     """Keys call representation"""
 
+    __slots__ = ('_target_dict',)
+
     def __init__(self, typ: LyraType, target_dict: Expression):
         """Keys() call expression construction.
 
@@ -1208,6 +1252,8 @@ class Keys(Call):
 class Values(Call):
     """Values call representation"""
 
+    __slots__ = ('_target_dict',)
+
     def __init__(self, typ: LyraType, target_dict: Expression):
         """Values() call expression construction.
 
@@ -1240,6 +1286,8 @@ Operation Expressions
 class Operation(Expression, metaclass=ABCMeta):
     """Operation representation."""
 
+    __slots__ = ()
+
 
 """
 Cast Operation Expressions
@@ -1248,6 +1296,8 @@ Cast Operation Expressions
 class CastOperation(Operation):
     """Cast operation representation."""
 
+    __slots__ = ('_expression',)
+
     def __init__(self, typ: LyraType, expression: Expression):
         """Cast operation construction.
 
@@ -1283,6 +1333,9 @@ Unary Operation Expressions
 
 class UnaryOperation(Operation):
     """Unary operation representation."""
+
+    __slots__ = ('_operator', '_expression')
+
     class Operator(IntEnum):
         """Unary operator representation."""
 
@@ -1334,6 +1387,8 @@ class UnaryArithmeticOperation(UnaryOperation):
     https://docs.python.org/3.4/reference/expressions.html#unary-arithmetic-and-bitwise-operations
     """
 
+    __slots__ = ()
+
     class Operator(UnaryOperation.Operator):
         """Unary arithmetic operator representation."""
         Add = 1
@@ -1361,6 +1416,8 @@ class UnaryBooleanOperation(UnaryOperation):
     https://docs.python.org/3.4/reference/expressions.html#boolean-operations
     """
 
+    __slots__ = ()
+
     class Operator(UnaryOperation.Operator):
         """Unary boolean operator representation."""
         Neg = 1
@@ -1386,6 +1443,9 @@ Binary Operation Expressions
 
 class BinaryOperation(Operation):
     """Binary operation representation."""
+
+    __slots__ = ('_left', '_operator', '_right', '_forloop')
+
     class Operator(IntEnum):
         """Binary operator representation."""
 
@@ -1454,6 +1514,8 @@ class BinaryArithmeticOperation(BinaryOperation):
     https://docs.python.org/3.4/reference/expressions.html#binary-arithmetic-operations
     """
 
+    __slots__ = ()
+
     class Operator(BinaryOperation.Operator):
         """Binary arithmetic operator representation."""
         Add = 1
@@ -1488,6 +1550,8 @@ class BinaryArithmeticOperation(BinaryOperation):
 class BinarySequenceOperation(BinaryOperation):
     """Binary sequence operation expression representation."""
 
+    __slots__ = ()
+
     class Operator(BinaryOperation.Operator):
         """Binary sequence operator representation."""
         Concat = 1
@@ -1513,6 +1577,8 @@ class BinaryBooleanOperation(BinaryOperation):
     https://docs.python.org/3.6/reference/expressions.html#boolean-operations
     """
 
+    __slots__ = ()
+
     class Operator(BinaryOperation.Operator):
         """Binary arithmetic operator representation."""
         And = 1
@@ -1545,6 +1611,8 @@ class BinaryComparisonOperation(BinaryOperation):
     https://docs.python.org/3.4/reference/expressions.html#comparisons
     """
 
+    __slots__ = ()
+
     class Operator(BinaryOperation.Operator):
         """Binary comparison operator representation"""
         Eq = 1
@@ -0,0 +1,153 @@
+"""
+Interning
+=========
+
+Hash-consing of the immutable nodes of Lyra's internal representation
+(i.e., types and expressions).
+
+The class of a node acts as its factory: creating a node structurally equal to an existing one
+(i.e., of the same class and created from the same arguments,
+with child nodes compared by identity) returns the existing node instead.
+Since child nodes are themselves shared, structurally equal subtrees are the same object,
+equality is (in most cases) an identity check, and the hash of a node is computed only once.
+
+:Author: Caterina Urban
+"""
+
+from abc import ABCMeta
+from functools import wraps
+from typing import Any, Dict, Hashable, Tuple
+from weakref import WeakValueDictionary
+
+
+_INTERNAL = ('_hash', '_args', '__weakref__')     # slots that are not fields of nodes
+
+
+def _copy(value):
+    """Copy of a (mutable) argument, so that nodes do not share it with their creator."""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def _key(value) -> Hashable:
+    """Key of an argument of a node, identifying child nodes by identity
+    (and other values by their type and value)."""
+    if isinstance(value, Interned):
+        return id(value)
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_key(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_key(item) for item in value)
+    return type(value), value
+
+
+def _create(cls, args: Tuple, kwargs: Dict[str, Any]):
+    return cls(*args, **kwargs)
+
+
+class InterningMeta(ABCMeta):
+    """Metaclass of immutable, hash-consed nodes.
+
+    Live nodes are kept in a table of weak references, keyed by their class and arguments.
+    The ``__hash__`` of each class is cached into the ``_hash`` slot of its nodes,
+    and its ``__eq__`` first checks for identity.
+    """
+
+    _table = WeakValueDictionary()
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        if '__hash__' in namespace and namespace['__hash__'] is not None:
+            namespace['__hash__'] = mcs._cached(namespace['__hash__'])
+        if '__eq__' in namespace:
+            namespace['__eq__'] = mcs._identity(namespace['__eq__'])
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        fields = list()
+        for klass in reversed(cls.__mro__):
+            for field in klass.__dict__.get('__slots__', ()):
+                if field not in _INTERNAL and field not in fields:
+                    fields.append(field)
+        cls._fields = tuple(fields)
+        return cls
+
+    @staticmethod
+    def _cached(hash_):
+        @wraps(hash_)
+        def __hash__(self):
+            try:
+                return self._hash
+            except AttributeError:
+                self._hash = hash_(self)
+                return self._hash
+        return __hash__
+
+    @staticmethod
+    def _identity(eq):
+        @wraps(eq)
+        def __eq__(self, other):
+            return self is other or eq(self, other)
+        return __eq__
+
+    def __call__(cls, *args, **kwargs):
+        args = tuple(_copy(arg) for arg in args)
+        kwargs = {name: _copy(arg) for name, arg in kwargs.items()}
+        key = (cls, _key(args), _key(sorted(kwargs.items())))
+        try:
+            node = InterningMeta._table.get(key)
+        except TypeError:   # unhashable arguments
+            key, node = None, None
+        if node is None:
+            node = super().__call__(*args, **kwargs)
+            node._args = args, kwargs
+            if key is not None:
+                InterningMeta._table[key] = node
+        return node
+
+    @staticmethod
+    def interned() -> int:
+        """Number of live interned nodes."""
+        return len(InterningMeta._table)
+
+
+class Interned(metaclass=InterningMeta):
+    """Immutable, hash-consed node.
+
+    Subclasses must declare (possibly empty) ``__slots__`` for their fields
+    and must not modify them after creation.
+    """
+
+    __slots__ = _INTERNAL
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        """Fields of the node, in order of declaration."""
+        return {field: getattr(self, field, None) for field in self._fields}
+
+    def rebuild(self, transform) -> 'Interned':
+        """Node created from the same arguments as this node, with each child node
+        (or child node within a list argument) replaced by its transformation.
+
+        :param transform: transformation of the child nodes
+        :return: rebuilt node
+        """
+        def rebuild(value):
+            if isinstance(value, Interned):
+                return transform(value)
+            if isinstance(value, list):
+                return [rebuild(item) for item in value]
+            return value
+        args, kwargs = self._args
+        args = tuple(rebuild(arg) for arg in args)
+        kwargs = {name: rebuild(arg) for name, arg in kwargs.items()}
+        return type(self)(*args, **kwargs)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return _create, (type(self),) + self._args
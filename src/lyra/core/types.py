@@ -11,10 +11,14 @@ import ast
 from abc import ABCMeta, abstractmethod
 from typing import List
 
+from lyra.core.interning import Interned
 
-class LyraType(metaclass=ABCMeta):
+
+class LyraType(Interned):
     """Type representation."""
 
+    __slots__ = ()
+
     def __eq__(self, other: 'LyraType'):
         return isinstance(other, self.__class__) and repr(self) == repr(other)
 
@@ -36,6 +40,8 @@ class LyraType(metaclass=ABCMeta):
 class BooleanLyraType(LyraType):
     """Boolean type representation."""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "bool"
 
@@ -43,6 +49,8 @@ class BooleanLyraType(LyraType):
 class IntegerLyraType(LyraType):
     """Integer type representation."""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "int"
 
@@ -50,30 +58,38 @@ class IntegerLyraType(LyraType):
 class FloatLyraType(LyraType):
     """Float type representation."""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "float"
 
 
 class SequenceLyraType(LyraType, metaclass=ABCMeta):
     """Sequence type representation."""
-    pass
+
+    __slots__ = ()
 
 
 class StringLyraType(SequenceLyraType):
     """String type representation."""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "string"
 
 
 class ContainerLyraType(LyraType, metaclass=ABCMeta):
     """Container type representation."""
-    pass
+
+    __slots__ = ()
 
 
 class ListLyraType(SequenceLyraType, ContainerLyraType):
     """List type representation."""
 
+    __slots__ = ('_typ',)
+
     def __init__(self, typ: LyraType):
         """List type creation.
 
@@ -97,6 +113,8 @@ class TupleLyraType(SequenceLyraType, ContainerLyraType):
     # e.g. Tuple[int, ...].
     # A plain Tuple is equivalent to Tuple[Any, ...]
 
+    __slots__ = ('_typs',)
+
     def __init__(self, typs: List[LyraType]):
         """Tuple type creation.
 
@@ -120,6 +138,8 @@ class TupleLyraType(SequenceLyraType, ContainerLyraType):
 class SetLyraType(ContainerLyraType):
     """Set type representation."""
 
+    __slots__ = ('_typ',)
+
     def __init__(self, typ: LyraType):
         """Set type creation.
 
@@ -139,6 +159,8 @@ class SetLyraType(ContainerLyraType):
 class DictLyraType(ContainerLyraType):
     """Dictionary type representation."""
 
+    __slots__ = ('_key_typ', '_val_typ')
+
     def __init__(self, key_typ: LyraType, val_typ: LyraType):
         """Dictionary type creation.
 
@@ -164,6 +186,8 @@ class DictLyraType(ContainerLyraType):
 
 class DataFrameLyraType(ContainerLyraType):
 
+    __slots__ = ('_library',)
+
     def __init__(self, library: str):
         """DataFrame type creation.
 
@@ -180,6 +204,8 @@ class DataFrameLyraType(ContainerLyraType):
 
 class SeriesLyraType(ContainerLyraType):
 
+    __slots__ = ('_library',)
+
     def __init__(self, library: str):
         """Series type creation.
 
@@ -197,6 +223,8 @@ class SeriesLyraType(ContainerLyraType):
 class AttributeAccessLyraType(LyraType):
     """Attribute access type representation."""
 
+    __slots__ = ('_target_typ', '_attr_typ')
+
     def __init__(self, target_typ: LyraType, attr_typ: LyraType = None):
         """Attribute access type creation.
 
@@ -0,0 +1,576 @@
+"""
+Input Data Validator
+====================
+
+Validation of input data against the assumption inferred by an assumption analysis.
+
+The assumption on the input data inferred at the beginning of a program is compiled into
+a JSON specification, which is checked against (possibly very large) input data
+independently of the analysis and of its dependencies (only NumPy is required).
+The input data is a stream of data points, read in chunks either one per line
+(as read by ``input()``) or one per field of a CSV file (row by row).
+Each (repeated) sequence of basic constraints is checked on a whole chunk at once
+with vectorised operations. The validation stops at the first violating data point.
+
+The specification of an assumption is a JSON object::
+
+    {"repeat": <multiplier>, "constraints": [<constraint>, ...]}
+
+where each constraint is another assumption, a star constraint ``{"star": true}``
+(which leaves the rest of the input data unconstrained), or a basic constraint::
+
+    {"line": <line>, "type": ..., "range": ..., "quantity": ..., "alphabet": ..., "words": ...}
+
+on the data point read by the input statement at the given line of the program
+(only the constraining lattices are included). A multiplier is an integer,
+a reference ``{"input": [<line>, <n>]}`` to the value of the n-th data point read
+at the given line, an arithmetic operation ``{"operator": ..., "left": ..., "right": ...}``,
+or ``null`` if unknown (in which case the rest of the input data is unconstrained).
+
+Usage::
+
+    python -m lyra.engine.assumption.validator SPECIFICATION DATA [--csv] [--delimiter D]
+
+:Author: Caterina Urban
+"""
+
+import argparse
+import csv
+import json
+import operator
+import string
+import sys
+from itertools import islice
+from math import inf
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+Specification = Dict[str, Any]
+
+_operators = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod
+}
+
+_types = {
+    'Boolean': "not a boolean (0 or 1)",
+    'Integer': "not an integer",
+    'Float': "not a float",
+    None: "not a number"
+}
+"""Reason of the violation of each (numerical) type constraint."""
+
+
+# compilation of assumptions
+
+def specification(state) -> Specification:
+    """Compile the assumption on the input data of an assumption analysis state.
+
+    :param state: assumption analysis state (e.g., at the beginning of the program)
+    :return: specification of the assumption on the input data
+    """
+    return _assumption(state.stack.lattice)
+
+
+def _assumption(lattice) -> Specification:
+    if lattice.is_bottom():     # no input data is valid
+        return {'repeat': 1, 'constraints': [{'line': None, 'bottom': True}]}
+    constraints = list()
+    for constraint in lattice.constraints:
+        if isinstance(constraint, tuple):
+            constraints.append(_basic(*constraint) if constraint else {'star': True})
+        else:
+            constraints.append(_assumption(constraint))
+    return {'repeat': _multiplier(lattice.multiplier), 'constraints': constraints}
+
+
+def _multiplier(expression) -> Union[int, Specification, None]:
+    # imported here, so that validating input data does not require the analysis dependencies
+    from lyra.core.expressions import BinaryArithmeticOperation, CastOperation, \
+        LengthIdentifier, Literal, UnaryArithmeticOperation, VariableIdentifier
+    if isinstance(expression, Literal):
+        try:
+            return int(expression.val)
+        except ValueError:
+            return None
+    if isinstance(expression, LengthIdentifier):
+        items = getattr(expression.expression, 'items', None)
+        return None if items is None else len(items)
+    if isinstance(expression, VariableIdentifier):
+        # the value of an input is named after the line of the input and its position therein
+        line, _, position = expression.name.partition('.')
+        if line.isdigit() and position.isdigit():
+            return {'input': [int(line), int(position)]}
+        return None
+    if isinstance(expression, CastOperation):
+        return _multiplier(expression.expression)
+    if isinstance(expression, UnaryArithmeticOperation):
+        operand = _multiplier(expression.expression)
+        if operand is None or expression.operator == UnaryArithmeticOperation.Operator.Add:
+            return operand
+        return {'operator': '-', 'left': 0, 'right': operand}
+    if isinstance(expression, BinaryArithmeticOperation):
+        left, right = _multiplier(expression.left), _multiplier(expression.right)
+        if left is None or right is None:
+            return None
+        return {'operator': str(expression.operator), 'left': left, 'right': right}
+    return None
+
+
+def _bound(bound: float) -> Union[int, float, None]:
+    if bound in (-inf, inf):
+        return None
+    return int(bound) if float(bound).is_integer() else bound
+
+
+def _basic(pp, lattices) -> Specification:
+    from lyra.abstract_domains.assumption.type_domain import TypeLattice
+    from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+    from lyra.abstract_domains.numerical.sign_domain import SignLattice
+    from lyra.abstract_domains.string.character_domain import CharacterLattice
+    from lyra.abstract_domains.string.stringset_domain import StringSetLattice
+    basic = {'line': pp.line}
+    for lattice in lattices:
+        if lattice.is_bottom():
+            basic['bottom'] = True
+        elif lattice.is_top():
+            continue
+        elif isinstance(lattice, TypeLattice):
+            basic['type'] = lattice.to_json()
+        elif isinstance(lattice, IntervalLattice):
+            basic['range'] = [_bound(lattice.lower), _bound(lattice.upper)]
+        elif isinstance(lattice, SignLattice):
+            signs = (('<0', lattice.negative), ('=0', lattice.zero), ('>0', lattice.positive))
+            basic['quantity'] = [sign for sign, admitted in signs if admitted]
+        elif isinstance(lattice, CharacterLattice):
+            alphabet = {'certainly': sorted(lattice.certainly)}
+            if not set(string.printable).issubset(lattice.maybe):
+                alphabet['maybe'] = sorted(lattice.maybe)
+            basic['alphabet'] = alphabet
+        elif isinstance(lattice, StringSetLattice):
+            basic['words'] = sorted(lattice.strings)
+    return basic
+
+
+# validation of input data
+
+class Violation:
+    """Violation of an assumption by a data point."""
+
+    def __init__(self, line: int, column: Optional[int], reason: str, value: str = None):
+        """Violation construction.
+
+        :param line: line of the data point
+            (or of the end of the data, if the data point is missing)
+        :param column: column of the data point (for CSV data)
+        :param reason: violated constraint
+        :param value: value of the data point (if any)
+        """
+        self._line = line
+        self._column = column
+        self._reason = reason
+        self._value = value
+
+    @property
+    def line(self):
+        return self._line
+
+    @property
+    def column(self):
+        return self._column
+
+    @property
+    def reason(self):
+        return self._reason
+
+    @property
+    def value(self):
+        return self._value
+
+    def __repr__(self):
+        column = "" if self.column is None else f", column {self.column}"
+        value = "" if self.value is None else f": {self.value!r}"
+        return f"line {self.line}{column}: {self.reason}{value}"
+
+    def json(self) -> Dict[str, Any]:
+        """JSON representation of the violation."""
+        return {'line': self.line, 'column': self.column,
+                'reason': self.reason, 'value': self.value}
+
+
+class DataStream:
+    """Stream of input data points, read in chunks."""
+
+    Batch = Tuple[List[str], Iterable[int], Optional[Iterable[int]]]
+
+    def __init__(self, batches: Iterator[Batch]):
+        """Stream of data points.
+
+        :param batches: batches of values of data points, with their lines and columns
+        """
+        if numpy is None:
+            raise ImportError("Validating input data requires NumPy!")
+        self._batches = batches
+        self._values = numpy.array([], dtype=str)
+        self._lines = numpy.array([], dtype=numpy.int64)
+        self._columns = numpy.array([], dtype=numpy.int64)
+        self._end = 0
+
+    @classmethod
+    def lines(cls, stream: Iterable[str], chunk: int = 65536) -> 'DataStream':
+        """Stream of data points read one per line (as by ``input()``).
+
+        :param stream: lines of the input data
+        :param chunk: number of lines read at once
+        """
+        def batches():
+            lines, start = iter(stream), 1
+            while True:
+                batch = [line.rstrip('\n') for line in islice(lines, chunk)]
+                if not batch:
+                    return
+                yield batch, range(start, start + len(batch)), None
+                start += len(batch)
+        return cls(batches())
+
+    @classmethod
+    def csv(cls, stream: Iterable[str], delimiter: str = ',', chunk: int = 65536) -> 'DataStream':
+        """Stream of data points read one per field of a CSV file (row by row).
+
+        :param stream: lines of the input data
+        :param delimiter: field delimiter
+        :param chunk: number of rows read at once
+        """
+        def batches():
+            reader = csv.reader(stream, delimiter=delimiter)
+            while True:
+                values, lines, columns = list(), list(), list()
+                rows = 0
+                for rows, row in enumerate(islice(reader, chunk), 1):
+                    values.extend(row)
+                    lines.extend(reader.line_num for _ in row)
+                    columns.extend(range(1, len(row) + 1))
+                if not rows:
+                    return
+                yield values, lines, columns
+        return cls(batches())
+
+    @property
+    def end(self) -> int:
+        """Line of the last data point read so far."""
+        return self._end
+
+    def take(self, n: int) -> Tuple['numpy.ndarray', 'numpy.ndarray', 'numpy.ndarray']:
+        """Read the next data points.
+
+        :param n: number of data points to read
+        :return: values, lines, and columns (0 for data read by line) of the data points
+            (fewer than requested at the end of the data)
+        """
+        while len(self._values) < n:
+            batch = next(self._batches, None)
+            if batch is None:
+                break
+            values, lines, columns = batch
+            lines = numpy.fromiter(lines, dtype=numpy.int64, count=len(values))
+            if columns is None:
+                columns = numpy.zeros(len(values), dtype=numpy.int64)
+            else:
+                columns = numpy.fromiter(columns, dtype=numpy.int64, count=len(values))
+            self._values = numpy.concatenate((self._values, numpy.array(values, dtype=str)))
+            self._lines = numpy.concatenate((self._lines, lines))
+            self._columns = numpy.concatenate((self._columns, columns))
+        values, self._values = self._values[:n], self._values[n:]
+        lines, self._lines = self._lines[:n], self._lines[n:]
+        columns, self._columns = self._columns[:n], self._columns[n:]
+        if len(lines):
+            self._end = int(lines[-1])
+        return values, lines, columns
+
+
+def _numbers(values: 'numpy.ndarray', integer: bool) -> Tuple['numpy.ndarray', Optional[int]]:
+    """Numerical values of data points, up to the first non-numerical one (if any)."""
+    try:
+        return values.astype(numpy.int64 if integer else numpy.float64), None
+    except (ValueError, OverflowError):
+        pass
+    convert = int if integer else float
+    numbers = numpy.empty(len(values), dtype=numpy.float64)
+    for i, value in enumerate(values):
+        try:
+            numbers[i] = convert(value)
+        except (ValueError, OverflowError):
+            return numbers[:i], i
+    return numbers, None
+
+
+def _first(mask: 'numpy.ndarray', reason: str) -> Optional[Tuple[int, str]]:
+    return (int(mask.argmax()), reason) if mask.any() else None
+
+
+class _Check:
+    """Vectorised check of a basic constraint."""
+
+    def __init__(self, basic: Specification):
+        self.line: Optional[int] = basic['line']
+        self.bottom: bool = basic.get('bottom', False)
+        self.type: Optional[str] = basic.get('type')
+        self.range: Optional[List] = basic.get('range')
+        self.quantity: Optional[List[str]] = basic.get('quantity')
+        alphabet = basic.get('alphabet', dict())
+        self.certainly: List[str] = alphabet.get('certainly', list())
+        maybe = alphabet.get('maybe')
+        self.maybe: Optional[str] = None if maybe is None else ''.join(maybe)
+        self.words: Optional[List[str]] = basic.get('words')
+        numerical = self.type in ('Boolean', 'Integer', 'Float')
+        self.numerical = numerical or self.range or self.quantity
+
+    def first(self, values: 'numpy.ndarray') -> Optional[Tuple[int, str]]:
+        """First data point violating the constraint.
+
+        :param values: values of data points
+        :return: index of the first violating data point and reason of the violation (if any)
+        """
+        if not len(values):
+            return None
+        if self.bottom:
+            return 0, "no input data is valid here"
+        found = list()
+        if self.numerical:
+            numbers, index = _numbers(values, self.type in ('Boolean', 'Integer'))
+            if index is not None:
+                found.append((index, _types.get(self.type, _types[None])))
+            if self.type == 'Boolean':
+                found.append(_first(~numpy.isin(numbers, (0, 1)), _types['Boolean']))
+            if self.range:
+                lower, upper = self.range
+                mask = numpy.zeros(len(numbers), dtype=bool)
+                if lower is not None:
+                    mask |= numbers < lower
+                if upper is not None:
+                    mask |= numbers > upper
+                lower, upper = -inf if lower is None else lower, inf if upper is None else upper
+                bounds = "[{}, {}]".format(lower, upper)
+                found.append(_first(mask, f"not in range {bounds}"))
+            if self.quantity:
+                admitted = numpy.zeros(len(numbers), dtype=bool)
+                if '<0' in self.quantity:
+                    admitted |= numbers < 0
+                if '=0' in self.quantity:
+                    admitted |= numbers == 0
+                if '>0' in self.quantity:
+                    admitted |= numbers > 0
+                found.append(_first(~admitted, "not {}".format(" or ".join(self.quantity))))
+        if self.maybe is not None:
+            mask = numpy.char.strip(values, self.maybe) != ''
+            found.append(_first(mask, "unexpected characters"))
+        for character in self.certainly:
+            found.append(_first(numpy.char.find(values, character) < 0, f"missing {character!r}"))
+        if self.words is not None:
+            found.append(_first(~numpy.isin(values, self.words), "unexpected word"))
+        found = [violation for violation in found if violation is not None]
+        return min(found, key=lambda violation: violation[0]) if found else None
+
+
+class _Repetition:
+    """Repetition of a sequence of basic constraints, star constraints, and repetitions."""
+
+    def __init__(self, assumption: Specification):
+        self.repeat = assumption['repeat']
+        self.body: List[Union[List[_Check], _Repetition, None]] = list()     # None is ★
+        for constraint in assumption['constraints']:
+            if 'star' in constraint:
+                self.body.append(None)
+            elif 'constraints' in constraint:
+                self.body.append(_Repetition(constraint))
+            elif self.body and isinstance(self.body[-1], list):
+                self.body[-1].append(_Check(constraint))
+            else:
+                self.body.append([_Check(constraint)])
+
+
+class _Violated(Exception):
+
+    def __init__(self, violation: Violation):
+        super().__init__(violation)
+        self.violation = violation
+
+
+class Validator:
+    """Validator of input data against an assumption on the input data."""
+
+    def __init__(self, assumption: Specification, chunk: int = 65536):
+        """Validator construction.
+
+        :param assumption: specification of the assumption on the input data
+        :param chunk: maximum number of data points checked at once
+        """
+        if numpy is None:
+            raise ImportError("Validating input data requires NumPy!")
+        self._assumption = assumption
+        self._repetition = _Repetition(assumption)
+        self._chunk = chunk
+
+    @property
+    def assumption(self):
+        """Specification of the assumption on the input data."""
+        return self._assumption
+
+    @property
+    def chunk(self):
+        """Maximum number of data points checked at once."""
+        return self._chunk
+
+    def validate(self, data: DataStream) -> Optional[Violation]:
+        """Validate input data.
+
+        :param data: stream of data points
+        :return: violation of the assumption by the first violating data point (if any)
+        """
+        return _Validation(self, data).run(self._repetition)
+
+    def validate_file(self, path: str, is_csv: bool = False,
+                      delimiter: str = ',') -> Optional[Violation]:
+        """Validate the input data in a file.
+
+        :param path: path of the file (``-`` for the standard input)
+        :param is_csv: whether the file is a CSV file (or is read line by line)
+        :param delimiter: field delimiter (of a CSV file)
+        :return: violation of the assumption by the first violating data point (if any)
+        """
+        if path == '-':
+            return self.validate(self._stream(sys.stdin, is_csv, delimiter))
+        with open(path, newline='' if is_csv else None) as stream:
+            return self.validate(self._stream(stream, is_csv, delimiter))
+
+    def _stream(self, stream: Iterable[str], is_csv: bool, delimiter: str) -> DataStream:
+        if is_csv:
+            return DataStream.csv(stream, delimiter, self.chunk)
+        return DataStream.lines(stream, self.chunk)
+
+
+class _Validation:
+    """Validation of a stream of data points."""
+
+    def __init__(self, validator: Validator, data: DataStream):
+        self._chunk = validator.chunk
+        self._data = data
+        self._read: Dict[int, List] = dict()     # values read at each line by its latest execution
+
+    def run(self, repetition: _Repetition) -> Optional[Violation]:
+        try:
+            if self._repetition(repetition):    # the rest of the data is unconstrained
+                return None
+        except _Violated as violated:
+            return violated.violation
+        values, lines, columns = self._data.take(1)
+        if len(values):
+            column = int(columns[0]) or None
+            return Violation(int(lines[0]), column, "unexpected input data", str(values[0]))
+        return None
+
+    def _repetition(self, repetition: _Repetition) -> bool:
+        """Check a repetition, and return whether a star constraint has been reached."""
+        repeat = self._evaluate(repetition.repeat)
+        if repeat is None:      # unknown number of repetitions
+            return True
+        body = repetition.body
+        if len(body) == 1 and isinstance(body[0], list):    # vectorise across repetitions
+            self._block(body[0], repeat)
+            return False
+        for _ in range(repeat):
+            for item in body:
+                if item is None:
+                    return True
+                if isinstance(item, _Repetition):
+                    if self._repetition(item):
+                        return True
+                else:
+                    self._block(item, 1)
+        return False
+
+    def _block(self, checks: List[_Check], repeat: int):
+        """Check a repeated block of basic constraints, one chunk of repetitions at a time."""
+        k = len(checks)
+        remaining = repeat
+        while remaining > 0:
+            count = min(remaining, max(1, self._chunk // k))
+            values, lines, columns = self._data.take(count * k)
+            violation = None
+            for j, check in enumerate(checks):
+                found = check.first(values[j::k])
+                if found is not None and (violation is None or found[0] * k + j < violation[0]):
+                    violation = (found[0] * k + j, found[1])
+            if violation is not None:
+                index, reason = violation
+                column = int(columns[index]) or None
+                raise _Violated(Violation(int(lines[index]), column, reason, str(values[index])))
+            if len(values) < count * k:
+                raise _Violated(Violation(self._data.end + 1, None, "missing input data"))
+            self._remember(checks, values[-k:])
+            remaining -= count
+
+    def _remember(self, checks: List[_Check], row: 'numpy.ndarray'):
+        """Remember the values read by the latest repetition of a block of basic constraints."""
+        read = dict()
+        for check, value in zip(checks, row):
+            try:
+                number = int(value)
+            except ValueError:
+                try:
+                    number = float(value)
+                except ValueError:
+                    number = None
+            read.setdefault(check.line, list()).append(number)
+        self._read.update(read)
+
+    def _value(self, multiplier) -> Optional[float]:
+        if multiplier is None or isinstance(multiplier, (int, float)):
+            return multiplier
+        if 'input' in multiplier:
+            line, position = multiplier['input']
+            read = self._read.get(line, list())
+            return read[position - 1] if position <= len(read) else None
+        left, right = self._value(multiplier['left']), self._value(multiplier['right'])
+        if left is None or right is None:
+            return None
+        try:
+            return _operators[multiplier['operator']](left, right)
+        except (ArithmeticError, KeyError):
+            return None
+
+    def _evaluate(self, multiplier) -> Optional[int]:
+        """Number of repetitions given by a multiplier (``None`` if unknown)."""
+        value = self._value(multiplier)
+        if value is None or not float(value).is_integer():
+            return None
+        return max(0, int(value))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('specification', help='JSON specification of the assumption')
+    parser.add_argument('data', help='input data file (- for the standard input)')
+    parser.add_argument('--csv', action='store_true', help='read the data as a CSV file')
+    parser.add_argument('--delimiter', default=',', help='field delimiter of the CSV file')
+    parser.add_argument('--chunk', type=int, default=65536, help='data points checked at once')
+    args = parser.parse_args()
+    with open(args.specification) as specification:
+        document = json.load(specification)
+    assumption = document.get('assumption', document)
+    validator = Validator(assumption, args.chunk)
+    violation = validator.validate_file(args.data, args.csv, args.delimiter)
+    if violation is not None:
+        print(violation)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
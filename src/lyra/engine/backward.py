@@ -6,12 +6,12 @@ Backward Analysis Engine
 """
 
 from collections import deque
-from copy import deepcopy
-from queue import Queue
-from typing import List, Optional
+from typing import List, Optional, Iterable
 
+from lyra.core.utils import copy_docstring
 from lyra.engine.interpreter import Interpreter
 from lyra.engine.result import AnalysisResult
+from lyra.engine.worklist import PriorityWorklist
 from lyra.semantics.backward import BackwardSemantics
 
 from lyra.abstract_domains.state import State
@@ -21,7 +21,8 @@ from lyra.core.cfg import Basic, Loop, Conditional, Edge, Node, ControlFlowGraph
 class BackwardInterpreter(Interpreter):
     """Backward control flow graph interpreter."""
 
-    def __init__(self, cfgs, fargs, semantics: BackwardSemantics, widening, precursory=None):
+    def __init__(self, cfgs, fargs, semantics: BackwardSemantics, widening, precursory=None,
+                 worklist=PriorityWorklist, sparse=False, thresholds=False, narrowing=0):
         """Backward control flow graph interpreter construction.
 
         :param cfgs: control flow graphs to analyze
@@ -29,17 +30,29 @@ class BackwardInterpreter(Interpreter):
         :param semantics: semantics of statements in the control flow graph
         :param widening: number of iterations before widening
         :param precursory: precursory control flow graph interpreter
+        :param worklist: type of worklist used to schedule the nodes to analyze
+        :param sparse: whether to skip the blocks unrelated to the changes of their incoming state
+        :param thresholds: whether to widen up to thresholds harvested from the analyzed program
+        :param narrowing: number of descending iterations (at each loop head) after widening
         """
-        super().__init__(cfgs, fargs, semantics, widening, precursory)
+        super().__init__(cfgs, fargs, semantics, widening, precursory, worklist, sparse,
+                         thresholds, narrowing)
 
     @property
     def semantics(self):
         return self._semantics
 
-    def analyze(self, cfg: ControlFlowGraph, initial: State) -> AnalysisResult:
+    @property
+    @copy_docstring(Interpreter.backward)
+    def backward(self):
+        return True
+
+    @copy_docstring(Interpreter.analyze)
+    def analyze(self, cfg: ControlFlowGraph, initial: State,
+                seeds: Iterable[Node] = None) -> AnalysisResult:
         from lyra.engine.forward import ForwardInterpreter
 
-        context: State = deepcopy(initial)
+        context: State = self.copy(initial)
 
         # run the precursory analysis (if any)
         if self.precursory:     # there is a precursory analysis to be run
@@ -48,23 +61,36 @@ class BackwardInterpreter(Interpreter):
             pre_result: Optional[AnalysisResult] = None
 
         # prepare the worklist and iteration counts
-        worklist = Queue()
-        worklist.put(cfg.out_node)
+        worklist = self.worklist(cfg, backward=self.backward)
+        for node in ([cfg.out_node] if seeds is None else seeds):
+            worklist.put(node)
         iterations = {node: 0 for node in cfg.nodes}
 
-        while not worklist.empty():
+        descending = False      # whether the descending iterations after widening have started
+        while not worklist.empty() or not descending and self.narrowing:
+            if worklist.empty():    # start the descending iterations from the loop heads
+                descending = True
+                iterations = {node: 0 for node in cfg.nodes}
+                for node in cfg.nodes.values():
+                    if isinstance(node, Loop):
+                        worklist.put(node)
+                continue
+
             current: Node = worklist.get()  # retrieve the current node
+            self.visit(cfg, current)
 
             iteration = iterations[current.identifier]
+            if descending and isinstance(current, Loop) and self.narrowing <= iteration:
+                continue    # the number of descending iterations is bounded
 
             # retrieve the previous exit state of the node
             try:
-                previous = deepcopy(self.result.get_node_result(current)[context][-1])
+                previous = self.copy(self.result.get_node_result(current)[context][-1])
             except:
                 previous = None
 
             # compute the current exit state of the current node
-            entry = deepcopy(initial)
+            entry = self.copy(initial)
             if current.identifier != cfg.out_node.identifier:
                 entry.bottom()
                 # join incoming states
@@ -72,9 +98,9 @@ class BackwardInterpreter(Interpreter):
                 for edge in edges:
                     if edge.target in self.result.result:
                         ctx = context
-                        successor = deepcopy(self.result.get_node_result(edge.target)[ctx][0])
+                        successor = self.copy(self.result.get_node_result(edge.target)[ctx][0])
                     else:
-                        successor = deepcopy(initial).bottom()
+                        successor = self.copy(initial).bottom()
                     # handle unconditional non-default edges
                     if edge.kind == Edge.Kind.IF_OUT:
                         successor = successor.enter_if()
@@ -100,7 +126,7 @@ class BackwardInterpreter(Interpreter):
                             precursory = None
 
                         successor = successor.before(edge.condition.pp, precursory)
-                        successor = self.semantics.semantics(edge.condition, successor, self)
+                        successor = self.execute(cfg, current, edge.condition, successor)
                         successor = successor.filter(bwd=True)
                         successor = successor.exit_if() if branch else successor
                         successor = successor.exit_loop() if loop else successor
@@ -119,7 +145,7 @@ class BackwardInterpreter(Interpreter):
                             precursory = None
 
                         successor = successor.before(edge.condition.pp, precursory)
-                        successor = self.semantics.semantics(edge.condition, successor, self)
+                        successor = self.execute(cfg, current, edge.condition, successor)
                         successor = successor.filter(bwd=True)
                         successor = successor.exit_if()
                     elif edge.kind == Edge.Kind.LOOP_IN:
@@ -137,18 +163,26 @@ class BackwardInterpreter(Interpreter):
                             precursory = None
 
                         successor = successor.before(edge.condition.pp, precursory)
-                        successor = self.semantics.semantics(edge.condition, successor, self)
+                        successor = self.execute(cfg, current, edge.condition, successor)
                         successor = successor.filter(bwd=True)
                         successor = successor.exit_loop()
-                    entry = entry.join(successor)
-                # widening
-                if isinstance(current, Loop) and self.widening < iteration:
-                    entry = deepcopy(previous).widening(entry)
+                    entry = self.join(cfg, current, entry, successor)
+                if descending and previous is not None:     # narrowing
+                    entry = self.narrow(cfg, current, previous, entry)
+                elif isinstance(current, Loop) and self.widening < iteration:   # widening
+                    entry = self.widen(cfg, current, previous, entry)
 
             # check for termination and execute block
-            if previous is None or not entry.less_equal(previous):
+            if descending:
+                execute = previous is None or not self.less_equal(cfg, current, previous, entry)
+            else:
+                execute = previous is None or not self.less_equal(cfg, current, entry, previous)
+            if execute:
                 states = deque([entry])
-                if isinstance(current, Basic):
+                skipped = self.skip(cfg, current, context, previous, entry)
+                if skipped is not None:
+                    states = skipped
+                elif isinstance(current, Basic):
                     successor = entry
 
                     if pre_result:     # a precursory analysis was run
@@ -164,7 +198,7 @@ class BackwardInterpreter(Interpreter):
 
                     for precursory, stmt in zip(reversed(pre_states), reversed(current.stmts)):
                         successor = successor.before(stmt.pp, precursory)
-                        successor = self.semantics.semantics(stmt, deepcopy(successor), self)
+                        successor = self.execute(cfg, current, stmt, self.copy(successor))
                         states.appendleft(successor)
                 elif isinstance(current, Loop):
                     # nothing to be done
@@ -174,5 +208,7 @@ class BackwardInterpreter(Interpreter):
                 for node in cfg.predecessors(current):
                     worklist.put(node)
                 iterations[current.identifier] = iteration + 1
+                self.visit(cfg, current, executed=True)
 
+        self.schedule(worklist)
         return self.result
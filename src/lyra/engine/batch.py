@@ -0,0 +1,275 @@
+"""
+Batch Analysis
+==============
+
+Analysis of many Python files in parallel, with a JSON Lines report of the outcome of each file.
+
+Each file is analyzed in a separate worker process, under a time and a memory limit.
+A file whose analysis fails, diverges, or crashes its worker process
+is reported as such without affecting the analysis of the other files.
+The time limit is enforced within the worker process by a signal, which cannot interrupt
+long native calls (e.g., into APRON). Thus, a worker process still busy with a file
+some time after its time limit is killed by the parent process.
+
+:Author: Caterina Urban
+"""
+
+import contextlib
+import json
+import os
+import signal
+import sys
+import time
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, TimeoutError, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from lyra.engine.runner import Runner
+from lyra.frontend.cache import FrontendCache
+
+try:
+    import resource
+except ImportError:     # the resource module is only available on Unix platforms
+    resource = None
+
+
+class AnalysisTimeout(Exception):
+    """Raised within a worker process when the analysis of a file exceeds its time limit."""
+
+
+def _timeout(signum, frame):
+    raise AnalysisTimeout()
+
+
+@contextlib.contextmanager
+def _limits(timeout: Optional[float], memory: Optional[int]):
+    """Apply a time limit (in seconds) and a memory limit (in bytes) to the current process."""
+    alarm = timeout and hasattr(signal, 'setitimer')
+    limit = memory and resource is not None
+    if alarm:
+        signal.signal(signal.SIGALRM, _timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    if limit:
+        soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        bound = memory if hard == resource.RLIM_INFINITY else min(memory, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (bound, hard))
+    try:
+        yield
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        if limit:
+            resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _terminate(executor: ProcessPoolExecutor):
+    """Kill the worker processes of a pool (which breaks the pool)."""
+    for process in list((executor._processes or dict()).values()):
+        process.terminate()
+
+
+def analyze(path: str, analysis: Type[Runner], timeout: Optional[float] = None,
+            memory: Optional[int] = None, cache: Optional[str] = None,
+            settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Analyze a single Python file (within a worker process).
+
+    :param path: path of the Python file to analyze
+    :param analysis: type of the analysis runner to use
+    :param timeout: time limit for the analysis (in seconds)
+    :param memory: memory limit for the analysis (in bytes)
+    :param cache: directory of the cache of control flow graphs (no cache if ``None``)
+    :param settings: properties to set on the analysis runner (e.g., ``sparse``)
+    :return: record describing the outcome of the analysis
+    """
+    record = {'path': path, 'analysis': analysis.__name__}
+    start = time.time()
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            with _limits(timeout, memory):
+                runner = analysis()
+                for name, value in (settings or dict()).items():
+                    setattr(runner, name, value)
+                if cache is not None:
+                    runner.cache = FrontendCache(cache or None)
+                runner.load(path)
+                _, interpreter = runner.analyze()
+        record['status'] = 'ok'
+        record['nodes'] = sum(len(cfg.nodes) for cfg in runner.cfgs.values())
+        record['visits'] = interpreter.visits
+    except AnalysisTimeout:
+        record['status'] = 'timeout'
+    except MemoryError:
+        record['status'] = 'memory'
+    except Exception as error:
+        record['status'] = 'error'
+        record['error'] = f"{type(error).__name__}: {error}"
+        record['traceback'] = traceback.format_exc()
+    record['time'] = time.time() - start
+    return record
+
+
+class BatchRunner:
+    """Batch analysis runner."""
+
+    def __init__(self, analysis: Type[Runner], jobs: int = None,
+                 timeout: float = None, memory: int = None, cache: str = None,
+                 grace: float = 5, settings: Dict[str, Any] = None):
+        """Create a batch analysis runner.
+
+        :param analysis: type of the analysis runner to use for each file
+        :param jobs: number of worker processes (defaults to the number of processors)
+        :param timeout: time limit for the analysis of each file (in seconds)
+        :param memory: memory limit for the analysis of each file (in bytes)
+        :param cache: directory of the cache of control flow graphs
+            (no cache if ``None``, default cache directory if empty)
+        :param grace: time after the time limit before killing a busy worker process
+            (in seconds)
+        :param settings: properties to set on the analysis runner for each file
+            (e.g., ``{'sparse': True}``)
+        """
+        self._analysis = analysis
+        self._jobs = jobs or os.cpu_count() or 1
+        self._timeout = timeout
+        self._grace = grace
+        self._memory = memory
+        self._cache = cache
+        self._settings = settings or dict()
+
+    @property
+    def analysis(self):
+        return self._analysis
+
+    @property
+    def jobs(self):
+        return self._jobs
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @property
+    def grace(self):
+        return self._grace
+
+    @property
+    def memory(self):
+        return self._memory
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @property
+    def settings(self):
+        return self._settings
+
+    @staticmethod
+    def files(directory: str) -> List[str]:
+        """Python files within a directory (and its subdirectories).
+
+        :param directory: directory to search
+        :return: sorted list of paths of the Python files in the directory
+        """
+        paths = list()
+        for root, _, names in os.walk(directory):
+            paths.extend(os.path.join(root, name) for name in names if name.endswith('.py'))
+        return sorted(paths)
+
+    def _submit(self, executor, path: str):
+        arguments = (path, self.analysis, self.timeout, self.memory, self.cache, self.settings)
+        return executor.submit(analyze, *arguments)
+
+    def _remaining(self, starts: Iterable[float]) -> Optional[float]:
+        """Time left before the first deadline for killing a worker process (if any).
+
+        :param starts: start times of the analyses in flight
+        """
+        if self.timeout is None:
+            return None
+        deadline = min(starts, default=time.time()) + self.timeout + self.grace
+        return max(deadline - time.time(), 0)
+
+    def _killed(self, path: str, start: float) -> Dict[str, Any]:
+        """Record of a file whose worker process was killed after its time limit."""
+        return {'path': path, 'analysis': self.analysis.__name__, 'status': 'timeout',
+                'time': time.time() - start}
+
+    def _isolated(self, path: str) -> Dict[str, Any]:
+        """Re-analyze a file in its own worker process, to tell whether it crashes it."""
+        start = time.time()
+        try:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                future = self._submit(executor, path)
+                try:
+                    return future.result(self._remaining([start]))
+                except TimeoutError:
+                    _terminate(executor)
+                    return self._killed(path, start)
+        except BrokenProcessPool:
+            return {'path': path, 'analysis': self.analysis.__name__, 'status': 'crashed'}
+
+    def analyze(self, paths: List[str]) -> Iterator[Dict[str, Any]]:
+        """Analyze a list of Python files in parallel.
+
+        At most one file per worker process is in flight at any time. Thus, when a worker
+        process dies, only the files in flight are suspected of having caused it
+        and are re-analyzed in isolation, while the analysis of the other files continues.
+        When a worker process is still busy with a file after its time limit and grace period,
+        the worker processes are killed, the file is reported as timed out,
+        and the other files in flight are analyzed again.
+
+        :param paths: paths of the Python files to analyze
+        :return: records describing the outcome of the analysis of each file (as they complete)
+        """
+        pending = deque(paths)
+        while pending:
+            suspects, expired = list(), False
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                running: Dict[Future, Tuple[str, float]] = dict()
+                while (pending or running) and not suspects and not expired:
+                    while pending and len(running) < self.jobs:
+                        path = pending.popleft()
+                        running[self._submit(executor, path)] = (path, time.time())
+                    starts = [start for _, start in running.values()]
+                    done, _ = wait(running, self._remaining(starts), FIRST_COMPLETED)
+                    for future in done:
+                        path, _ = running.pop(future)
+                        try:
+                            yield future.result()
+                        except BrokenProcessPool:   # a worker process died
+                            suspects.append(path)
+                    for future, (path, start) in list(running.items()):
+                        if self._remaining([start]) == 0:   # stuck worker process
+                            running.pop(future)
+                            expired = True
+                            yield self._killed(path, start)
+                    if expired:
+                        _terminate(executor)
+                others = [path for path, _ in running.values()]
+                if expired:     # the other files in flight are not suspected
+                    pending.extendleft(reversed(others))
+                else:
+                    suspects.extend(others)
+            for path in suspects:
+                yield self._isolated(path)
+
+    def run(self, directory: str, report: str = None) -> Dict[str, int]:
+        """Analyze all Python files within a directory and write a JSON Lines report.
+
+        :param directory: directory containing the Python files to analyze
+        :param report: path of the report file (defaults to the standard output)
+        :return: number of files for each outcome of their analysis
+        """
+        summary: Dict[str, int] = dict()
+        stream = open(report, 'w') if report else sys.stdout
+        try:
+            for record in self.analyze(self.files(directory)):
+                stream.write(json.dumps(record) + '\n')
+                stream.flush()
+                summary[record['status']] = summary.get(record['status'], 0) + 1
+        finally:
+            if report:
+                stream.close()
+        return summary
@@ -0,0 +1,115 @@
+"""
+Call Graph
+==========
+
+Call graph between the user-defined functions of a program,
+with its strongly connected components in bottom-up order (callees before their callers).
+
+:Author: Caterina Urban
+"""
+
+from typing import Dict, Iterator, List, Set
+
+from lyra.core.cfg import ControlFlowGraph, Conditional
+from lyra.core.statements import Statement, Call
+
+
+class CallGraph:
+    """Call graph of the user-defined functions of a program ('' for the main program)."""
+
+    def __init__(self, cfgs: Dict[str, ControlFlowGraph]):
+        """Build the call graph of a program.
+
+        :param cfgs: control flow graphs of the main program and of each function
+        """
+        self._cfgs = cfgs
+        self._callees: Dict[str, Set[str]] = {fname: set() for fname in cfgs}
+        for fname, cfg in cfgs.items():
+            for node in cfg.nodes.values():
+                for stmt in node.stmts:
+                    self._callees[fname].update(self._calls(stmt))
+            for edge in cfg.edges.values():
+                if isinstance(edge, Conditional):
+                    self._callees[fname].update(self._calls(edge.condition))
+        self._components: List[List[str]] = self._tarjan()
+
+    @property
+    def cfgs(self):
+        return self._cfgs
+
+    def _calls(self, value) -> Iterator[str]:
+        """Names of the user-defined functions called within (a part of) a statement."""
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                yield from self._calls(item)
+        elif isinstance(value, Statement):
+            if isinstance(value, Call) and value.name in self.cfgs:
+                yield value.name
+            for item in vars(value).values():
+                yield from self._calls(item)
+
+    def callees(self, fname: str) -> Set[str]:
+        """Functions called (directly) by a function.
+
+        :param fname: name of the calling function
+        :return: set of names of the called functions
+        """
+        return self._callees[fname]
+
+    def callers(self, fname: str) -> Set[str]:
+        """Functions calling (directly) a function.
+
+        :param fname: name of the called function
+        :return: set of names of the calling functions
+        """
+        return {caller for caller, callees in self._callees.items() if fname in callees}
+
+    def _tarjan(self) -> List[List[str]]:
+        """Tarjan's algorithm, which completes each strongly connected component
+        only after all components reachable from it, i.e., in bottom-up order."""
+        index: Dict[str, int] = dict()
+        lowlink: Dict[str, int] = dict()
+        stack: List[str] = list()
+        components: List[List[str]] = list()
+        for root in sorted(self.cfgs):
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            pending = [(root, iter(sorted(self.callees(root))))]
+            while pending:      # iterative depth-first search, to support deep call chains
+                fname, callees = pending[-1]
+                callee = next(callees, None)
+                if callee is None:
+                    pending.pop()
+                    if pending:
+                        caller = pending[-1][0]
+                        lowlink[caller] = min(lowlink[caller], lowlink[fname])
+                    if lowlink[fname] == index[fname]:
+                        component = list()
+                        while not component or component[-1] != fname:
+                            component.append(stack.pop())
+                        components.append(sorted(component))
+                elif callee not in index:
+                    index[callee] = lowlink[callee] = len(index)
+                    stack.append(callee)
+                    pending.append((callee, iter(sorted(self.callees(callee)))))
+                elif callee in stack:
+                    lowlink[fname] = min(lowlink[fname], index[callee])
+        return components
+
+    def components(self) -> List[List[str]]:
+        """Strongly connected components of the call graph, in bottom-up order.
+
+        :return: list of components, each listing the names of its functions
+        """
+        return self._components
+
+    def recursive(self, fname: str) -> bool:
+        """Whether a function is (directly or mutually) recursive.
+
+        :param fname: name of the function
+        :return: whether the function belongs to a cycle of the call graph
+        """
+        component = next(component for component in self.components() if fname in component)
+        return len(component) > 1 or fname in self.callees(fname)
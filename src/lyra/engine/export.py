@@ -0,0 +1,290 @@
+"""
+Result Export
+=============
+
+Machine-readable export of analysis results, written and loaded as a stream of records.
+
+The result is exported one record at a time: a header record,
+a record for each node of the control flow graph of each function, and a record for each edge.
+A node record lists the statements of the node (with their program points)
+and, for each calling context, the states before and after each statement::
+
+    {"record": "node", "function": "", "node": 3, "kind": "Basic",
+     "statements": [{"line": 2, "column": 0, "text": "x = 3"}],
+     "contexts": [{"context": null, "states": ["x -> [-inf, inf]", "x -> [3, 3]"]}]}
+
+Records are written either as JSON Lines, or in a compact binary format,
+where each record is a length-prefixed zlib-compressed JSON document
+and the file ends with an index of the node records by node identifier and program point
+(allowing to load single nodes without reading the whole file).
+Node records can also be written as separate JSON files, one per node
+(allowing to load single nodes over HTTP, e.g., in an HTML view of the result).
+
+:Author: Caterina Urban
+"""
+
+import json
+import os
+import struct
+import zlib
+from typing import Any, BinaryIO, Dict, Iterator, Optional, TextIO, Tuple
+
+from lyra.engine.result import AnalysisResult
+
+Record = Dict[str, Any]
+
+VERSION = 1
+
+_magic = b'LYRA'                # beginning of binary exports
+_trailer = struct.Struct('<Q4s')    # offset of the index, and end of binary exports
+_length = struct.Struct('<I')       # length of each binary record
+
+
+def records(result: AnalysisResult, runner=None) -> Iterator[Record]:
+    """Records of an analysis result.
+
+    :param result: analysis result
+    :param runner: analysis runner that computed the result (if any)
+    :return: header record, node records, and edge records (by function)
+    """
+    yield {
+        'record': 'header', 'format': 'lyra-result', 'version': VERSION,
+        'path': getattr(runner, 'path', None),
+        'analysis': None if runner is None else type(runner).__name__,
+        'functions': list(result.cfgs)
+    }
+    for fname, cfg in result.cfgs.items():
+        for identifier, node in sorted(cfg.nodes.items()):
+            statements = [{'line': stmt.pp.line, 'column': stmt.pp.column, 'text': str(stmt)}
+                          for stmt in node.stmts]
+            contexts = [{'context': None if context is None else str(context),
+                         'states': [str(state) for state in states]}
+                        for context, states in result.get_node_result(node).items()]
+            yield {'record': 'node', 'function': fname, 'node': identifier,
+                   'kind': type(node).__name__, 'statements': statements, 'contexts': contexts}
+        for (source, target), edge in cfg.edges.items():
+            condition = getattr(edge, 'condition', None)
+            yield {'record': 'edge', 'function': fname,
+                   'source': None if source is None else source.identifier,
+                   'target': None if target is None else target.identifier,
+                   'kind': edge.kind.name,
+                   'condition': None if condition is None else str(condition)}
+
+
+def _key(function: str, node: int) -> str:
+    return f"{node}:{function}"
+
+
+def _point(line: int, column: int) -> str:
+    return f"{line}:{column}"
+
+
+class Index:
+    """Offsets of the node records of an export, by node identifier and by program point."""
+
+    def __init__(self, nodes: Dict[str, int] = None, points: Dict[str, Tuple[str, int]] = None):
+        self._nodes = dict() if nodes is None else nodes
+        self._points = dict() if points is None else points
+
+    def add(self, record: Record, offset: int):
+        """Index a record.
+
+        :param record: record to index
+        :param offset: offset of the record within the export
+        """
+        if record['record'] == 'node':
+            function, node = record['function'], record['node']
+            self._nodes[_key(function, node)] = offset
+            for statement in record['statements']:
+                self._points[_point(statement['line'], statement['column'])] = [function, node]
+
+    def node(self, function: str, node: int) -> Optional[int]:
+        """Offset of the record of a node (``None`` if not found)."""
+        return self._nodes.get(_key(function, node))
+
+    def point(self, line: int, column: int) -> Optional[Tuple[str, int]]:
+        """Function and identifier of the node containing the statement at a program point."""
+        located = self._points.get(_point(line, column))
+        return None if located is None else tuple(located)
+
+    def json(self) -> Dict[str, Any]:
+        """JSON representation of the index."""
+        return {'nodes': self._nodes, 'points': self._points}
+
+
+def dump_jsonl(result: AnalysisResult, stream: TextIO, runner=None):
+    """Write the records of an analysis result as JSON Lines.
+
+    :param result: analysis result
+    :param stream: text stream to write to
+    :param runner: analysis runner that computed the result (if any)
+    """
+    for record in records(result, runner):
+        stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def dump_nodes(result: AnalysisResult, directory: str, runner=None):
+    """Write the node records of an analysis result as separate JSON files.
+
+    Each file is named after the identifier of its node (which is unique within a program).
+
+    :param result: analysis result
+    :param directory: directory to write to
+    :param runner: analysis runner that computed the result (if any)
+    """
+    os.makedirs(directory, exist_ok=True)
+    for record in records(result, runner):
+        if record['record'] == 'node':
+            path = os.path.join(directory, f"{record['node']}.json")
+            with open(path, 'w', encoding='utf-8') as stream:
+                json.dump(record, stream, ensure_ascii=False)
+
+
+def dump_binary(result: AnalysisResult, stream: BinaryIO, runner=None):
+    """Write the records of an analysis result in the compact binary format.
+
+    :param result: analysis result
+    :param stream: binary stream to write to
+    :param runner: analysis runner that computed the result (if any)
+    """
+    def write(document) -> int:
+        data = zlib.compress(json.dumps(document, ensure_ascii=False).encode('utf-8'))
+        stream.write(_length.pack(len(data)))
+        stream.write(data)
+        return _length.size + len(data)
+    index = Index()
+    stream.write(_magic)
+    offset = len(_magic)
+    for record in records(result, runner):
+        index.add(record, offset)
+        offset += write(record)
+    position = offset
+    write(index.json())
+    stream.write(_trailer.pack(position, _magic))
+
+
+class ResultLoader:
+    """Loader of exported analysis results (in JSON Lines or in the compact binary format).
+
+    Records are read one at a time. Single nodes are loaded through the index of the export,
+    which is read from the end of binary exports or built by a scan of JSON Lines exports.
+    """
+
+    def __init__(self, path: str):
+        """Open an export.
+
+        :param path: path of the export
+        """
+        self._file = open(path, 'rb')
+        self._binary = self._file.read(len(_magic)) == _magic
+        self._file.seek(0)
+        self._index: Optional[Index] = None
+        self._header = next(self.records())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    @property
+    def binary(self) -> bool:
+        """Whether the export is in the compact binary format."""
+        return self._binary
+
+    @property
+    def header(self) -> Record:
+        """Header record of the export."""
+        return self._header
+
+    def _read(self, offset: int) -> Tuple[Optional[Any], int]:
+        """Read the record (or the index) at an offset, with the offset of the next record."""
+        self._file.seek(offset)
+        if self.binary:
+            prefix = self._file.read(_length.size)
+            if len(prefix) < _length.size:
+                return None, offset
+            length, = _length.unpack(prefix)
+            document = json.loads(zlib.decompress(self._file.read(length)).decode('utf-8'))
+            return document, offset + _length.size + length
+        line = self._file.readline()
+        if not line:
+            return None, offset
+        return json.loads(line.decode('utf-8')), offset + len(line)
+
+    def _records(self) -> Iterator[Tuple[Record, int]]:
+        offset = len(_magic) if self.binary else 0
+        end = self._end() if self.binary else None
+        while end is None or offset < end:
+            record, following = self._read(offset)
+            if record is None:
+                return
+            yield record, offset
+            offset = following
+
+    def _end(self) -> int:
+        """Offset of the index of a binary export (i.e., of the end of its records)."""
+        self._file.seek(-_trailer.size, 2)
+        position, magic = _trailer.unpack(self._file.read(_trailer.size))
+        if magic != _magic:
+            raise ValueError("Truncated or corrupted export!")
+        return position
+
+    def records(self) -> Iterator[Record]:
+        """Records of the export, read one at a time."""
+        for record, _ in self._records():
+            yield record
+
+    def nodes(self, function: str = None) -> Iterator[Record]:
+        """Node records of the export.
+
+        :param function: function of the nodes (all functions by default)
+        """
+        for record in self.records():
+            if record['record'] == 'node' and function in (None, record['function']):
+                yield record
+
+    def edges(self, function: str = None) -> Iterator[Record]:
+        """Edge records of the export.
+
+        :param function: function of the edges (all functions by default)
+        """
+        for record in self.records():
+            if record['record'] == 'edge' and function in (None, record['function']):
+                yield record
+
+    @property
+    def index(self) -> Index:
+        """Index of the node records of the export."""
+        if self._index is None:
+            if self.binary:
+                index, _ = self._read(self._end())
+                self._index = Index(index['nodes'], index['points'])
+            else:
+                self._index = Index()
+                for record, offset in self._records():
+                    self._index.add(record, offset)
+        return self._index
+
+    def node(self, node: int, function: str = '') -> Optional[Record]:
+        """Load the record of a node.
+
+        :param node: identifier of the node
+        :param function: function of the node (the main program by default)
+        :return: record of the node (``None`` if not found)
+        """
+        offset = self.index.node(function, node)
+        return None if offset is None else self._read(offset)[0]
+
+    def point(self, line: int, column: int) -> Optional[Record]:
+        """Load the record of the node containing the statement at a program point.
+
+        :param line: line of the program point
+        :param column: column of the program point
+        :return: record of the node (``None`` if not found)
+        """
+        located = self.index.point(line, column)
+        return None if located is None else self.node(located[1], located[0])
@@ -6,12 +6,12 @@ Forward Analysis Engine
 """
 
 from collections import deque
-from copy import deepcopy
-from queue import Queue
-from typing import Optional, List
+from typing import Optional, List, Iterable
 
+from lyra.core.utils import copy_docstring
 from lyra.engine.interpreter import Interpreter
 from lyra.engine.result import AnalysisResult
+from lyra.engine.worklist import PriorityWorklist
 from lyra.semantics.forward import ForwardSemantics
 
 from lyra.abstract_domains.state import State
@@ -21,7 +21,8 @@ from lyra.core.cfg import Basic, Loop, Conditional, Edge, Node, ControlFlowGraph
 class ForwardInterpreter(Interpreter):
     """Forward control flow graph interpreter."""
 
-    def __init__(self, cfgs, fargs, semantics: ForwardSemantics, widening, precursory=None):
+    def __init__(self, cfgs, fargs, semantics: ForwardSemantics, widening, precursory=None,
+                 worklist=PriorityWorklist, sparse=False, thresholds=False, narrowing=0):
         """Forward control flow graph interpreter construction.
 
         :param cfgs: control flow graphs to analyze
@@ -29,13 +30,25 @@ class ForwardInterpreter(Interpreter):
         :param semantics: semantics of statements in the control flow graph
         :param widening: number of iterations before widening
         :param precursory: precursory control flow graph interpreter
+        :param worklist: type of worklist used to schedule the nodes to analyze
+        :param sparse: whether to skip the blocks unrelated to the changes of their incoming state
+        :param thresholds: whether to widen up to thresholds harvested from the analyzed program
+        :param narrowing: number of descending iterations (at each loop head) after widening
         """
-        super().__init__(cfgs, fargs, semantics, widening, precursory)
+        super().__init__(cfgs, fargs, semantics, widening, precursory, worklist, sparse,
+                         thresholds, narrowing)
 
-    def analyze(self, cfg: ControlFlowGraph, initial: State) -> AnalysisResult:
+    @property
+    @copy_docstring(Interpreter.backward)
+    def backward(self):
+        return False
+
+    @copy_docstring(Interpreter.analyze)
+    def analyze(self, cfg: ControlFlowGraph, initial: State,
+                seeds: Iterable[Node] = None) -> AnalysisResult:
         from lyra.engine.backward import BackwardInterpreter
 
-        context: State = deepcopy(initial)
+        context: State = self.copy(initial)
 
         # run the precursory analysis (if any)
         if self.precursory:  # there is a precursory analysis to be run
@@ -44,23 +57,36 @@ class ForwardInterpreter(Interpreter):
             pre_result: Optional[AnalysisResult] = None
 
         # prepare the worklist and iteration counts
-        worklist = Queue()
-        worklist.put(cfg.in_node)
+        worklist = self.worklist(cfg, backward=self.backward)
+        for node in ([cfg.in_node] if seeds is None else seeds):
+            worklist.put(node)
         iterations = {node: 0 for node in cfg.nodes}
 
-        while not worklist.empty():
+        descending = False      # whether the descending iterations after widening have started
+        while not worklist.empty() or not descending and self.narrowing:
+            if worklist.empty():    # start the descending iterations from the loop heads
+                descending = True
+                iterations = {node: 0 for node in cfg.nodes}
+                for node in cfg.nodes.values():
+                    if isinstance(node, Loop):
+                        worklist.put(node)
+                continue
+
             current: Node = worklist.get()  # retrieve the current node
+            self.visit(cfg, current)
 
             iteration = iterations[current.identifier]
+            if descending and isinstance(current, Loop) and self.narrowing <= iteration:
+                continue    # the number of descending iterations is bounded
 
             # retrieve the previous entry state of the node
             try:
-                previous = deepcopy(self.result.get_node_result(current)[context][0])
+                previous = self.copy(self.result.get_node_result(current)[context][0])
             except:
                 previous = None
 
             # compute the current entry state of the current node
-            entry = deepcopy(initial)
+            entry = self.copy(initial)
             if current.identifier != cfg.in_node.identifier:
                 entry.bottom()
                 # join incoming states
@@ -70,11 +96,11 @@ class ForwardInterpreter(Interpreter):
                         ctx = context
                         node_result = self.result.get_node_result(edge.source)
                         if ctx in node_result.keys():
-                            predecessor = deepcopy(node_result[ctx][-1])
+                            predecessor = self.copy(node_result[ctx][-1])
                         else:
-                            predecessor = deepcopy(initial).bottom()
+                            predecessor = self.copy(initial).bottom()
                     else:
-                        predecessor = deepcopy(initial).bottom()
+                        predecessor = self.copy(initial).bottom()
                     # handle conditional edges
                     if isinstance(edge, Conditional) and edge.kind == Edge.Kind.DEFAULT:
                         neighbors = cfg.out_edges(edge.source)
@@ -97,7 +123,7 @@ class ForwardInterpreter(Interpreter):
                             precursory = None
 
                         predecessor = predecessor.before(condition.pp, precursory)
-                        predecessor = self.semantics.semantics(condition, predecessor, self)
+                        predecessor = self.execute(cfg, current, condition, predecessor)
                         predecessor = predecessor.filter()
                         predecessor = predecessor.exit_if() if branch else predecessor
                         predecessor = predecessor.exit_loop() if loop else predecessor
@@ -118,7 +144,7 @@ class ForwardInterpreter(Interpreter):
                             precursory = None
 
                         predecessor = predecessor.before(condition.pp, precursory)
-                        predecessor = self.semantics.semantics(condition, predecessor, self)
+                        predecessor = self.execute(cfg, current, condition, predecessor)
                         predecessor = predecessor.filter()
                     elif edge.kind == Edge.Kind.LOOP_IN:
                         predecessor = predecessor.enter_loop()
@@ -137,22 +163,30 @@ class ForwardInterpreter(Interpreter):
                             precursory = None
 
                         predecessor = predecessor.before(condition.pp, precursory)
-                        predecessor = self.semantics.semantics(condition, predecessor, self)
+                        predecessor = self.execute(cfg, current, condition, predecessor)
                         predecessor = predecessor.filter()
                     # handle unconditional non-default edges
                     if edge.kind == Edge.Kind.IF_OUT:
                         predecessor = predecessor.exit_if()
                     elif edge.kind == Edge.Kind.LOOP_OUT:
                         predecessor = predecessor.exit_loop()
-                    entry = entry.join(predecessor)
-                # widening
-                if isinstance(current, Loop) and self.widening < iteration:
-                    entry = deepcopy(previous).widening(entry)
+                    entry = self.join(cfg, current, entry, predecessor)
+                if descending and previous is not None:     # narrowing
+                    entry = self.narrow(cfg, current, previous, entry)
+                elif isinstance(current, Loop) and self.widening < iteration:   # widening
+                    entry = self.widen(cfg, current, previous, entry)
 
             # check for termination and execute block
-            if previous is None or not entry.less_equal(previous):
+            if descending:
+                execute = previous is None or not self.less_equal(cfg, current, previous, entry)
+            else:
+                execute = previous is None or not self.less_equal(cfg, current, entry, previous)
+            if execute:
                 states = deque([entry])
-                if isinstance(current, Basic):
+                skipped = self.skip(cfg, current, context, previous, entry)
+                if skipped is not None:
+                    states = skipped
+                elif isinstance(current, Basic):
                     successor = entry
 
                     if pre_result:     # a precursory analysis was run
@@ -168,7 +202,7 @@ class ForwardInterpreter(Interpreter):
 
                     for precursory, stmt in zip(pre_states, current.stmts):
                         successor = successor.before(stmt.pp, precursory)
-                        successor = self.semantics.semantics(stmt, deepcopy(successor), self)
+                        successor = self.execute(cfg, current, stmt, self.copy(successor))
                         states.append(successor)
                 elif isinstance(current, Loop):
                     # nothing to be done
@@ -178,6 +212,8 @@ class ForwardInterpreter(Interpreter):
                 for node in cfg.successors(current):
                     worklist.put(node)
                 iterations[current.identifier] = iteration + 1
+                self.visit(cfg, current, executed=True)
 
+        self.schedule(worklist)
         # print(states)
         return self.result
@@ -0,0 +1,187 @@
+"""
+Incremental Analysis
+====================
+
+Differences between two versions of a control flow graph,
+to reuse the result of a previous analysis after an edit of the analyzed program.
+
+Nodes of the two versions are matched by the program points and content of their statements,
+and by the conditions of their edges. A node is *changed* when it has no match in the previous
+version or its incoming (for forward analyses) or outgoing (for backward analyses) edges differ
+from those of its match. The result of the previous analysis remains valid for all nodes that
+do not depend on a changed node; all other nodes are *affected* and need to be re-analyzed.
+
+:Author: Caterina Urban
+"""
+
+from collections import defaultdict, deque
+from enum import Enum
+from typing import Dict, Hashable, Iterable, Set, Tuple
+
+from lyra.core.cfg import ControlFlowGraph, Node, Edge, Conditional
+from lyra.core.interning import Interned
+
+
+def _content(value) -> Hashable:
+    """Hashable representation of the content of a statement (or any part of it)."""
+    if value is None or isinstance(value, (bool, int, float, str, Enum)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_content(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_content(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((_content(k), _content(v)) for k, v in value.items())
+    if isinstance(value, Interned):
+        attributes = value.fields
+    else:
+        attributes = getattr(value, '__dict__', None)
+    if attributes is None:
+        return repr(value)
+    items = sorted((name, _content(item)) for name, item in attributes.items())
+    return (type(value).__name__,) + tuple(items)
+
+
+class ControlFlowGraphDiff:
+    """Differences between a previous and a current version of a control flow graph."""
+
+    def __init__(self, previous: ControlFlowGraph, current: ControlFlowGraph):
+        """Compute the differences between two versions of a control flow graph.
+
+        :param previous: previous version of the control flow graph
+        :param current: current version of the control flow graph
+        """
+        self._previous = previous
+        self._current = current
+        self._signatures: Dict[Tuple[int, int], Hashable] = dict()
+        self._matching: Dict[int, Node] = self._match()
+
+    @property
+    def previous(self):
+        return self._previous
+
+    @property
+    def current(self):
+        return self._current
+
+    @property
+    def matching(self) -> Dict[int, Node]:
+        """Mapping from (identifiers of) current nodes to the matching previous nodes."""
+        return self._matching
+
+    def _signature(self, node: Node) -> Hashable:
+        key = (id(node), node.identifier)
+        if key not in self._signatures:
+            stmts = tuple(_content(stmt) for stmt in node.stmts)
+            self._signatures[key] = (type(node).__name__, stmts)
+        return self._signatures[key]
+
+    def _edge(self, edge: Edge) -> Hashable:
+        condition = _content(edge.condition) if isinstance(edge, Conditional) else None
+        return type(edge).__name__, edge.kind, condition
+
+    def _neighbors(self, cfg: ControlFlowGraph, node: Node):
+        """Neighbors of a node (in both directions), grouped by edge and node signatures."""
+        groups = defaultdict(list)
+        for edge in cfg.out_edges(node):
+            groups[('out', self._edge(edge), self._signature(edge.target))].append(edge.target)
+        for edge in cfg.in_edges(node):
+            groups[('in', self._edge(edge), self._signature(edge.source))].append(edge.source)
+        return groups
+
+    def _match(self) -> Dict[int, Node]:
+        """Match the nodes of the two versions, starting from their entry and exit nodes.
+
+        Matching proceeds along edges as long as neighbors can be paired unambiguously.
+        Nodes that would be matched with different nodes along different paths stay unmatched.
+        """
+        previous, current = self.previous, self.current
+        matching: Dict[int, Node] = dict()
+        matched: Dict[int, int] = dict()     # reverse matching
+        conflicts: Set[int] = set()
+        pairs = deque([(current.in_node, previous.in_node), (current.out_node, previous.out_node)])
+        while pairs:
+            node, match = pairs.popleft()
+            if node.identifier in conflicts or self._signature(node) != self._signature(match):
+                continue
+            if node.identifier in matching or match.identifier in matched:
+                if matched.get(match.identifier) != node.identifier:  # ambiguous matching
+                    conflicts.add(node.identifier)
+                    conflicts.add(matched.get(match.identifier, node.identifier))
+                continue
+            matching[node.identifier] = match
+            matched[match.identifier] = node.identifier
+            neighbors = self._neighbors(current, node)
+            matches = self._neighbors(previous, match)
+            for key, nodes in neighbors.items():
+                if len(nodes) == 1 and len(matches.get(key, ())) == 1:
+                    pairs.append((nodes[0], matches[key][0]))
+        for identifier in conflicts:
+            matching.pop(identifier, None)
+        return matching
+
+    def _edges(self, cfg: ControlFlowGraph, node: Node, backward: bool, current: bool):
+        """Signatures of the edges a node depends on, with the matched identifiers of both ends."""
+        edges = set()
+        for edge in (cfg.out_edges(node) if backward else cfg.in_edges(node)):
+            other = edge.target if backward else edge.source
+            if current:
+                match = self.matching.get(other.identifier)
+                identifier = match.identifier if match is not None else None
+            else:
+                identifier = other.identifier
+            edges.add((self._edge(edge), identifier))
+        return edges
+
+    def changed(self, backward: bool = False) -> Set[Node]:
+        """Current nodes that are new or whose edges differ from those of their match.
+
+        :param backward: whether to consider outgoing (rather than incoming) edges
+        :return: set of changed nodes
+        """
+        changed = set()
+        for node in self.current.nodes.values():
+            match = self.matching.get(node.identifier)
+            if match is None:
+                changed.add(node)
+                continue
+            edges = self._edges(self.current, node, backward, True)
+            if None in (identifier for _, identifier in edges):
+                changed.add(node)
+            elif edges != self._edges(self.previous, match, backward, False):
+                changed.add(node)
+        return changed
+
+    def affected(self, backward: bool = False) -> Set[Node]:
+        """Current nodes whose analysis result may differ from that of their match.
+
+        :param backward: whether the analysis is backward
+        :return: set of changed nodes and nodes depending on them
+        """
+        affected, pending = set(), deque(self.changed(backward))
+        while pending:
+            node = pending.popleft()
+            if node not in affected:
+                affected.add(node)
+                neighbors = self.current.predecessors if backward else self.current.successors
+                pending.extend(neighbors(node))
+        return affected
+
+    def unchanged(self) -> bool:
+        """Whether the two versions of the control flow graph are equivalent."""
+        nodes = len(self.current.nodes) == len(self.previous.nodes)
+        return nodes and not self.changed() and not self.changed(backward=True)
+
+    def frontier(self, backward: bool = False) -> Iterable[Node]:
+        """Affected nodes from which the re-analysis needs to start.
+
+        :param backward: whether the analysis is backward
+        :return: affected nodes that are the start node of the analysis or
+            that immediately depend on nodes that are not affected
+        """
+        affected = self.affected(backward)
+        start = self.current.out_node if backward else self.current.in_node
+        neighbors = self.current.successors if backward else self.current.predecessors
+        for node in affected:
+            if node == start or any(n not in affected for n in neighbors(node)):
+                yield node
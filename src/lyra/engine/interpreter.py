@@ -6,16 +6,26 @@ Analysis Engine
 """
 
 from abc import ABCMeta, abstractmethod
-from typing import Dict
+from copy import deepcopy
+from typing import Dict, Iterable, List, Optional, Type
 
-from lyra.core.cfg import ControlFlowGraph
+from lyra.core.cfg import ControlFlowGraph, Node, Basic, Loop
+from lyra.core.statements import Statement
+from lyra.engine.incremental import ControlFlowGraphDiff
+from lyra.engine.profiling import Profile
 from lyra.engine.result import AnalysisResult
+from lyra.engine.sparse import Occurrences, changes, patch
+from lyra.engine.summaries import FunctionSummaries
+from lyra.engine.thresholds import thresholds
+from lyra.engine.worklist import Worklist, PriorityWorklist
 
 from lyra.abstract_domains.state import State
 
 
 class Interpreter(metaclass=ABCMeta):
-    def __init__(self, cfgs, fargs, semantics, widening, precursory=None):
+    def __init__(self, cfgs, fargs, semantics, widening, precursory=None,
+                 worklist: Type[Worklist] = PriorityWorklist, sparse: bool = False,
+                 thresholds: bool = False, narrowing: int = 0):
         """Control flow graph interpreter.
 
         :param cfgs: control flow graphs to analyze
@@ -23,12 +33,26 @@ class Interpreter(metaclass=ABCMeta):
         :param semantics: semantics of statements in the control flow graph
         :param widening: number of iterations before widening
         :param precursory: precursory control flow graph interpreter
+        :param worklist: type of worklist used to schedule the nodes to analyze
+        :param sparse: whether to skip the blocks unrelated to the changes of their incoming state
+        :param thresholds: whether to widen up to thresholds harvested from the analyzed program
+        :param narrowing: number of descending iterations (at each loop head) after widening
         """
         self._result = AnalysisResult(cfgs)
         self._fargs = fargs
         self._semantics = semantics
         self._widening: int = widening
         self._precursory: 'Interpreter' = precursory
+        self._worklist: Type[Worklist] = worklist
+        self._sparse: bool = sparse
+        self._thresholds: bool = thresholds
+        self._narrowing: int = narrowing
+        self._profile: Optional[Profile] = None
+        self._visits = 0
+        self._saved = 0
+        self._skipped = 0
+        # function summaries do not account for the result of a precursory analysis
+        self._summaries = None if precursory else FunctionSummaries()
 
     @property
     def cfgs(self):
@@ -54,11 +78,261 @@ class Interpreter(metaclass=ABCMeta):
     def precursory(self):
         return self._precursory
 
+    @property
+    def worklist(self):
+        return self._worklist
+
+    @worklist.setter
+    def worklist(self, worklist: Type[Worklist]):
+        self._worklist = worklist
+        if self.precursory:
+            self.precursory.worklist = worklist
+
+    @property
+    def sparse(self) -> bool:
+        """Whether blocks unrelated to the changes of their incoming state are skipped
+        (cf. :mod:`lyra.engine.sparse`)."""
+        return self._sparse
+
+    @sparse.setter
+    def sparse(self, sparse: bool):
+        self._sparse = sparse
+        if self.precursory:
+            self.precursory.sparse = sparse
+
+    @property
+    def thresholds(self) -> bool:
+        """Whether widening stops at thresholds harvested from the analyzed program
+        (cf. :mod:`lyra.engine.thresholds`)."""
+        return self._thresholds
+
+    @thresholds.setter
+    def thresholds(self, thresholds: bool):
+        self._thresholds = thresholds
+        if self.precursory:
+            self.precursory.thresholds = thresholds
+
+    @property
+    def narrowing(self) -> int:
+        """Number of descending iterations (at each loop head) after widening."""
+        return self._narrowing
+
+    @narrowing.setter
+    def narrowing(self, narrowing: int):
+        self._narrowing = narrowing
+        if self.precursory:
+            self.precursory.narrowing = narrowing
+
+    @property
+    def profile(self) -> Optional[Profile]:
+        """Fixpoint iteration profile (none by default, see :mod:`lyra.engine.profiling`)."""
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile: Optional[Profile]):
+        self._profile = profile
+        if self.precursory:
+            self.precursory.profile = profile
+
+    def function(self, cfg: ControlFlowGraph) -> str:
+        """Name of the function of a control flow graph ('<module>' for the main program)."""
+        return next((name for name, fcfg in self.cfgs.items() if fcfg is cfg), '') or '<module>'
+
+    def visit(self, cfg: ControlFlowGraph, node: Node, executed: bool = False):
+        """Record a visit of a node (when profiling).
+
+        :param cfg: control flow graph being analyzed
+        :param node: visited node
+        :param executed: whether the node was executed (i.e., its state changed)
+        """
+        if self.profile is not None:
+            if executed:
+                if isinstance(node, Loop):
+                    self.profile.iterate(self.function(cfg), node)
+            else:
+                self.profile.visit(self.function(cfg), node)
+
+    def copy(self, state: State) -> State:
+        """Copy of a state (counted when profiling).
+
+        :param state: state to be copied
+        :return: deep copy of the state
+        """
+        if self.profile is not None:
+            self.profile.copy()
+        return deepcopy(state)
+
+    def timed(self, cfg: ControlFlowGraph, node: Node, operation: str, method, *args):
+        """Perform an operation while analyzing a node (timed when profiling).
+
+        :param cfg: control flow graph being analyzed
+        :param node: node being analyzed
+        :param operation: name of the operation
+        :param method: operation to perform
+        :param args: arguments of the operation
+        :return: result of the operation
+        """
+        if self.profile is None:
+            return method(*args)
+        with self.profile.frame(self.function(cfg), node, operation):
+            return method(*args)
+
+    def execute(self, cfg: ControlFlowGraph, node: Node, stmt: Statement, state: State) -> State:
+        """Semantics of a statement (timed by type of statement when profiling).
+
+        :param cfg: control flow graph being analyzed
+        :param node: node being analyzed
+        :param stmt: statement to be executed
+        :param state: state before (resp. after, for backward analyses) the statement
+        :return: state modified by the statement
+        """
+        operation = 'semantics {}'.format(type(stmt).__name__)
+        return self.timed(cfg, node, operation, self.semantics.semantics, stmt, state, self)
+
+    def join(self, cfg: ControlFlowGraph, node: Node, state: State, other: State) -> State:
+        """Join between states while analyzing a node (timed when profiling)."""
+        return self.timed(cfg, node, 'join', state.join, other)
+
+    def less_equal(self, cfg: ControlFlowGraph, node: Node, state: State, other: State) -> bool:
+        """Comparison between states while analyzing a node (timed when profiling)."""
+        return self.timed(cfg, node, 'less_equal', state.less_equal, other)
+
+    def narrow(self, cfg: ControlFlowGraph, node: Node, previous: State, current: State) -> State:
+        """Narrowing between the previous and the current state of a node.
+
+        :param cfg: control flow graph being analyzed
+        :param node: node being analyzed
+        :param previous: previous state of the node
+        :param current: current state of the node
+        :return: narrowing between (a copy of) the previous state and the current state
+        """
+        return self.timed(cfg, node, 'narrowing', self.copy(previous).narrowing, current)
+
+    def widen(self, cfg: ControlFlowGraph, node: Node, previous: State, current: State) -> State:
+        """Widening between the previous and the current state of a loop head.
+
+        :param cfg: control flow graph being analyzed
+        :param node: loop head being analyzed
+        :param previous: previous state of the loop head
+        :param current: current state of the loop head
+        :return: widening between (a copy of) the previous state and the current state
+        """
+        state = self.copy(previous)
+        if self.thresholds:
+            bounds = thresholds(cfg)
+            widening = state.widening_with_thresholds
+            return self.timed(cfg, node, 'widening', widening, current, bounds)
+        return self.timed(cfg, node, 'widening', state.widening, current)
+
+    @property
+    def summaries(self) -> Optional[FunctionSummaries]:
+        """Summaries of the analyzed functions (none if they cannot be reused)."""
+        return self._summaries
+
+    @summaries.setter
+    def summaries(self, summaries: Optional[FunctionSummaries]):
+        self._summaries = summaries
+
+    @property
+    def visits(self):
+        """Number of node visits performed so far."""
+        return self._visits
+
+    @property
+    def saved(self):
+        """Number of node visits saved so far by the worklist."""
+        return self._saved
+
+    @property
+    def skipped(self):
+        """Number of block executions skipped so far by the sparse analysis."""
+        return self._skipped
+
+    def skip(self, cfg: ControlFlowGraph, node: Node, context: State,
+             previous: Optional[State], current: State) -> Optional[List[State]]:
+        """Result of a basic block for a new incoming state, without executing the block.
+
+        This is possible in sparse mode, when the incoming state only changed (with respect to
+        the previous incoming state) in variables that do not occur in the block.
+        Their new values are then copied into the previous result of the block.
+
+        :param cfg: control flow graph being analyzed
+        :param node: basic block to be analyzed
+        :param context: calling context of the analysis
+        :param previous: previous incoming state of the block
+        :param current: current incoming state of the block
+        :return: result of the block, or ``None`` if the block has to be executed
+        """
+        if not self.sparse or self.precursory or previous is None or not isinstance(node, Basic):
+            return None
+        names = Occurrences.of(cfg, self.cfgs).names(node)
+        if names is None:
+            return None
+        changed = changes(previous, current)
+        if changed is None or changed & names:
+            return None
+        states = [patch(self.copy(state), current, changed)
+                  for state in self.result.get_node_result(node)[context]]
+        if any(state is None for state in states):
+            return None
+        self._skipped += 1
+        return states
+
+    def schedule(self, worklist: Worklist):
+        """Record the node visits of a completed worklist.
+
+        :param worklist: worklist that has been emptied
+        """
+        self._visits += worklist.visits
+        self._saved += worklist.saved
+
+    @property
+    @abstractmethod
+    def backward(self) -> bool:
+        """Whether the interpreter analyzes control flow graphs backwards."""
+
     @abstractmethod
-    def analyze(self, cfg: ControlFlowGraph, initial: State) -> AnalysisResult:
+    def analyze(self, cfg: ControlFlowGraph, initial: State,
+                seeds: Iterable[Node] = None) -> AnalysisResult:
         """Run the analysis.
 
         :param cfg: control flow graph to analyze
         :param initial: initial analysis state
+        :param seeds: nodes to start the analysis from (by default, the start node of the graph)
+        :return: result of the analysis
+        """
+
+    def reanalyze(self, cfg: ControlFlowGraph, initial: State, previous: AnalysisResult,
+                  diffs: Dict[str, ControlFlowGraphDiff]) -> AnalysisResult:
+        """Run the analysis after an edit of the analyzed program,
+        reusing the result of a previous analysis of the program where it is still valid.
+
+        The previous result is reused only when the edit is confined to the analyzed
+        control flow graph and there is no precursory analysis. Otherwise, or when the previous
+        result was computed for a different initial state, the analysis is run from scratch.
+
+        :param cfg: control flow graph to analyze
+        :param initial: initial analysis state
+        :param previous: result of the previous analysis
+        :param diffs: differences between the previous and current version of each function
         :return: result of the analysis
         """
+        fname = next(name for name, fcfg in self.cfgs.items() if fcfg is cfg)
+        others = (diff.unchanged() for name, diff in diffs.items() if name != fname)
+        if self.precursory or set(diffs) != set(self.cfgs) or not all(others):
+            return self.analyze(cfg, initial)
+        context = deepcopy(initial)
+        affected = diffs[fname].affected(self.backward)
+        for name, diff in diffs.items():
+            for identifier, node in diff.current.nodes.items():
+                match = diff.matching.get(identifier)
+                results = previous.get_node_result(match) if match is not None else dict()
+                if name != fname:       # reuse the result for all calling contexts
+                    for ctx, states in results.items():
+                        self.result.set_node_result(node, ctx, states)
+                elif node not in affected:
+                    if context not in results:      # the previous result cannot be reused
+                        self.result.result.clear()
+                        return self.analyze(cfg, initial)
+                    self.result.set_node_result(node, context, results[context])
+        return self.analyze(cfg, initial, diffs[fname].frontier(self.backward))
@@ -25,3 +25,9 @@ class StrongLivenessAnalysis(LivenessAnalysis):
 
     def state(self):
         return StrongLivenessState(self.variables)
+
+
+class StrongLivenessAnalysisWithBitVectors(LivenessAnalysis):
+
+    def state(self):
+        return StrongLivenessState(self.variables, bitvectors=True)
@@ -24,6 +24,23 @@ class ForwardIntervalAnalysisWithSummarization(Runner):
         return IntervalStateWithSummarization(self.variables)
 
 
+class ForwardIntervalAnalysisWithThresholds(ForwardIntervalAnalysisWithSummarization):
+
+    def __init__(self):
+        super().__init__()
+        self.thresholds = True
+        self.narrowing = 2
+
+
+class ForwardIntervalAnalysisWithArrays(Runner):
+
+    def interpreter(self):
+        return ForwardInterpreter(self.cfgs, self.fargs, DefaultForwardSemantics(), 3)
+
+    def state(self):
+        return IntervalStateWithSummarization(self.variables, arrays=True)
+
+
 class ForwardIntervalAnalysisWithIndexing3(Runner):
 
     def interpreter(self):
@@ -52,6 +69,23 @@ class BackwardIntervalAnalysisWithSummarization(Runner):
         return IntervalStateWithSummarization(self.variables)
 
 
+class BackwardIntervalAnalysisWithThresholds(BackwardIntervalAnalysisWithSummarization):
+
+    def __init__(self):
+        super().__init__()
+        self.thresholds = True
+        self.narrowing = 2
+
+
+class BackwardIntervalAnalysisWithArrays(Runner):
+
+    def interpreter(self):
+        return BackwardInterpreter(self.cfgs, self.fargs, DefaultBackwardSemantics(), 3)
+
+    def state(self):
+        return IntervalStateWithSummarization(self.variables, arrays=True)
+
+
 class BackwardIntervalAnalysisWithIndexing3(Runner):
 
     def interpreter(self):
@@ -4,9 +4,11 @@ Octagon Analysis
 
 :Author: Caterina Urban
 """
-from lyra.abstract_domains.numerical.octagon_domain import OctagonStateWithSummarization
+from lyra.abstract_domains.numerical.octagon_domain import OctagonStateWithSummarization, \
+    OctagonStateWithPacking
 from lyra.engine.backward import BackwardInterpreter
 from lyra.engine.forward import ForwardInterpreter
+from lyra.engine.packing import Packing
 from lyra.engine.runner import Runner
 from lyra.semantics.backward import DefaultBackwardSemantics
 from lyra.semantics.forward import DefaultForwardSemantics
@@ -28,3 +30,21 @@ class BackwardOctagonAnalysis(Runner):
 
     def state(self):
         return OctagonStateWithSummarization(self.variables)
+
+
+class ForwardOctagonAnalysisWithPacking(ForwardOctagonAnalysis):
+    """Forward octagon analysis relating only variables that appear together
+    in a statement or condition of the analyzed function (or main program)."""
+
+    def state(self):
+        packs = Packing(self.cfgs[self.fname], self.variables).packs()
+        return OctagonStateWithPacking(self.variables, packs)
+
+
+class BackwardOctagonAnalysisWithPacking(BackwardOctagonAnalysis):
+    """Backward octagon analysis relating only variables that appear together
+    in a statement or condition of the analyzed function (or main program)."""
+
+    def state(self):
+        packs = Packing(self.cfgs[self.fname], self.variables).packs()
+        return OctagonStateWithPacking(self.variables, packs)
@@ -4,9 +4,11 @@ Polyhedra Analysis
 
 :Author: Caterina Urban
 """
-from lyra.abstract_domains.numerical.polyhedra_domain import PolyhedraStateWithSummarization
+from lyra.abstract_domains.numerical.polyhedra_domain import PolyhedraStateWithSummarization, \
+    PolyhedraStateWithPacking
 from lyra.engine.backward import BackwardInterpreter
 from lyra.engine.forward import ForwardInterpreter
+from lyra.engine.packing import Packing
 from lyra.engine.runner import Runner
 from lyra.semantics.backward import DefaultBackwardSemantics
 from lyra.semantics.forward import DefaultForwardSemantics
@@ -28,3 +30,21 @@ class BackwardPolyhedraAnalysis(Runner):
 
     def state(self):
         return PolyhedraStateWithSummarization(self.variables)
+
+
+class ForwardPolyhedraAnalysisWithPacking(ForwardPolyhedraAnalysis):
+    """Forward polyhedra analysis relating only variables that appear together
+    in a statement or condition of the analyzed function (or main program)."""
+
+    def state(self):
+        packs = Packing(self.cfgs[self.fname], self.variables).packs()
+        return PolyhedraStateWithPacking(self.variables, packs)
+
+
+class BackwardPolyhedraAnalysisWithPacking(BackwardPolyhedraAnalysis):
+    """Backward polyhedra analysis relating only variables that appear together
+    in a statement or condition of the analyzed function (or main program)."""
+
+    def state(self):
+        packs = Packing(self.cfgs[self.fname], self.variables).packs()
+        return PolyhedraStateWithPacking(self.variables, packs)
@@ -0,0 +1,86 @@
+"""
+Variable Packing
+================
+
+Partition of the variables of a program into packs of variables that are syntactically related,
+i.e., that appear together in a statement or in a condition of the control flow graph.
+
+Relational abstract domains can then only relate variables within the same pack,
+and the cost of their operations depends on the size of the packs
+rather than on the number of program variables.
+
+:Author: Caterina Urban
+"""
+
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Set
+
+from lyra.core.cfg import ControlFlowGraph, Conditional
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.statements import Statement
+
+
+class Packing:
+    """Partition of the variables of a control flow graph into packs of related variables."""
+
+    def __init__(self, cfg: ControlFlowGraph, variables: Iterable[VariableIdentifier] = None):
+        """Compute the packs of variables of a control flow graph.
+
+        :param cfg: control flow graph
+        :param variables: variables to partition (defaults to the variables of the graph),
+            variables unrelated to any other variable form a pack on their own
+        """
+        self._cfg = cfg
+        self._parent: Dict[str, str] = dict()     # union-find forest over variable names
+        for variable in (cfg.variables if variables is None else variables):
+            self._find(variable.name)
+        for node in cfg.nodes.values():
+            for stmt in node.stmts:
+                self._union({variable.name for variable in self._variables(stmt)})
+        for edge in cfg.edges.values():
+            if isinstance(edge, Conditional):
+                self._union({variable.name for variable in self._variables(edge.condition)})
+
+    @property
+    def cfg(self):
+        return self._cfg
+
+    def _find(self, name: str) -> str:
+        parent = self._parent.setdefault(name, name)
+        if parent != name:
+            parent = self._parent[name] = self._find(parent)    # path compression
+        return parent
+
+    def _union(self, names: Set[str]):
+        roots = sorted({self._find(name) for name in names})
+        for root in roots[1:]:
+            self._parent[root] = roots[0]
+
+    def _variables(self, value) -> Iterator[VariableIdentifier]:
+        """Variables accessed within (a part of) a statement."""
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                yield from self._variables(item)
+        elif isinstance(value, VariableIdentifier):
+            yield value
+        elif isinstance(value, Statement):
+            for item in vars(value).values():
+                yield from self._variables(item)
+
+    def pack(self, name: str) -> FrozenSet[str]:
+        """Pack of a variable.
+
+        :param name: name of the variable
+        :return: names of the variables in the same pack
+        """
+        root = self._find(name)
+        return frozenset(other for other in self._parent if self._find(other) == root)
+
+    def packs(self) -> List[FrozenSet[str]]:
+        """Packs of variables, ordered by their smallest variable name.
+
+        :return: list of packs of variable names
+        """
+        packs: Dict[str, Set[str]] = dict()
+        for name in self._parent:
+            packs.setdefault(self._find(name), set()).add(name)
+        return sorted((frozenset(pack) for pack in packs.values()), key=min)
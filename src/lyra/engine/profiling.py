@@ -0,0 +1,146 @@
+"""
+Fixpoint Profiling
+==================
+
+Instrumentation of the fixpoint iteration of an interpreter.
+
+A profile counts the visits of each node, the iterations of each loop head,
+the copies of states made by the interpreter, and the calls (and durations) of the
+lattice operations and of the semantics of each type of statement performed by the interpreter.
+Durations are recorded along stacks of frames (function, node, and operation),
+which nest when the semantics of a call analyzes the called function.
+
+A profile can be exported as JSON, or as collapsed stacks (in microseconds)
+to be rendered as a flame graph (e.g., by ``flamegraph.pl`` or speedscope).
+
+:Author: Caterina Urban
+"""
+
+import json
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, TextIO, Tuple
+
+from lyra.core.cfg import Node
+
+
+class Profile:
+    """Counters and timers of the fixpoint iteration of an interpreter.
+
+    The methods recording events can be overridden to act as callbacks.
+    """
+
+    def __init__(self):
+        self._visits: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self._iterations: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self._copies = 0
+        self._calls: Dict[str, int] = defaultdict(int)
+        self._durations: Dict[str, float] = defaultdict(float)
+        self._stacks: Dict[Tuple[str, ...], float] = defaultdict(float)
+        self._frames: List[str] = list()     # active frames
+        self._children: List[float] = list()  # time spent in the children of each active frame
+
+    @property
+    def visits(self) -> Dict[str, Dict[int, int]]:
+        """Number of visits of each node, by function."""
+        return self._visits
+
+    @property
+    def iterations(self) -> Dict[str, Dict[int, int]]:
+        """Number of iterations of each loop head, by function."""
+        return self._iterations
+
+    @property
+    def copies(self) -> int:
+        """Number of copies of states made by the interpreter."""
+        return self._copies
+
+    @property
+    def calls(self) -> Dict[str, int]:
+        """Number of calls of each operation (e.g., ``join`` or ``semantics Assignment``)."""
+        return self._calls
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        """Time (in seconds) spent in each operation, including nested operations."""
+        return self._durations
+
+    @property
+    def stacks(self) -> Dict[Tuple[str, ...], float]:
+        """Time (in seconds) spent in each stack of frames, excluding nested frames."""
+        return self._stacks
+
+    def visit(self, function: str, node: Node):
+        """Record a visit of a node.
+
+        :param function: name of the function the node belongs to
+        :param node: visited node
+        """
+        self._visits[function][node.identifier] += 1
+
+    def iterate(self, function: str, node: Node):
+        """Record an iteration of a loop head.
+
+        :param function: name of the function the loop head belongs to
+        :param node: loop head
+        """
+        self._iterations[function][node.identifier] += 1
+
+    def copy(self):
+        """Record a copy of a state."""
+        self._copies += 1
+
+    @contextmanager
+    def frame(self, function: str, node: Node, operation: str):
+        """Time an operation performed while analyzing a node.
+
+        :param function: name of the function the node belongs to
+        :param node: analyzed node
+        :param operation: performed operation
+        """
+        frames = (function, '{} {}'.format(type(node).__name__, node.identifier), operation)
+        self._frames.extend(frames)
+        self._children.append(0.0)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            children = self._children.pop()
+            self._stacks[tuple(self._frames)] += elapsed - children
+            del self._frames[-len(frames):]
+            if self._children:
+                self._children[-1] += elapsed
+            self._calls[operation] += 1
+            self._durations[operation] += elapsed
+
+    def json(self) -> Dict[str, Any]:
+        """JSON representation of the profile."""
+        return {
+            'visits': {f: dict(nodes) for f, nodes in self.visits.items()},
+            'iterations': {f: dict(nodes) for f, nodes in self.iterations.items()},
+            'copies': self.copies,
+            'operations': {operation: {'calls': calls, 'time': self.durations[operation]}
+                           for operation, calls in sorted(self.calls.items())}
+        }
+
+    def collapsed(self) -> Iterator[str]:
+        """Collapsed stacks of the profile (with times in microseconds)."""
+        for frames, elapsed in sorted(self.stacks.items()):
+            yield '{} {}'.format(';'.join(frames), round(elapsed * 1e6))
+
+    def dump(self, stream: TextIO):
+        """Write the JSON representation of the profile.
+
+        :param stream: text stream to write to
+        """
+        json.dump(self.json(), stream, indent=2)
+
+    def dump_collapsed(self, stream: TextIO):
+        """Write the collapsed stacks of the profile (e.g., to be rendered as a flame graph).
+
+        :param stream: text stream to write to
+        """
+        for line in self.collapsed():
+            stream.write(line + '\n')
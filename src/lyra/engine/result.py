@@ -40,6 +40,18 @@ class AnalysisResult:
             self.result[node] = dict()
         self.result[node][context] = states
 
+    def reuse(self, cfg: ControlFlowGraph, context: State, other: State) -> None:
+        """Reuse the analysis result of a control flow graph for a context in another context.
+
+        :param cfg: analyzed control flow graph
+        :param context: context of the analysis result to reuse
+        :param other: other context (for which the analysis result is also valid)
+        """
+        for node in cfg.nodes.values():
+            states = self.get_node_result(node).get(context)
+            if states is not None:
+                self.set_node_result(node, other, states)
+
     def __str__(self):
         """Analysis result string representation.
 
@@ -7,23 +7,26 @@ Program Analysis
 
 import ast
 import io
-import os
 import re
 import time
 import tokenize
 from abc import abstractmethod
 from math import inf
 from queue import Queue
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Type
 
 from lyra.core.cfg import Loop, ControlFlowGraph, Conditional, Edge, Node
 from lyra.core.expressions import VariableIdentifier, LengthIdentifier
 from lyra.core.statements import Assignment, VariableAccess, Call, TupleDisplayAccess
 from lyra.core.types import SequenceLyraType, ContainerLyraType
+from lyra.engine.incremental import ControlFlowGraphDiff
+from lyra.engine.profiling import Profile
 from lyra.engine.result import AnalysisResult
+from lyra.engine.sinks import Sink, ViewerSink, NoSink
+from lyra.engine.worklist import Worklist, PriorityWorklist
+from lyra.frontend.cache import FrontendCache
 from lyra.frontend.cfg_generator import ast_to_cfgs
 from lyra.frontend.cfg_generator import ast_to_fargs
-from lyra.visualization.graph_renderer import AnalysisResultRenderer
 
 
 class Runner:
@@ -35,6 +38,16 @@ class Runner:
         self._tree = None
         self._cfgs = None
         self._fargs = {}
+        self._sink: Sink = ViewerSink()
+        self._checking = True
+        self._sparse = False
+        self._thresholds = False
+        self._narrowing = 0
+        self._profile: Optional[Profile] = None
+        self._timing: Dict[str, float] = dict()
+        self._cache: Optional[FrontendCache] = None
+        self._result: Optional[AnalysisResult] = None
+        self._fname = ''
 
     @property
     def path(self):
@@ -54,6 +67,8 @@ class Runner:
 
     @property
     def tree(self):
+        if self._tree is None and self.source is not None:     # not parsed when cached
+            self._tree = ast.parse(self.source)
         return self._tree
 
     @tree.setter
@@ -76,6 +91,97 @@ class Runner:
     def fargs(self, fargs):
         self._fargs = fargs
 
+    @property
+    def result(self) -> Optional[AnalysisResult]:
+        """Result of the last analysis run."""
+        return self._result
+
+    @property
+    def cache(self) -> Optional[FrontendCache]:
+        """Cache of control flow graphs (none by default)."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: Optional[FrontendCache]):
+        self._cache = cache
+
+    @property
+    def sink(self) -> Sink:
+        """Output sink for the analysis result (by default, rendering to PDF and viewing it)."""
+        return self._sink
+
+    @sink.setter
+    def sink(self, sink: Sink):
+        self._sink = sink
+
+    @property
+    def checking(self) -> bool:
+        """Whether the analysis result is checked against the result comments in the program."""
+        return self._checking
+
+    @checking.setter
+    def checking(self, checking: bool):
+        self._checking = checking
+
+    @property
+    def timing(self) -> Dict[str, float]:
+        """Time (in seconds) spent analyzing, rendering, and checking during the last run."""
+        return self._timing
+
+    def headless(self, sink: Sink = None) -> 'Runner':
+        """Switch to headless execution, without opening a viewer or checking result comments.
+
+        :param sink: output sink for the analysis result (no output by default)
+        :return: current runner
+        """
+        self.sink = NoSink() if sink is None else sink
+        self.checking = False
+        return self
+
+    @property
+    def sparse(self) -> bool:
+        """Whether the analysis is sparse (cf. :mod:`lyra.engine.sparse`), which is only effective
+        for non-relational analyses (e.g., intervals, signs, types, usage, and liveness)."""
+        return self._sparse
+
+    @sparse.setter
+    def sparse(self, sparse: bool):
+        self._sparse = sparse
+
+    @property
+    def thresholds(self) -> bool:
+        """Whether widening stops at thresholds harvested from the numerical literals
+        of the analyzed program (cf. :mod:`lyra.engine.thresholds`)."""
+        return self._thresholds
+
+    @thresholds.setter
+    def thresholds(self, thresholds: bool):
+        self._thresholds = thresholds
+
+    @property
+    def narrowing(self) -> int:
+        """Number of descending iterations at each loop head after widening (none by default)."""
+        return self._narrowing
+
+    @narrowing.setter
+    def narrowing(self, narrowing: int):
+        self._narrowing = narrowing
+
+    @property
+    def profile(self) -> Optional[Profile]:
+        """Profile of the fixpoint iteration (none by default, cf. :mod:`lyra.engine.profiling`),
+        accumulated over all analysis runs."""
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile: Optional[Profile]):
+        self._profile = profile
+
+    @property
+    def worklist(self) -> Type[Worklist]:
+        """Type of worklist used by the interpreter to schedule the nodes to analyze."""
+        return PriorityWorklist
+
     @abstractmethod
     def interpreter(self):
         """Control flow graph interpreter."""
@@ -85,34 +191,113 @@ class Runner:
         """Initial analysis state."""
 
     @property
-    def variables(self, fname: str = '') -> Set[VariableIdentifier]:
-        return self.cfgs[fname].variables
+    def fname(self) -> str:
+        """Name of the analyzed function ('' for the main program)."""
+        return self._fname
 
-    def main(self, path):
+    @property
+    def variables(self) -> Set[VariableIdentifier]:
+        """Variables of the analyzed function (or main program), including its parameters."""
+        variables, formals = self.cfgs[self.fname].variables, self.fargs.get(self.fname)
+        return variables.union(formals) if formals else variables
+
+    def load(self, path):
+        """Parse a Python file and build the control flow graphs to analyze.
+
+        :param path: path of the Python file to analyze
+        """
         self.path = path
         with open(self.path, 'r') as source:
-            self.source = source.read()
-            self.tree = ast.parse(self.source)
+            self.parse(source.read())
+
+    def parse(self, source: str):
+        """Build the control flow graphs to analyze from the source of a Python program.
+
+        :param source: source of the Python program to analyze
+        """
+        self.source = source
+        self.tree = None
+        if self.cache is not None:
+            self.cfgs, self.fargs = self.cache.frontend(self.source)
+        else:
             self.cfgs: Dict[str, ControlFlowGraph] = ast_to_cfgs(self.tree)
             self.fargs: Dict[str, List[VariableIdentifier]] = ast_to_fargs(self.tree)
+
+    def main(self, path):
+        self.load(path)
         return self.run()
 
+    def analyze(self, fname: str = ''):
+        """Run the analysis only, without printing, rendering, or checking its result.
+
+        :param fname: name of the function to analyze ('' for the main program)
+        :return: analysis result and interpreter used to compute it
+        """
+        self._fname = fname
+        interpreter = self.interpreter()
+        interpreter.worklist = self.worklist
+        interpreter.sparse = self.sparse
+        interpreter.thresholds = self.thresholds
+        interpreter.narrowing = self.narrowing
+        interpreter.profile = self.profile
+        result = interpreter.analyze(self.cfgs[fname], self.state())
+        self._result = result
+        return result, interpreter
+
+    def reanalyze(self, source: str, fname: str = ''):
+        """Run the analysis again after an edit of the program,
+        re-analyzing only the nodes affected by the edit when possible.
+
+        :param source: edited source of the Python program
+        :param fname: name of the function to analyze ('' for the main program)
+        :return: analysis result and interpreter used to compute it
+        """
+        cfgs, previous = self.cfgs, self.result
+        self.parse(source)
+        if previous is None:
+            return self.analyze(fname)
+        self._fname = fname
+        diffs = dict()
+        for name, cfg in self.cfgs.items():
+            if name in cfgs:
+                diffs[name] = ControlFlowGraphDiff(cfgs[name], cfg)
+        interpreter = self.interpreter()
+        interpreter.worklist = self.worklist
+        interpreter.sparse = self.sparse
+        interpreter.thresholds = self.thresholds
+        interpreter.narrowing = self.narrowing
+        interpreter.profile = self.profile
+        result = interpreter.reanalyze(self.cfgs[fname], self.state(), previous, diffs)
+        self._result = result
+        return result, interpreter
+
     def run(self, fname: str = '') -> AnalysisResult:
+        self._timing = dict()
+        start = time.time()
+        result, interpreter = self.analyze(fname)
+        self.timing['analysis'] = time.time() - start
+        print('Time: {}s'.format(self.timing['analysis']))
+        print('Visits: {} ({} saved)'.format(interpreter.visits, interpreter.saved))
+        if interpreter.sparse:
+            print('Skipped: {}'.format(interpreter.skipped))
+        if self.profile is not None:
+            operations = ('join', 'widening', 'less_equal')
+            calls = ('{} {} ({}s)'.format(o, self.profile.calls[o], self.profile.durations[o])
+                     for o in operations)
+            print('Copies: {}, {}'.format(self.profile.copies, ', '.join(calls)))
         start = time.time()
-        result = self.interpreter().analyze(self.cfgs[fname], self.state())
-        end = time.time()
-        print('Time: {}s'.format(end - start))
         self.render(result)
-        self.check(result)
+        self.timing['rendering'] = time.time() - start
+        if self.checking:
+            start = time.time()
+            self.check(result)
+            self.timing['checking'] = time.time() - start
+        timing = self.timing.items()
+        print(', '.join('{} {}s'.format(phase.capitalize(), t) for phase, t in timing))
         return result
 
     def render(self, result):
-        renderer = AnalysisResultRenderer()
-        data = (self.cfgs, result)
-        name = os.path.splitext(os.path.basename(self.path))[0]
-        label = f"CFG with Analysis Result for {name}"
-        directory = os.path.dirname(self.path)
-        renderer.render(data, filename=name, label=label, directory=directory, view=True)
+        self.sink.write(self, result)
 
     def _expected_result(self):
         initial = re.compile('INITIAL:?\s*(?P<state>.*)')
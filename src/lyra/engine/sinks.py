@@ -0,0 +1,251 @@
+"""
+Output Sinks
+============
+
+Destinations for the result of an analysis run.
+
+:Author: Caterina Urban
+"""
+
+import json
+import os
+import sys
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, TextIO
+
+from lyra.core.utils import copy_docstring
+from lyra.engine.assumption.validator import specification
+from lyra.engine.export import dump_binary, dump_jsonl, dump_nodes
+from lyra.engine.result import AnalysisResult
+from lyra.visualization.graph_renderer import AnalysisResultRenderer
+
+
+class Sink(metaclass=ABCMeta):
+    """Output sink for analysis results."""
+
+    @abstractmethod
+    def write(self, runner, result: AnalysisResult):
+        """Output the result of an analysis run.
+
+        :param runner: analysis runner that computed the result
+        :param result: analysis result to output
+        """
+
+    @staticmethod
+    def name(runner) -> str:
+        """Name of the analyzed program."""
+        return os.path.splitext(os.path.basename(runner.path))[0]
+
+    @staticmethod
+    def label(runner) -> str:
+        """Label of the graphical representation of an analysis result."""
+        return f"CFG with Analysis Result for {Sink.name(runner)}"
+
+
+class NoSink(Sink):
+    """Sink discarding analysis results."""
+
+    @copy_docstring(Sink.write)
+    def write(self, runner, result: AnalysisResult):
+        pass
+
+
+class TextSink(Sink):
+    """Sink printing the textual representation of analysis results."""
+
+    def __init__(self, stream: TextIO = None):
+        """Create a text sink.
+
+        :param stream: text stream to print to (defaults to the standard output)
+        """
+        self._stream = stream
+
+    @copy_docstring(Sink.write)
+    def write(self, runner, result: AnalysisResult):
+        stream = self._stream or sys.stdout
+        stream.write(f"{result}\n")
+
+
+class JSONSink(Sink):
+    """Sink writing analysis results as a JSON document.
+
+    The document maps each function name ('' for the main program) to the results
+    of the analysis for each node of its control flow graph, i.e.,
+    the list of states before and after each statement of the node, for each calling context.
+    """
+
+    def __init__(self, directory: str = None):
+        """Create a JSON sink.
+
+        :param directory: directory where to write the document (defaults to that of the program)
+        """
+        self._directory = directory
+
+    @staticmethod
+    def document(runner, result: AnalysisResult) -> Dict[str, Any]:
+        """JSON document representing an analysis result.
+
+        :param runner: analysis runner that computed the result
+        :param result: analysis result to represent
+        :return: JSON document
+        """
+        functions = dict()
+        for fname, cfg in result.cfgs.items():
+            nodes = dict()
+            for node in cfg.nodes.values():
+                results = result.get_node_result(node)
+                states = [[str(state) for state in ctx] for ctx in results.values()]
+                nodes[str(node.identifier)] = states
+            functions[fname] = nodes
+        return {'path': runner.path, 'analysis': type(runner).__name__, 'result': functions}
+
+    @copy_docstring(Sink.write)
+    def write(self, runner, result: AnalysisResult):
+        directory = os.path.dirname(runner.path) if self._directory is None else self._directory
+        with open(os.path.join(directory, f"{self.name(runner)}.json"), 'w') as document:
+            json.dump(self.document(runner, result), document)
+
+
+class JSONLinesSink(Sink):
+    """Sink streaming analysis results as JSON Lines, one record per node and edge.
+
+    The result can be loaded back, one record or node at a time, by a ``ResultLoader``.
+    """
+
+    def __init__(self, directory: str = None):
+        """Create a JSON Lines sink.
+
+        :param directory: directory where to write the records (defaults to that of the program)
+        """
+        self._directory = directory
+
+    @copy_docstring(Sink.write)
+    def write(self, runner, result: AnalysisResult):
+        directory = os.path.dirname(runner.path) if self._directory is None else self._directory
+        path = os.path.join(directory, f"{self.name(runner)}.jsonl")
+        with open(path, 'w', encoding='utf-8') as stream:
+            dump_jsonl(result, stream, runner)
+
+
+class BinarySink(Sink):
+    """Sink streaming analysis results in a compact binary format,
+    indexed by node and by program point.
+
+    The result can be loaded back, one record or node at a time, by a ``ResultLoader``.
+    """
+
+    def __init__(self, directory: str = None):
+        """Create a binary sink.
+
+        :param directory: directory where to write the records (defaults to that of the program)
+        """
+        self._directory = directory
+
+    @copy_docstring(Sink.write)
+    def write(self, runner, result: AnalysisResult):
+        directory = os.path.dirname(runner.path) if self._directory is None else self._directory
+        with open(os.path.join(directory, f"{self.name(runner)}.lyra"), 'wb') as stream:
+            dump_binary(result, stream, runner)
+
+
+class ValidatorSink(Sink):
+    """Sink writing the assumption on the input data inferred by an assumption analysis
+    as the JSON specification of a validator of the input data of the program.
+    """
+
+    def __init__(self, directory: str = None):
+        """Create a validator sink.
+
+        :param directory: directory where to write the specification
+            (defaults to that of the program)
+        """
+        self._directory = directory
+
+    @staticmethod
+    def document(runner, result: AnalysisResult) -> Dict[str, Any]:
+        """JSON specification of the assumption on the input data of the analyzed program.
+
+        :param runner: assumption analysis runner that computed the result
+        :param result: analysis result at the beginning of the program
+        :return: JSON document
+        """
+        states = next(iter(result.get_node_result(result.cfgs[''].in_node).values()))
+        assumption = specification(states[0])
+        return {'path': runner.path, 'analysis': type(runner).__name__, 'assumption': assumption}
+
+    @copy_docstring(Sink.write)
+    def write(self, runner, result: AnalysisResult):
+        directory = os.path.dirname(runner.path) if self._directory is None else self._directory
+        with open(os.path.join(directory, f"{self.name(runner)}.validator.json"), 'w') as document:
+            json.dump(self.document(runner, result), document, indent=2)
+
+
+class DOTSink(Sink):
+    """Sink writing the Graphviz DOT source of analysis results, without computing its layout.
+
+    The nodes are clustered by function and by loop, and the state labels are shortened and
+    limited to a total budget of characters (beyond which the states are omitted),
+    so that the source remains small enough to be laid out for large programs.
+    """
+
+    def __init__(self, directory: str = None, budget: int = 100000, length: int = 500):
+        """Create a DOT sink.
+
+        :param directory: directory where to write the source (defaults to that of the program)
+        :param budget: maximum total length of the state labels (``None`` for unlimited)
+        :param length: maximum length of each state label (``None`` for unlimited)
+        """
+        self._directory = directory
+        self._budget = budget
+        self._length = length
+
+    def renderer(self) -> AnalysisResultRenderer:
+        """Renderer of the analysis results."""
+        return AnalysisResultRenderer(clusters=True, budget=self._budget, length=self._length)
+
+    @copy_docstring(Sink.write)
+    def write(self, runner, result: AnalysisResult):
+        directory = os.path.dirname(runner.path) if self._directory is None else self._directory
+        data = (runner.cfgs, result)
+        self.renderer().save(data, self.label(runner), self.name(runner), directory)
+
+
+class HTMLSink(DOTSink):
+    """Sink writing an interactive HTML view of analysis results, laid out in the browser.
+
+    The states of each node are loaded on demand from the node records of the results,
+    written alongside the view in a separate JSON file per node
+    (the view thus needs to be served over HTTP, e.g., by ``http.server``).
+    """
+
+    @copy_docstring(Sink.write)
+    def write(self, runner, result: AnalysisResult):
+        directory = os.path.dirname(runner.path) if self._directory is None else self._directory
+        name = self.name(runner)
+        dump_nodes(result, os.path.join(directory, f"{name}.nodes"), runner)
+        data = (runner.cfgs, result)
+        self.renderer().save_html(data, self.label(runner), name, directory, f"{name}.nodes")
+
+
+class ViewerSink(Sink):
+    """Sink rendering analysis results to PDF and opening them in a viewer."""
+
+    @copy_docstring(Sink.write)
+    def write(self, runner, result: AnalysisResult):
+        directory = os.path.dirname(runner.path)
+        data = (runner.cfgs, result)
+        label, name = self.label(runner), self.name(runner)
+        AnalysisResultRenderer().render(data, label, name, directory, view=True)
+
+
+sinks = {
+    'none': NoSink,
+    'text': TextSink,
+    'json': JSONSink,
+    'jsonl': JSONLinesSink,
+    'binary': BinarySink,
+    'validator': ValidatorSink,
+    'dot': DOTSink,
+    'html': HTMLSink,
+    'pdf': ViewerSink
+}
@@ -0,0 +1,166 @@
+"""
+Sparse Analysis
+===============
+
+Sparse fixpoint iteration for non-relational abstract domains.
+
+In a non-relational state, the value of a variable can only be changed by the statements
+in which the variable occurs. When the state flowing into a basic block only changes
+in variables that do not occur in the block, the new values of these variables
+flow unchanged through the block: they are copied into the previous result of the block,
+which is not executed again. Values thus flow directly from the statements defining them
+to the statements using them, skipping the unrelated blocks in between.
+
+.. note::
+    Only states that are stores (or stacks of stores) are analyzed sparsely.
+    Other states, as well as blocks containing calls to user-defined functions,
+    returns, or raises, are always executed.
+
+:Author: Caterina Urban
+"""
+
+from copy import deepcopy
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set
+from weakref import WeakKeyDictionary
+
+from lyra.abstract_domains.assumption.assumption_domain import InputMixin
+from lyra.abstract_domains.lattice import KindMixin
+from lyra.abstract_domains.stack import Stack
+from lyra.abstract_domains.state import State
+from lyra.abstract_domains.store import Store
+from lyra.core.cfg import ControlFlowGraph, Node
+from lyra.core.expressions import Identifier, VariableIdentifier, LengthIdentifier, \
+    KeysIdentifier, ValuesIdentifier
+from lyra.core.statements import Statement, Call, Return, Raise
+
+
+class Occurrences:
+    """Variables occurring in the basic blocks of a control flow graph."""
+
+    _occurrences = WeakKeyDictionary()  # cached occurrences of control flow graphs
+
+    def __init__(self, cfg: ControlFlowGraph, functions: Iterable[str]):
+        """Collect the variables occurring in each basic block of a control flow graph.
+
+        :param cfg: control flow graph
+        :param functions: names of the user-defined functions
+        """
+        self._cfg = cfg
+        self._functions = frozenset(functions)
+        self._names: Dict[int, Optional[FrozenSet[str]]] = dict()
+        for identifier, node in cfg.nodes.items():
+            self._names[identifier] = self._collect(node.stmts)
+
+    @classmethod
+    def of(cls, cfg: ControlFlowGraph, functions: Iterable[str]) -> 'Occurrences':
+        """Variables occurring in the basic blocks of a control flow graph (collected only once).
+
+        :param cfg: control flow graph
+        :param functions: names of the user-defined functions
+        :return: variables occurring in the basic blocks of the control flow graph
+        """
+        occurrences = cls._occurrences.get(cfg)
+        if occurrences is None:
+            occurrences = cls._occurrences[cfg] = Occurrences(cfg, functions)
+        return occurrences
+
+    @property
+    def cfg(self):
+        return self._cfg
+
+    def _walk(self, value) -> Iterator:
+        """Statements and variables within (a part of) a statement."""
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                yield from self._walk(item)
+        elif isinstance(value, VariableIdentifier):
+            yield value
+        elif isinstance(value, Statement):
+            yield value
+            for item in vars(value).values():
+                yield from self._walk(item)
+
+    def _collect(self, stmts: List[Statement]) -> Optional[FrozenSet[str]]:
+        names = set()
+        for item in self._walk(stmts):
+            if isinstance(item, (Return, Raise)):
+                return None
+            if isinstance(item, Call) and item.name in self._functions:
+                return None
+            if isinstance(item, VariableIdentifier):
+                names.add(item.name)
+        return frozenset(names)
+
+    def names(self, node: Node) -> Optional[FrozenSet[str]]:
+        """Names of the variables occurring in a node.
+
+        :param node: node of the control flow graph
+        :return: names of the variables, or ``None`` if the node always has to be executed
+        """
+        return self._names.get(node.identifier)
+
+
+def _name(identifier: Identifier) -> str:
+    """Name of the variable a store key refers to (e.g., ``x`` for the length of ``x``)."""
+    if isinstance(identifier, (LengthIdentifier, KeysIdentifier, ValuesIdentifier)):
+        if isinstance(identifier.expression, Identifier):
+            return _name(identifier.expression)
+    return identifier.name
+
+
+def _stores(state: State) -> Optional[List[Store]]:
+    """Stores making up a state, or ``None`` if the state cannot be analyzed sparsely."""
+    if isinstance(state, InputMixin):
+        return None
+    if isinstance(state, Store):
+        return [state]
+    if isinstance(state, Stack) and state.kind == KindMixin.Kind.DEFAULT:
+        if all(isinstance(store, Store) for store in state.stack):
+            return state.stack
+    return None
+
+
+def changes(previous: State, current: State) -> Optional[Set[str]]:
+    """Variables whose value differs between two states.
+
+    :param previous: previous state
+    :param current: current state
+    :return: names of the variables, or ``None`` if the states cannot be compared variable-wise
+    """
+    mine, theirs = _stores(previous), _stores(current)
+    if mine is None or theirs is None or len(mine) != len(theirs):
+        return None
+    if previous.is_bottom() or current.is_bottom():
+        return None
+    names = set()
+    for old, new in zip(mine, theirs):
+        for left, right in old._mappings(new):
+            if len(left) != len(right):
+                return None
+            for key in right:
+                if key not in left:
+                    return None
+                if old._peek(left, key) != new._peek(right, key):
+                    names.add(_name(key))
+    return names
+
+
+def patch(state: State, source: State, names: Set[str]) -> Optional[State]:
+    """Copy the values of some variables from a state into another state.
+
+    :param state: state to be modified (left untouched if it is bottom)
+    :param source: state to copy the values from
+    :param names: names of the variables whose values to copy
+    :return: current state modified, or ``None`` if the state cannot be modified variable-wise
+    """
+    if state.is_bottom():
+        return state
+    targets, stores = _stores(state), _stores(source)
+    if targets is None or stores is None or len(targets) != len(stores):
+        return None
+    for target, store in zip(targets, stores):
+        for left, right in target._mappings(store):
+            for key in right:
+                if key in left and _name(key) in names:
+                    left[key] = deepcopy(store._peek(right, key))
+    return state
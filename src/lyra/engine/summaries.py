@@ -0,0 +1,159 @@
+"""
+Function Summaries
+==================
+
+Summaries of user-defined functions, reused across call sites and fixpoint iterations.
+
+A summary maps the state at the start of the analysis of a function
+(i.e., before its entry for forward analyses, or after its exit for backward analyses)
+to the state at its end. A summary computed for a state also applies to any smaller state:
+by monotonicity of the analysis, its result over-approximates the result for the smaller state.
+In this case, the analysis result of the function for the larger state
+can also be recorded as its result for the smaller state (see ``reuse`` below).
+
+:Author: Caterina Urban
+"""
+
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Callable, Hashable, List, Optional, Tuple
+
+from lyra.abstract_domains.state import State
+from lyra.abstract_domains.store import Store
+
+
+class FunctionSummaries:
+    """Bounded table of function summaries, with least recently used eviction."""
+
+    def __init__(self, capacity: int = 256, subsumption: bool = True):
+        """Create a table of function summaries.
+
+        :param capacity: maximum number of summaries kept in the table
+        :param subsumption: whether to reuse the summaries of larger states
+        """
+        self._capacity = capacity
+        self._subsumption = subsumption
+        self._summaries: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._calls: List[List] = list()     # functions being analyzed, and whether recursively
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def subsumption(self):
+        return self._subsumption
+
+    @property
+    def hits(self):
+        """Number of lookups answered by a summary."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Number of lookups not answered by any summary."""
+        return self._misses
+
+    def __len__(self):
+        return len(self._summaries)
+
+    @staticmethod
+    def _signature(state: State) -> Hashable:
+        """Parts of a state that must coincide for a summary to apply to it.
+
+        These are the result of the state (which is not part of its lattice element)
+        and its environment (since comparing states with different environments unifies them,
+        and the summary of a state with a larger environment would extend the environment).
+        """
+        if isinstance(state, Store):
+            environment = frozenset(state.variables)
+        else:
+            environment = getattr(state, 'environment', None)
+            environment = None if environment is None else repr(environment)
+        return frozenset(state.result), environment
+
+    def _key(self, fname: str, state: State) -> Tuple[str, Hashable, State]:
+        return fname, self._signature(state), state
+
+    def lookup(self, fname: str, state: State,
+               reuse: Callable[[State], None] = None) -> Optional[State]:
+        """Retrieve the summary of a function for a given state.
+
+        A summary computed for exactly the given state is preferred.
+        Otherwise, the most recently used summary computed for a larger state (if any) is used.
+
+        :param fname: name of the function
+        :param state: state at the start of the analysis of the function
+        :param reuse: called with the larger state, when its summary is used for the given state
+        :return: state at the end of the analysis of the function (``None`` if no summary applies)
+        """
+        key = self._key(fname, state)
+        summary = self._summaries.get(key)
+        if summary is None and self.subsumption:
+            for (name, signature, entry), candidate in reversed(self._summaries.items()):
+                if name != fname or signature != key[1]:
+                    continue
+                # comparing (parts of) states may unify, i.e., modify, their environments
+                if deepcopy(state).less_equal(deepcopy(entry)):
+                    key, summary = (name, signature, entry), candidate
+                    if reuse is not None:
+                        reuse(entry)
+                    break
+        if summary is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._summaries.move_to_end(key)
+        return deepcopy(summary)
+
+    def store(self, fname: str, state: State, summary: State):
+        """Record the summary of a function for a given state,
+        evicting the least recently used summary if the table is full.
+
+        :param fname: name of the function
+        :param state: state at the start of the analysis of the function
+        :param summary: state at the end of the analysis of the function
+        """
+        key = self._key(fname, deepcopy(state))
+        self._summaries[key] = deepcopy(summary)
+        self._summaries.move_to_end(key)
+        while len(self._summaries) > self.capacity:
+            self._summaries.popitem(last=False)
+
+    def summary(self, fname: str, state: State, analyze: Callable[[], State],
+                reuse: Callable[[State], None] = None) -> State:
+        """Summary of a function for a given state, analyzing the function if no summary applies.
+
+        The result of the analysis of a function is not recorded as a summary when
+        the function is (directly or indirectly) recursive, since the analysis of a recursive call
+        only sees the partial result of the enclosing analysis of the function.
+
+        :param fname: name of the function
+        :param state: state at the start of the analysis of the function
+        :param analyze: analysis of the function from the given state
+        :param reuse: called with the larger state, when its summary is used for the given state
+        :return: state at the end of the analysis of the function
+        """
+        summary = self.lookup(fname, state, reuse)
+        if summary is not None:
+            return summary
+        names = [name for name, _ in self._calls]
+        recursive = fname in names
+        if recursive:
+            for call in self._calls[names.index(fname):]:
+                call[1] = True
+        call = [fname, recursive]
+        self._calls.append(call)
+        try:
+            summary = analyze()
+        finally:
+            self._calls.pop()
+        if not call[1]:
+            self.store(fname, state, summary)
+        return deepcopy(summary)
+
+    def clear(self):
+        """Remove all summaries from the table."""
+        self._summaries.clear()
@@ -0,0 +1,66 @@
+"""
+Widening Thresholds
+===================
+
+Thresholds for widening, harvested from the numerical literals of a control flow graph.
+
+Widening with thresholds stops unstable bounds at the closest threshold,
+rather than at infinity. The thresholds include each literal, its negation,
+and their successors and predecessors (to account for strict and non-strict comparisons).
+
+:Author: Caterina Urban
+"""
+
+from typing import Iterator, List
+from weakref import WeakKeyDictionary
+
+from lyra.core.cfg import ControlFlowGraph
+from lyra.core.expressions import Literal
+from lyra.core.statements import Statement, LiteralEvaluation
+from lyra.core.types import IntegerLyraType, FloatLyraType
+
+_thresholds = WeakKeyDictionary()   # cached thresholds of control flow graphs
+
+
+def _walk(value) -> Iterator[Literal]:
+    """Literals within (a part of) a statement."""
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _walk(item)
+    elif isinstance(value, LiteralEvaluation):
+        yield value.literal
+    elif isinstance(value, Statement):
+        for item in vars(value).values():
+            yield from _walk(item)
+
+
+def _value(literal: Literal):
+    """Numerical value of a literal (``None`` for non-numerical literals)."""
+    try:
+        if isinstance(literal.typ, IntegerLyraType):
+            return int(literal.val)
+        if isinstance(literal.typ, FloatLyraType):
+            return float(literal.val)
+    except ValueError:
+        pass
+    return None
+
+
+def thresholds(cfg: ControlFlowGraph) -> List:
+    """Widening thresholds of a control flow graph (harvested once per graph).
+
+    :param cfg: control flow graph
+    :return: sorted thresholds
+    """
+    harvested = _thresholds.get(cfg)
+    if harvested is None:
+        stmts = [node.stmts for node in cfg.nodes.values()]
+        stmts.extend(getattr(edge, 'condition', None) for edge in cfg.edges.values())
+        values = {0}
+        for literal in _walk(stmts):
+            value = _value(literal)
+            if value is not None:
+                values.update((value, -value))
+        harvested = sorted({value + delta for value in values for delta in (-1, 0, 1)})
+        _thresholds[cfg] = harvested
+    return harvested
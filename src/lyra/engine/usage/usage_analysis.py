@@ -18,3 +18,9 @@ class SimpleUsageAnalysis(Runner):
 
     def state(self):  # initial state
         return SimpleUsageState(self.variables)
+
+
+class SimpleUsageAnalysisWithBitVectors(SimpleUsageAnalysis):
+
+    def state(self):  # initial state
+        return SimpleUsageState(self.variables, bitvectors=True)
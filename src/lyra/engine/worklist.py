@@ -0,0 +1,263 @@
+"""
+Worklist Scheduling
+===================
+
+Scheduling strategies for the nodes of a control flow graph during a fixpoint computation.
+
+:Author: Caterina Urban
+"""
+
+import heapq
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from math import inf
+from typing import Dict, List, Set, Union
+from weakref import WeakKeyDictionary
+
+from lyra.core.cfg import ControlFlowGraph, Node
+
+
+class WeakTopologicalOrder:
+    """Weak topological order of the nodes of a control flow graph.
+
+    A weak topological order is a hierarchical ordering of the nodes of a graph in which
+    every strongly connected component is a subsequence headed by its entry node
+    (cf. F. Bourdoncle, Efficient Chaotic Iteration Strategies with Widenings, 1993).
+    Components are represented as lists whose first element is their head.
+    """
+
+    Component = List[Union[Node, 'Component']]
+
+    def __init__(self, cfg: ControlFlowGraph, backward: bool = False):
+        """Compute the weak topological order of a control flow graph.
+
+        :param cfg: control flow graph to be ordered
+        :param backward: whether the order should follow the edges of the graph backwards
+        """
+        self._cfg = cfg
+        self._backward = backward
+        self._components: WeakTopologicalOrder.Component = list()
+        self._dfn: Dict[Node, Union[int, float]] = dict()
+        self._stack: List[Node] = list()
+        self._num = 0
+        entry = cfg.out_node if backward else cfg.in_node
+        self._run(self._visit(entry, self._components))
+        self._positions: Dict[int, int] = dict()
+        self._heads: Set[int] = set()
+        self._flatten(self._components)
+
+    @property
+    def components(self):
+        """Hierarchical ordering of the nodes."""
+        return self._components
+
+    @property
+    def positions(self):
+        """Position of each node (identifier) in the flattened ordering."""
+        return self._positions
+
+    @property
+    def heads(self):
+        """Identifiers of the heads of the components."""
+        return self._heads
+
+    def position(self, node: Node) -> Union[int, float]:
+        """Position of a node in the flattened ordering.
+
+        :param node: node of the control flow graph
+        :return: position of the node (infinity if the node is unreachable)
+        """
+        return self.positions.get(node.identifier, inf)
+
+    def _successors(self, node: Node) -> List[Node]:
+        if self._backward:
+            neighbors = self._cfg.predecessors(node)
+        else:
+            neighbors = self._cfg.successors(node)
+        return sorted(neighbors, key=lambda n: n.identifier)
+
+    @staticmethod
+    def _run(generator):
+        """Drive a (nested) generator-based recursion without growing the Python call stack.
+
+        Generators yield the sub-generators they want to call and receive their result.
+        """
+        calls, value = [generator], None
+        while calls:
+            try:
+                callee = calls[-1].send(value)
+                calls.append(callee)
+                value = None
+            except StopIteration as ret:
+                calls.pop()
+                value = ret.value
+        return value
+
+    def _visit(self, vertex: Node, partition: Component):
+        self._stack.append(vertex)
+        self._num += 1
+        self._dfn[vertex] = self._num
+        head, loop = self._num, False
+        for successor in self._successors(vertex):
+            if self._dfn.get(successor, 0) == 0:
+                minimum = yield self._visit(successor, partition)
+            else:
+                minimum = self._dfn[successor]
+            if minimum <= head:
+                head, loop = minimum, True
+        if head == self._dfn[vertex]:
+            self._dfn[vertex] = inf
+            element = self._stack.pop()
+            if loop:
+                while element != vertex:
+                    self._dfn[element] = 0
+                    element = self._stack.pop()
+                component = yield self._component(vertex)
+                partition.insert(0, component)
+            else:
+                partition.insert(0, vertex)
+        return head
+
+    def _component(self, vertex: Node):
+        partition: WeakTopologicalOrder.Component = list()
+        for successor in self._successors(vertex):
+            if self._dfn.get(successor, 0) == 0:
+                yield self._visit(successor, partition)
+        return [vertex] + partition
+
+    def _flatten(self, components: Component):
+        for element in components:
+            if isinstance(element, list):
+                self._heads.add(element[0].identifier)
+                self._flatten(element)
+            else:
+                self._positions[element.identifier] = len(self._positions)
+
+    def __str__(self):
+        def _str(components):
+            return " ".join(f"({_str(c)})" if isinstance(c, list) else str(c) for c in components)
+        return _str(self.components)
+
+
+class Worklist(metaclass=ABCMeta):
+    """Worklist of control flow graph nodes still to be analyzed."""
+
+    def __init__(self, cfg: ControlFlowGraph, backward: bool = False):
+        """Worklist construction.
+
+        :param cfg: control flow graph being analyzed
+        :param backward: whether the analysis is backward
+        """
+        self._cfg = cfg
+        self._backward = backward
+        self._visits = 0
+        self._saved = 0
+
+    @property
+    def cfg(self):
+        return self._cfg
+
+    @property
+    def backward(self):
+        return self._backward
+
+    @property
+    def visits(self):
+        """Number of nodes retrieved from the worklist so far."""
+        return self._visits
+
+    @property
+    def saved(self):
+        """Number of node visits saved by not scheduling already pending nodes."""
+        return self._saved
+
+    @abstractmethod
+    def put(self, node: Node):
+        """Schedule a node for (re-)analysis.
+
+        :param node: node to be scheduled
+        """
+
+    @abstractmethod
+    def _get(self) -> Node:
+        """Remove the next node from the worklist.
+
+        :return: next node to be analyzed
+        """
+
+    def get(self) -> Node:
+        """Retrieve the next node to be analyzed.
+
+        :return: next node to be analyzed
+        """
+        self._visits += 1
+        return self._get()
+
+    @abstractmethod
+    def empty(self) -> bool:
+        """Test whether there are no more nodes to be analyzed.
+
+        :return: whether the worklist is empty
+        """
+
+
+class FIFOWorklist(Worklist):
+    """First-in first-out worklist, scheduling a node every time it is put."""
+
+    def __init__(self, cfg: ControlFlowGraph, backward: bool = False):
+        super().__init__(cfg, backward)
+        self._queue = deque()
+
+    def put(self, node: Node):
+        self._queue.append(node)
+
+    def _get(self) -> Node:
+        return self._queue.popleft()
+
+    def empty(self) -> bool:
+        return not self._queue
+
+
+class PriorityWorklist(Worklist):
+    """Worklist ordered by the weak topological order of the control flow graph.
+
+    Nodes that are already pending are not scheduled again
+    and inner loops are stabilized before the nodes following them are analyzed.
+    """
+
+    _orders = WeakKeyDictionary()  # cached weak topological orders of control flow graphs
+
+    def __init__(self, cfg: ControlFlowGraph, backward: bool = False):
+        super().__init__(cfg, backward)
+        self._order = self.order(cfg, backward)
+        self._heap = list()
+        self._pending: Set[int] = set()
+
+    @classmethod
+    def order(cls, cfg: ControlFlowGraph, backward: bool = False) -> WeakTopologicalOrder:
+        """Weak topological order of a control flow graph (computed once per graph).
+
+        :param cfg: control flow graph to be ordered
+        :param backward: whether the order should follow the edges of the graph backwards
+        :return: weak topological order of the control flow graph
+        """
+        orders = cls._orders.setdefault(cfg, dict())
+        if backward not in orders:
+            orders[backward] = WeakTopologicalOrder(cfg, backward)
+        return orders[backward]
+
+    def put(self, node: Node):
+        if node.identifier in self._pending:
+            self._saved += 1
+        else:
+            self._pending.add(node.identifier)
+            priority = (self._order.position(node), node.identifier)
+            heapq.heappush(self._heap, (priority, node))
+
+    def _get(self) -> Node:
+        _, node = heapq.heappop(self._heap)
+        self._pending.remove(node.identifier)
+        return node
+
+    def empty(self) -> bool:
+        return not self._heap
@@ -0,0 +1,149 @@
+"""
+Frontend Cache
+==============
+
+Persistent content-addressed cache of the control flow graphs generated from Python programs.
+
+Cache entries are keyed by a hash of the program source, the version of Lyra,
+the version of Python (which determines the parsed AST), and a fingerprint of the frontend,
+i.e., a hash of the sources of the control flow graph generator and of the core modules
+defining the classes of the generated control flow graphs.
+Thus, entries produced by a different frontend are never looked up
+(but they are not removed from the cache directory either).
+
+:Author: Caterina Urban
+"""
+
+import ast
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+import lyra.core
+from lyra.core.cfg import ControlFlowGraph
+from lyra.core.expressions import VariableIdentifier
+from lyra.frontend import cfg_generator
+from lyra.frontend.cfg_generator import ast_to_cfgs, ast_to_fargs
+
+Frontend = Tuple[Dict[str, ControlFlowGraph], Dict[str, Optional[List[VariableIdentifier]]]]
+
+_fingerprint: Optional[str] = None
+
+
+def fingerprint() -> str:
+    """Fingerprint of the frontend.
+
+    :return: hash of the sources of the control flow graph generator and of the core modules
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        core = os.path.dirname(lyra.core.__file__)
+        paths = sorted(os.path.join(core, name) for name in os.listdir(core)
+                       if name.endswith('.py'))
+        digest = hashlib.sha256()
+        for path in [cfg_generator.__file__] + paths:
+            with open(path, 'rb') as module:
+                digest.update(module.read())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+class FrontendCache:
+    """On-disk cache of control flow graphs and function arguments."""
+
+    def __init__(self, directory: str = None):
+        """Create a frontend cache.
+
+        :param directory: cache directory (defaults to ``$LYRA_CACHE`` or ``~/.cache/lyra``)
+        """
+        if directory is None:
+            default = os.path.join(os.path.expanduser('~'), '.cache', 'lyra')
+            directory = os.environ.get('LYRA_CACHE', default)
+        self._directory = directory
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @property
+    def hits(self):
+        """Number of lookups answered by the cache."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Number of lookups not answered by the cache."""
+        return self._misses
+
+    @staticmethod
+    def key(source: str) -> str:
+        """Cache key of a Python program.
+
+        :param source: source of the Python program
+        :return: hash of the source, of the versions of Lyra and Python,
+            and of the frontend fingerprint
+        """
+        python = f"{sys.version_info[0]}.{sys.version_info[1]}"
+        version = f"lyra-{lyra.__version__}-{fingerprint()}-python-{python}"
+        digest = hashlib.sha256(version.encode('utf-8'))
+        digest.update(source.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pickle")
+
+    def lookup(self, source: str) -> Optional[Frontend]:
+        """Retrieve the control flow graphs and function arguments of a Python program.
+
+        :param source: source of the Python program
+        :return: control flow graphs and function arguments, or ``None`` if not cached
+        """
+        try:
+            with open(self._path(self.key(source)), 'rb') as entry:
+                frontend = pickle.load(entry)
+            self._hits += 1
+            return frontend
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            self._misses += 1
+            return None
+
+    def store(self, source: str, frontend: Frontend):
+        """Store the control flow graphs and function arguments of a Python program.
+
+        The entry is written atomically, so concurrent runs never observe a partial entry.
+
+        :param source: source of the Python program
+        :param frontend: control flow graphs and function arguments of the program
+        """
+        path = self._path(self.key(source))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as entry:
+                pickle.dump(frontend, entry, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+    def frontend(self, source: str) -> Frontend:
+        """Control flow graphs and function arguments of a Python program,
+        generated only if they are not already cached.
+
+        :param source: source of the Python program
+        :return: control flow graphs and function arguments
+        """
+        frontend = self.lookup(source)
+        if frontend is None:
+            tree = ast.parse(source)
+            frontend = (ast_to_cfgs(tree), ast_to_fargs(tree))
+            try:
+                self.store(source, frontend)
+            except (OSError, pickle.PicklingError):     # caching is only an optimization
+                pass
+        return frontend
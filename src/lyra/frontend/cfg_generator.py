@@ -217,6 +217,7 @@ class LooseControlFlowGraph:
             error = 'This control flow graph is still loose'
             error += ' and cannot eject a complete control flow graph!'
             raise TypeError(error)
+        self._cfg.index()
         return self._cfg
 
     def replace(self, other):
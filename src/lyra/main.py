@@ -4,29 +4,130 @@ Lyra Static Program Analyzer
 """
 
 import argparse
+import sys
+from lyra.engine.assumption.assumption_analysis import TypeRangeAssumptionAnalysis
+from lyra.engine.batch import BatchRunner
 from lyra.engine.liveness.liveness_analysis import StrongLivenessAnalysis
 from lyra.engine.numerical.interval_analysis import ForwardIntervalAnalysisWithSummarization
+from lyra.engine.profiling import Profile
+from lyra.engine.sinks import sinks
+from lyra.frontend.cache import FrontendCache
 from lyra.engine.usage.usage_analysis import SimpleUsageAnalysis
 
 
+analyses = {
+    'assumptions': TypeRangeAssumptionAnalysis,
+    'intervals': ForwardIntervalAnalysisWithSummarization,
+    'liveness': StrongLivenessAnalysis,
+    'usage': SimpleUsageAnalysis
+}
+
+
 def main():
     """Static analyzer entry point."""
     parser = argparse.ArgumentParser()
     parser.add_argument(
         'python_file',
+        nargs='?',
         help='Python file to analyze')
     parser.add_argument(
         '--analysis',
-        help='analysis to be used (interval, liveness, or usage)',
+        choices=sorted(analyses),
+        help='analysis to be used',
         default='usage')
+    parser.add_argument(
+        '--output',
+        choices=sorted(sinks),
+        help='output of the analysis result (pdf opens a viewer)',
+        default='pdf')
+    parser.add_argument(
+        '--no-check',
+        action='store_true',
+        help='do not check the analysis result against the result comments in the program')
+    parser.add_argument(
+        '--sparse',
+        action='store_true',
+        help='skip blocks unrelated to the variables changed by the (non-relational) analysis')
+    parser.add_argument(
+        '--thresholds',
+        action='store_true',
+        help='widen up to thresholds harvested from the numerical literals of the program')
+    parser.add_argument(
+        '--narrowing',
+        type=int,
+        default=0,
+        metavar='N',
+        help='number of descending iterations at each loop head after widening (default: 0)')
+    parser.add_argument(
+        '--profile',
+        metavar='FILE',
+        help='JSON file to write the profile of the fixpoint iteration to')
+    parser.add_argument(
+        '--flamegraph',
+        metavar='FILE',
+        help='file to write the profile of the fixpoint iteration to, as collapsed stacks')
+    parser.add_argument(
+        '--cache',
+        nargs='?',
+        const='',
+        metavar='DIR',
+        help='cache the control flow graphs of the analyzed files (default: ~/.cache/lyra)')
+    parser.add_argument(
+        '--batch',
+        metavar='DIR',
+        help='directory of Python files to analyze in batch mode')
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        help='number of parallel analyses (default: number of processors)')
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        help='time limit for the analysis of each file in batch mode (in seconds)')
+    parser.add_argument(
+        '--memory',
+        type=int,
+        help='memory limit for the analysis of each file in batch mode (in megabytes)')
+    parser.add_argument(
+        '--report',
+        help='JSON Lines report file of batch mode (default: standard output)')
     args = parser.parse_args()
 
-    if args.analysis == 'intervals':
-        ForwardIntervalAnalysisWithSummarization().main(args.python_file)
-    if args.analysis == 'liveness':
-        StrongLivenessAnalysis().main(args.python_file)
-    if args.analysis == 'usage':
-        SimpleUsageAnalysis().main(args.python_file)
+    if args.batch:
+        if args.profile or args.flamegraph:
+            parser.error('--profile and --flamegraph are not supported in batch mode')
+        memory = args.memory * 1024 * 1024 if args.memory else None
+        analysis = analyses[args.analysis]
+        settings = {
+            'sparse': args.sparse,
+            'thresholds': args.thresholds,
+            'narrowing': args.narrowing
+        }
+        runner = BatchRunner(analysis, args.jobs, args.timeout, memory, args.cache,
+                             settings=settings)
+        summary = runner.run(args.batch, args.report)
+        print(", ".join(f"{status}: {count}" for status, count in sorted(summary.items())),
+              file=sys.stderr)
+    elif args.python_file:
+        runner = analyses[args.analysis]()
+        runner.sink = sinks[args.output]()
+        runner.checking = not args.no_check
+        runner.sparse = args.sparse
+        runner.thresholds = args.thresholds
+        runner.narrowing = args.narrowing
+        if args.profile or args.flamegraph:
+            runner.profile = Profile()
+        if args.cache is not None:
+            runner.cache = FrontendCache(args.cache or None)
+        runner.main(args.python_file)
+        if args.profile:
+            with open(args.profile, 'w') as stream:
+                runner.profile.dump(stream)
+        if args.flamegraph:
+            with open(args.flamegraph, 'w') as stream:
+                runner.profile.dump_collapsed(stream)
+    else:
+        parser.error('either a Python file or a directory (with --batch) is required')
 
 
 if __name__ == '__main__':
@@ -62,10 +62,19 @@ class UserDefinedCallSemantics(BackwardSemantics):
         :return: state modified by the call statement
         """
         fname, fcfg, _ = stmt.name, interpreter.cfgs[stmt.name], deepcopy(state)
-        # analyze the function
-        fresult = interpreter.analyze(fcfg, state)
-        fstate = fresult.get_node_result(fcfg.in_node)[state][-1]
-        state = state.bottom().join(deepcopy(fstate))
+
+        def analyze():      # analyze the function
+            fresult = interpreter.analyze(fcfg, state)
+            return fresult.get_node_result(fcfg.in_node)[state][-1]
+
+        def reuse(entry):   # the result of the function for a larger state is also valid here
+            interpreter.result.reuse(fcfg, entry, interpreter.copy(state))
+
+        if interpreter.summaries is None:
+            fstate = deepcopy(analyze())
+        else:
+            fstate = interpreter.summaries.summary(fname, state, analyze, reuse)
+        state = state.bottom().join(fstate)
         # substitute function actual to formal parameters
         for formal, actual in zip(interpreter.fargs[fname], stmt.arguments):
             if isinstance(actual, Call) and actual.name in interpreter.cfgs:
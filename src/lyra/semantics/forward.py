@@ -87,9 +87,18 @@ class UserDefinedCallSemantics(ForwardSemantics):
         for local in local_vars:
             state = state.add_variable(local).forget_variable(local)
 
-        fresult = interpreter.analyze(fcfg, state)      # analyze the function
-        fstate = fresult.get_node_result(fcfg.out_node)[state][-1]
-        state = state.bottom().join(deepcopy(fstate))
+        def analyze():      # analyze the function
+            fresult = interpreter.analyze(fcfg, state)
+            return fresult.get_node_result(fcfg.out_node)[state][-1]
+
+        def reuse(entry):   # the result of the function for a larger state is also valid here
+            interpreter.result.reuse(fcfg, entry, interpreter.copy(state))
+
+        if interpreter.summaries is None:
+            fstate = deepcopy(analyze())
+        else:
+            fstate = interpreter.summaries.summary(fname, state, analyze, reuse)
+        state = state.bottom().join(fstate)
 
         # assign return variable
         if state.result:
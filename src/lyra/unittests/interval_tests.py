@@ -29,6 +29,15 @@ class ForwardIntervalTestWithSummarization(TestRunner):
         return IntervalStateWithSummarization(self.variables)
 
 
+class ForwardIntervalTestWithArrays(TestRunner):
+
+    def interpreter(self):
+        return ForwardInterpreter(self.cfgs, self.fargs, DefaultForwardSemantics(), 3)
+
+    def state(self):
+        return IntervalStateWithSummarization(self.variables, arrays=True)
+
+
 class ForwardIntervalTestWithIndexing3(TestRunner):
 
     def interpreter(self):
@@ -73,6 +82,21 @@ def forward_summarization():
     return suite
 
 
+def forward_arrays():
+    suite = unittest.TestSuite()
+    name = os.getcwd() + '/numerical/interval/forward/**.py'
+    for path in glob.iglob(name):
+        if os.path.basename(path) != "__init__.py":
+            print('forward/' + os.path.basename(path))
+            suite.addTest(ForwardIntervalTestWithArrays(path))
+    name = os.getcwd() + '/numerical/interval/forward/summarization/**.py'
+    for path in glob.iglob(name):
+        if os.path.basename(path) != "__init__.py":
+            print('forward/summarization/' + os.path.basename(path))
+            suite.addTest(ForwardIntervalTestWithArrays(path))
+    return suite
+
+
 def forward_indexing3():
     suite = unittest.TestSuite()
     name = os.getcwd() + '/numerical/interval/forward/**.py'
@@ -128,5 +152,7 @@ if __name__ == '__main__':
     success3 = result3.wasSuccessful()
     result4 = runner.run(backward_indexing())
     success4 = result4.wasSuccessful()
-    if not success1 or not success2 or not success3 or not success4:
+    result5 = runner.run(forward_arrays())
+    success5 = result5.wasSuccessful()
+    if not success1 or not success2 or not success3 or not success4 or not success5:
         sys.exit(1)
@@ -28,6 +28,12 @@ class StrongLivenessTest(TestRunner):
         return StrongLivenessState(self.variables)
 
 
+class StrongLivenessTestWithBitVectors(StrongLivenessTest):
+
+    def state(self):
+        return StrongLivenessState(self.variables, bitvectors=True)
+
+
 def test_suite():
     suite = unittest.TestSuite()
     name = os.getcwd() + '/liveness/**.py'
@@ -35,6 +41,7 @@ def test_suite():
         if os.path.basename(path) != "__init__.py":
             print(os.path.basename(path))
             suite.addTest(StrongLivenessTest(path))
+            suite.addTest(StrongLivenessTestWithBitVectors(path))
     return suite
 
 
@@ -44,6 +44,7 @@ class TestRunner(unittest.TestCase, Runner, metaclass=ABCMeta):
 
     def __init__(self, path):
         super().__init__()
+        Runner.__init__(self)
         self.path = path
         self.maxDiff = None     # to allow large diff displays in error messages
         with open(self.path, 'r', encoding="utf-8") as source:
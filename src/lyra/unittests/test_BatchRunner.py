@@ -0,0 +1,84 @@
+"""
+Batch Analysis - Unit Tests
+===========================
+
+:Author: Caterina Urban
+"""
+import json
+import os
+import signal
+import tempfile
+import unittest
+
+from lyra.engine.batch import BatchRunner
+from lyra.engine.usage.usage_analysis import SimpleUsageAnalysis
+
+
+class MisbehavingAnalysis(SimpleUsageAnalysis):
+    """Usage analysis that diverges, gets stuck, or crashes its process on some files."""
+
+    def load(self, path):
+        if path.endswith('crash.py'):
+            os._exit(1)
+        if path.endswith('loop.py'):
+            while True:
+                pass
+        if path.endswith('stuck.py'):     # e.g., in native code, which signals cannot interrupt
+            signal.signal(signal.SIGALRM, signal.SIG_IGN)
+            while True:
+                pass
+        super().load(path)
+
+
+class ConfiguredAnalysis(SimpleUsageAnalysis):
+    """Usage analysis that fails unless it is sparse and narrows twice."""
+
+    def load(self, path):
+        if not self.sparse or self.narrowing != 2:
+            raise ValueError("unexpected settings")
+        super().load(path)
+
+
+class TestBatchRunner(unittest.TestCase):
+
+    sources = {
+        'ok.py': "x: int = int(input())\ny: int = x + 1\nprint(y)\n",
+        'error.py': "x: int = (\n",
+        'crash.py': "print(1)\n",
+        'loop.py': "print(2)\n",
+        'stuck.py': "print(3)\n"
+    }
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        for name, source in self.sources.items():
+            with open(os.path.join(self.directory.name, name), 'w') as file:
+                file.write(source)
+        self.report = os.path.join(self.directory.name, 'report.jsonl')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_run(self):
+        runner = BatchRunner(MisbehavingAnalysis, jobs=2, timeout=1, grace=1)
+        summary = runner.run(self.directory.name, self.report)
+        self.assertEqual(summary, {'ok': 1, 'error': 1, 'crashed': 1, 'timeout': 2})
+        with open(self.report) as report:
+            records = [json.loads(line) for line in report]
+        statuses = {os.path.basename(record['path']): record['status'] for record in records}
+        self.assertEqual(statuses['ok.py'], 'ok')
+        self.assertEqual(statuses['error.py'], 'error')
+        self.assertEqual(statuses['crash.py'], 'crashed')
+        self.assertEqual(statuses['loop.py'], 'timeout')
+        self.assertEqual(statuses['stuck.py'], 'timeout')
+
+    def test_settings(self):
+        paths = [os.path.join(self.directory.name, 'ok.py')]
+        runner = BatchRunner(ConfiguredAnalysis, jobs=1)
+        self.assertEqual([record['status'] for record in runner.analyze(paths)], ['error'])
+        runner = BatchRunner(ConfiguredAnalysis, jobs=1, settings={'sparse': True, 'narrowing': 2})
+        self.assertEqual([record['status'] for record in runner.analyze(paths)], ['ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
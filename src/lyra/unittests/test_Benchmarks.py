@@ -0,0 +1,47 @@
+"""
+Corpus Benchmarks - Unit Tests
+==============================
+
+:Author: Caterina Urban
+"""
+import unittest
+
+from lyra.benchmarks.corpus import corpora, files, compare, measure
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_files(self):
+        for corpus in corpora:
+            paths = files(corpus)
+            self.assertTrue(paths, corpus)
+            self.assertTrue(all(path.endswith('.py') for path in paths))
+            self.assertNotIn('__init__.py', [path.rsplit('/', 1)[-1] for path in paths])
+
+    def test_measure(self):
+        path = files('liveness')[0]
+        record = measure('liveness', path, 2)
+        self.assertEqual(record['status'], 'ok')
+        self.assertEqual(len(record['times']), 2)
+        self.assertEqual(record['time'], min(record['times']))
+        self.assertGreater(record['visits'], 0)
+
+    def test_compare(self):
+        ok = {'status': 'ok', 'time': 1.0, 'rss': 100, 'visits': 10, 'iterations': 2}
+        baseline = {'results': {'usage': {'a.py': ok, 'b.py': ok, 'c.py': ok, 'd.py': ok}}}
+        current = {'results': {'usage': {
+            'a.py': dict(ok, time=1.05),                # within the threshold
+            'b.py': dict(ok, time=2.0, visits=20),      # slower and more visits
+            'c.py': {'status': 'error'},                # failing
+            'd.py': dict(ok, time=0.5),                 # faster
+            'e.py': ok                                  # not in the baseline
+        }}}
+        regressions = compare(baseline, current, 0.1)
+        self.assertEqual(len(regressions), 3)
+        self.assertTrue(all(regression.startswith('usage b.py') for regression in regressions[:2]))
+        self.assertEqual(regressions[2], 'usage c.py: ok -> error')
+        self.assertEqual(compare(baseline, baseline, 0.1), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
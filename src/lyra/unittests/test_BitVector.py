@@ -0,0 +1,102 @@
+"""
+Bit Vectors - Unit Tests
+========================
+
+:Author: Caterina Urban
+"""
+import itertools
+import unittest
+from copy import deepcopy
+
+from lyra.abstract_domains.bitvector import BitVector
+from lyra.abstract_domains.liveness.liveness_domain import LivenessLattice, StrongLivenessState
+from lyra.abstract_domains.usage.usage_domain import UsageBitVector, SimpleUsageState
+from lyra.abstract_domains.usage.usage_lattice import UsageLattice
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.types import IntegerLyraType
+
+U = UsageLattice.Status.U
+S = UsageLattice.Status.S
+W = UsageLattice.Status.W
+N = UsageLattice.Status.N
+statuses = [U, S, W, N]
+
+
+class TestBitVector(unittest.TestCase):
+
+    def test_copy(self):
+        original = BitVector(UsageLattice, {'x': UsageLattice(U), 'y': UsageLattice(W)})
+        copy = deepcopy(original)
+        copy['x'].bottom()
+        copy['z'] = UsageLattice(S)
+        self.assertEqual(original.peek('x'), UsageLattice(U))
+        self.assertEqual(deepcopy(copy), BitVector(UsageLattice, {
+            'x': UsageLattice(N), 'y': UsageLattice(W), 'z': UsageLattice(S)}))
+        del copy['y']
+        self.assertEqual(copy.peek('z'), UsageLattice(S))
+        self.assertEqual(copy.bottoms(), ['x'])
+
+    def test_lattice(self):
+        """The point-wise bit operations agree with the operations of the lattice."""
+        for left, right in itertools.product(statuses, repeat=2):
+            one = BitVector(UsageLattice, {'x': UsageLattice(left)})
+            two = BitVector(UsageLattice, {'x': UsageLattice(right)})
+            expected = UsageLattice(left).less_equal(UsageLattice(right))
+            self.assertEqual(one.less_equal(two), expected)
+            expected = UsageLattice(left).join(UsageLattice(right))
+            self.assertEqual(deepcopy(one).join(two).peek('x'), expected)
+            expected = UsageLattice(left).meet(UsageLattice(right))
+            self.assertEqual(deepcopy(one).meet(two).peek('x'), expected)
+
+    def test_nesting(self):
+        """The point-wise bit operations agree with the nesting operations of the lattice."""
+        for left, right in itertools.product(statuses, repeat=2):
+            if left == W and right == S:
+                continue
+            one = UsageBitVector(UsageLattice, {'x': UsageLattice(left)})
+            two = UsageBitVector(UsageLattice, {'x': UsageLattice(right)})
+            expected = UsageLattice(left).decrease(UsageLattice(right))
+            self.assertEqual(one.decrease(two).peek('x'), expected)
+        for status in statuses:
+            one = UsageBitVector(UsageLattice, {'x': UsageLattice(status)})
+            self.assertEqual(one.increase().peek('x'), UsageLattice(status).increase())
+
+    def test_liveness(self):
+        live = LivenessLattice(LivenessLattice.Status.Live)
+        one = BitVector(LivenessLattice, {'x': live, 'y': LivenessLattice()})
+        two = BitVector(LivenessLattice, {'y': live, 'x': LivenessLattice()})
+        self.assertFalse(one.less_equal(two))
+        self.assertTrue(deepcopy(one).join(two).is_top())
+        self.assertEqual(len(deepcopy(one).meet(two).bottoms()), 2)
+
+
+class TestStoreWithBitVectors(unittest.TestCase):
+
+    def setUp(self):
+        self.x = VariableIdentifier(IntegerLyraType(), 'x')
+        self.y = VariableIdentifier(IntegerLyraType(), 'y')
+
+    def test_liveness(self):
+        state = StrongLivenessState({self.x, self.y}, bitvectors=True)
+        self.assertIsInstance(state.store, BitVector)
+        copy = deepcopy(state)
+        copy.store[self.x].top()
+        self.assertTrue(state.less_equal(copy))
+        self.assertFalse(copy.less_equal(state))
+        state.join(copy)
+        self.assertEqual(repr(state), "x -> Live; y -> Dead")
+
+    def test_usage(self):
+        states = [SimpleUsageState({self.x, self.y}, bitvectors=bitvectors)
+                  for bitvectors in (False, True)]
+        for state in states:
+            state.lattice.store[self.x].top()
+            state.push()
+            state.lattice.store[self.y].written()
+            state.pop()
+        self.assertEqual(repr(states[0]), repr(states[1]))
+        self.assertEqual(repr(states[1]), "x -> U; y -> W")
+
+
+if __name__ == '__main__':
+    unittest.main()
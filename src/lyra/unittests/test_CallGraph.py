@@ -0,0 +1,57 @@
+"""
+Call Graph - Unit Tests
+=======================
+
+:Author: Caterina Urban
+"""
+import unittest
+
+from lyra.engine.callgraph import CallGraph
+from lyra.engine.numerical.interval_analysis import ForwardIntervalAnalysisWithSummarization
+
+
+class TestCallGraph(unittest.TestCase):
+
+    source = """
+def clamp(v: int) -> int:
+    if v > 100:
+        return 100
+    return v
+
+
+def scale(v: int) -> int:
+    w: int = clamp(v)
+    return w * 2
+
+
+def even(n: int) -> bool:
+    if n == 0:
+        return True
+    return odd(n - 1)
+
+
+def odd(n: int) -> bool:
+    if n == 0:
+        return False
+    return even(n - 1)
+
+
+x: int = int(input())
+y: int = scale(clamp(x))
+print(y)
+"""
+
+    def setUp(self):
+        self.runner = ForwardIntervalAnalysisWithSummarization()
+        self.runner.parse(self.source)
+
+    def test_callgraph(self):
+        graph = CallGraph(self.runner.cfgs)
+        self.assertEqual(graph.callees(''), {'clamp', 'scale'})
+        self.assertEqual(graph.callers('clamp'), {'', 'scale'})
+        components = graph.components()
+        self.assertIn(['even', 'odd'], components)
+        self.assertLess(components.index(['clamp']), components.index(['scale']))
+        self.assertLess(components.index(['scale']), components.index(['']))
+        self.assertTrue(graph.recursive('even'))
+        self.assertFalse(graph.recursive('scale'))
@@ -0,0 +1,52 @@
+"""
+Control Flow Graph - Unit Tests
+===============================
+
+:Author: Caterina Urban
+"""
+import ast
+import unittest
+
+from lyra.frontend.cfg_generator import ast_to_cfgs
+
+
+class TestControlFlowGraph(unittest.TestCase):
+
+    source = """
+def f(a: int) -> int:
+    b: int = a + 1
+    return b
+
+
+x: int = int(input())
+for i in range(x):
+    if i > 3:
+        x: int = f(i)
+    else:
+        break
+print(x)
+"""
+
+    def setUp(self):
+        self.cfgs = ast_to_cfgs(ast.parse(self.source))
+
+    def test_adjacency(self):
+        for cfg in self.cfgs.values():
+            for node in cfg.nodes.values():
+                in_edges = {e for (s, t), e in cfg.edges.items() if t == node}
+                out_edges = {e for (s, t), e in cfg.edges.items() if s == node}
+                self.assertEqual(cfg.in_edges(node), in_edges)
+                self.assertEqual(cfg.out_edges(node), out_edges)
+                self.assertEqual(cfg.predecessors(node), {e.source for e in in_edges})
+                self.assertEqual(cfg.successors(node), {e.target for e in out_edges})
+
+    def test_variables(self):
+        cfg = self.cfgs['']
+        variables = cfg.variables
+        self.assertEqual({v.name for v in variables}, {'x', 'i'})
+        variables.clear()   # the cached variables are not affected by changes to the result
+        self.assertEqual({v.name for v in cfg.variables}, {'x', 'i'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Result Export - Unit Tests
+==========================
+
+:Author: Caterina Urban
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from lyra.engine.export import ResultLoader, dump_binary, dump_jsonl, dump_nodes
+from lyra.engine.numerical.interval_analysis import ForwardIntervalAnalysisWithSummarization
+
+
+class TestExport(unittest.TestCase):
+
+    source = """
+a: int = 0
+while a < 100:
+    a: int = a + 1
+print(a)
+"""
+
+    def setUp(self):
+        self.runner = ForwardIntervalAnalysisWithSummarization()
+        self.runner.parse(self.source)
+        self.result, _ = self.runner.analyze()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def export(self, binary):
+        path = os.path.join(self.directory.name, 'result.lyra' if binary else 'result.jsonl')
+        if binary:
+            with open(path, 'wb') as stream:
+                dump_binary(self.result, stream, self.runner)
+        else:
+            with open(path, 'w', encoding='utf-8') as stream:
+                dump_jsonl(self.result, stream, self.runner)
+        return path
+
+    def test_roundtrip(self):
+        cfg = self.runner.cfgs['']
+        for binary in (False, True):
+            with ResultLoader(self.export(binary)) as loader:
+                self.assertEqual(loader.binary, binary)
+                self.assertEqual(loader.header['analysis'], type(self.runner).__name__)
+                nodes = list(loader.nodes())
+                self.assertEqual(len(nodes), len(cfg.nodes))
+                self.assertEqual(len(list(loader.edges())), len(cfg.edges))
+                for node in cfg.nodes.values():
+                    record = loader.node(node.identifier)
+                    states = next(iter(self.result.get_node_result(node).values()))
+                    self.assertEqual(record['contexts'][0]['states'], [str(s) for s in states])
+                    for stmt in node.stmts:
+                        located = loader.point(stmt.pp.line, stmt.pp.column)
+                        self.assertEqual(located['node'], node.identifier)
+                self.assertIsNone(loader.node(-1))
+
+    def test_nodes(self):
+        directory = os.path.join(self.directory.name, 'nodes')
+        dump_nodes(self.result, directory, self.runner)
+        with ResultLoader(self.export(False)) as loader:
+            for record in loader.nodes():
+                with open(os.path.join(directory, f"{record['node']}.json")) as stream:
+                    self.assertEqual(json.load(stream), record)
+        self.assertEqual(len(os.listdir(directory)), len(self.runner.cfgs[''].nodes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Expression Evaluation - Unit Tests
+==================================
+
+:Author: Caterina Urban
+"""
+import threading
+import unittest
+from copy import deepcopy
+
+from lyra.abstract_domains.numerical.interval_domain import IntervalStateWithSummarization
+from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+from lyra.core.expressions import VariableIdentifier, BinaryArithmeticOperation, Literal, \
+    ListDisplay
+from lyra.core.types import IntegerLyraType, ListLyraType
+
+
+class TestExpressionEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        self.x = VariableIdentifier(IntegerLyraType(), 'x')
+        self.y = VariableIdentifier(IntegerLyraType(), 'y')
+        add = BinaryArithmeticOperation.Operator.Add
+        one = Literal(IntegerLyraType(), '1')
+        self.expr = BinaryArithmeticOperation(IntegerLyraType(), self.x, add, one)
+        self.state = IntervalStateWithSummarization({self.x, self.y})
+        self.state.store[self.x].meet(IntervalLattice(0, 1))
+
+    def evaluate(self, state, expr):
+        return state._evaluation.visit(expr, state, dict())[expr]
+
+    def test_cache(self):
+        state = deepcopy(self.state)
+        self.assertEqual(self.evaluate(state, self.expr), IntervalLattice(1, 2))
+        hits = state.evaluations.hits
+        copy = deepcopy(state)      # shares the cache and the unchanged values
+        copy.store[self.y].meet(IntervalLattice(0, 0))
+        self.assertEqual(self.evaluate(copy, self.expr), IntervalLattice(1, 2))
+        self.assertEqual(state.evaluations.hits, hits + 1)
+        copy.store[self.x].meet(IntervalLattice(1, 1))
+        self.assertEqual(self.evaluate(copy, self.expr), IntervalLattice(2, 2))
+        self.assertEqual(self.evaluate(state, self.expr), IntervalLattice(1, 2))
+
+    def test_copies(self):
+        state = deepcopy(self.state)
+        self.evaluate(state, self.expr)
+        evaluation = state._evaluation.visit(self.expr, state, dict())
+        evaluation[self.x].bottom()     # modifies a copy of the value of the variable
+        self.assertEqual(state.store.peek(self.x), IntervalLattice(0, 1))
+        self.assertEqual(self.evaluate(state, self.x), IntervalLattice(0, 1))
+
+    def test_side_effects(self):
+        state = deepcopy(self.state)
+        misses = state.evaluations.misses
+        display = ListDisplay(ListLyraType(IntegerLyraType()), [self.x])
+        self.evaluate(state, display)    # not cached
+        self.assertEqual(state.evaluations.misses, misses)
+        self.assertEqual(len(state.evaluations), 0)
+
+    def test_threads(self):
+        state = deepcopy(self.state)
+        evaluation = state._evaluation
+        evaluation._nested = evaluation._pure = True    # evaluation in progress in this thread
+        try:
+            results = list()
+
+            def evaluate():     # evaluation by another thread
+                results.append((evaluation._nested, evaluation._pure))
+                results.append(self.evaluate(state, self.expr))
+
+            thread = threading.Thread(target=evaluate)
+            thread.start()
+            thread.join()
+            self.assertEqual(results, [(False, False), IntervalLattice(1, 2)])
+            self.assertEqual(len(state.evaluations), 1)     # cached
+        finally:
+            evaluation._nested = evaluation._pure = False
+
+
+if __name__ == '__main__':
+    unittest.main()
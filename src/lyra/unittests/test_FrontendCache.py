@@ -0,0 +1,91 @@
+"""
+Frontend Cache - Unit Tests
+===========================
+
+:Author: Caterina Urban
+"""
+import os
+import tempfile
+import unittest
+
+import lyra
+from lyra.frontend import cache
+from lyra.frontend.cache import FrontendCache
+
+
+class TestFrontendCache(unittest.TestCase):
+
+    source = """
+def f(a: int) -> int:
+    return a + 1
+
+
+x: int = int(input())
+while x > 0:
+    x: int = f(x) - 2
+print(x)
+"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = FrontendCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_frontend(self):
+        cfgs, fargs = self.cache.frontend(self.source)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        cached_cfgs, cached_fargs = self.cache.frontend(self.source)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(set(cached_cfgs), {'', 'f'})
+        self.assertEqual(cached_fargs, fargs)
+        for fname, cfg in cfgs.items():
+            cached = cached_cfgs[fname]
+            self.assertEqual(set(cached.nodes), set(cfg.nodes))
+            self.assertEqual(set(cached.edges), set(cfg.edges))
+            self.assertEqual(cached.variables, cfg.variables)
+            for identifier, node in cfg.nodes.items():
+                self.assertEqual(cached.successors(cached.nodes[identifier]), cfg.successors(node))
+
+    def test_key(self):
+        self.assertEqual(FrontendCache.key(self.source), FrontendCache.key(self.source))
+        self.assertNotEqual(FrontendCache.key(self.source), FrontendCache.key(self.source + "\n"))
+
+    def test_fingerprint(self):
+        key = FrontendCache.key(self.source)
+        self.cache.frontend(self.source)
+        fingerprint = cache.fingerprint()
+        try:
+            cache._fingerprint = 'changed frontend'     # entries of other frontends are not used
+            self.assertNotEqual(FrontendCache.key(self.source), key)
+            self.assertIsNone(self.cache.lookup(self.source))
+        finally:
+            cache._fingerprint = fingerprint
+        self.assertIsNotNone(self.cache.lookup(self.source))
+
+    def test_version(self):
+        key = FrontendCache.key(self.source)
+        self.cache.frontend(self.source)
+        version = lyra.__version__
+        try:
+            lyra.__version__ = 'other version'     # nor are entries of other versions of Lyra
+            self.assertNotEqual(FrontendCache.key(self.source), key)
+            self.assertIsNone(self.cache.lookup(self.source))
+        finally:
+            lyra.__version__ = version
+        self.assertIsNotNone(self.cache.lookup(self.source))
+
+    def test_corrupted(self):
+        self.cache.frontend(self.source)
+        key = FrontendCache.key(self.source)
+        with open(os.path.join(self.directory.name, key[:2], f"{key}.pickle"), 'wb') as entry:
+            entry.write(b'corrupted')
+        self.assertIsNone(self.cache.lookup(self.source))
+        cfgs, _ = self.cache.frontend(self.source)   # the entry is regenerated
+        self.assertEqual(set(cfgs), {'', 'f'})
+        self.assertIsNotNone(self.cache.lookup(self.source))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Fulara Lattice - Unit Tests
+===========================
+
+:Author: Caterina Urban
+"""
+import unittest
+from copy import deepcopy
+
+from lyra.abstract_domains.container.fulara.fulara_lattice import FularaLattice, SegmentIndex, \
+    d_norm
+from lyra.abstract_domains.container.fulara.interval_wrappers import IntervalKWrapper, \
+    IntervalVWrapper
+from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.types import IntegerLyraType
+
+
+class UnorderedKWrapper(IntervalKWrapper):
+    """Interval keys, without their bounds (to use the generic segment operations)."""
+
+    def bounds(self):
+        return None
+
+
+class TestFularaLattice(unittest.TestCase):
+
+    def setUp(self):
+        self.k = VariableIdentifier(IntegerLyraType(), 'k')
+        self.v = VariableIdentifier(IntegerLyraType(), 'v')
+
+    def key(self, lower, upper, wrapper=IntervalKWrapper):
+        key = wrapper(set(), self.k)
+        key.store[self.k] = IntervalLattice(lower, upper)
+        return key
+
+    def value(self, lower, upper):
+        value = IntervalVWrapper(set(), self.v)
+        value.store[self.v] = IntervalLattice(lower, upper)
+        return value
+
+    def lattice(self, segments, wrapper=IntervalKWrapper):
+        segments = {(self.key(k1, k2, wrapper), self.value(v1, v2)) for k1, k2, v1, v2 in segments}
+        return FularaLattice(wrapper, IntervalVWrapper, {'scalar_variables': set(), 'k_var': self.k},
+                             {'scalar_variables': set(), 'v_var': self.v}, segments)
+
+    def test_index(self):
+        segments = {(self.key(0, 1), self.value(0, 0)), (self.key(3, 5), self.value(1, 1)),
+                    (self.key(8, 9), self.value(2, 2))}
+        index = SegmentIndex.of(segments)
+        self.assertEqual(len(index.overlapping(self.key(1, 4))), 2)
+        self.assertEqual(index.overlapping(self.key(6, 7)), [])
+        self.assertIsNone(SegmentIndex.of({(self.key(0, 1, UnorderedKWrapper), self.value(0, 0))}))
+
+    def test_d_norm(self):
+        segments = {(self.key(0, 2), self.value(0, 0)), (self.key(2, 4), self.value(1, 1)),
+                    (self.key(6, 7), self.value(2, 2)), (self.key(3, 5), self.value(3, 3))}
+        normalized = sorted(d_norm(segments), key=lambda segment: segment[0])
+        self.assertEqual(repr(normalized), "[([0, 5], [0, 3]), ([6, 7], [2, 2])]")
+
+    def test_operations(self):
+        """The indexed segment operations agree with the generic ones."""
+        one = [(0, 1, 0, 0), (3, 5, 1, 2), (8, 9, 2, 2)]
+        two = [(0, 5, 0, 3), (7, 10, 1, 2)]
+        three = [(0, 1, 0, 1), (3, 4, 1, 2)]
+        for left, right in [(one, two), (two, one), (one, three), (three, one), (two, three)]:
+            ordered = self.lattice(left), self.lattice(right)
+            unordered = self.lattice(left, UnorderedKWrapper), self.lattice(right, UnorderedKWrapper)
+            self.assertEqual(ordered[0].less_equal(ordered[1]),
+                             unordered[0].less_equal(unordered[1]))
+            for operation in ('meet', 'join', 'widening'):
+                expected = getattr(deepcopy(unordered[0]), operation)(unordered[1])
+                actual = getattr(deepcopy(ordered[0]), operation)(ordered[1])
+                self.assertEqual(repr(actual), repr(expected), operation)
+
+    def test_partition_add(self):
+        lattice = self.lattice([(0, 5, 0, 0), (7, 9, 1, 1)])
+        lattice.partition_add(self.key(4, 8), self.value(2, 2))
+        self.assertEqual(repr(lattice), "{([0, 3], [0, 0]), ([4, 8], [2, 2]), ([9, 9], [1, 1])}")
+
+
+if __name__ == '__main__':
+    unittest.main()
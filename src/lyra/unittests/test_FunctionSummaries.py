@@ -0,0 +1,83 @@
+"""
+Function Summaries - Unit Tests
+===============================
+
+:Author: Caterina Urban
+"""
+import unittest
+
+from lyra.abstract_domains.numerical.interval_domain import IntervalStateWithSummarization
+from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.types import IntegerLyraType
+from lyra.engine.numerical.interval_analysis import ForwardIntervalAnalysisWithSummarization
+from lyra.engine.summaries import FunctionSummaries
+
+
+class TestFunctionSummaries(unittest.TestCase):
+
+    def setUp(self):
+        self.x = VariableIdentifier(IntegerLyraType(), 'x')
+        self.y = VariableIdentifier(IntegerLyraType(), 'y')
+
+    def state(self, lower, upper, *variables):
+        state = IntervalStateWithSummarization({self.x}.union(variables))
+        state.store[self.x] = IntervalLattice(lower, upper)
+        return state
+
+    def test_lookup(self):
+        summaries = FunctionSummaries()
+        summaries.store('f', self.state(0, 10), self.state(1, 11))
+        self.assertEqual(summaries.lookup('f', self.state(0, 10)), self.state(1, 11))
+        self.assertEqual(summaries.lookup('f', self.state(2, 5)), self.state(1, 11))  # subsumed
+        self.assertIsNone(summaries.lookup('f', self.state(0, 20)))
+        self.assertIsNone(summaries.lookup('g', self.state(0, 10)))
+        self.assertIsNone(summaries.lookup('f', self.state(2, 5, self.y)))  # other environment
+        self.assertEqual((summaries.hits, summaries.misses), (2, 3))
+        exact = FunctionSummaries(subsumption=False)
+        exact.store('f', self.state(0, 10), self.state(1, 11))
+        self.assertIsNone(exact.lookup('f', self.state(2, 5)))
+
+    def test_eviction(self):
+        summaries = FunctionSummaries(capacity=2)
+        summaries.store('f', self.state(0, 0), self.state(1, 1))
+        summaries.store('f', self.state(1, 1), self.state(2, 2))
+        summaries.lookup('f', self.state(0, 0))      # the summary for [0, 0] is most recently used
+        summaries.store('f', self.state(2, 2), self.state(3, 3))
+        self.assertEqual(len(summaries), 2)
+        self.assertIsNotNone(summaries.lookup('f', self.state(0, 0)))
+        self.assertIsNone(summaries.lookup('f', self.state(1, 1)))
+
+    def test_summary(self):
+        summaries = FunctionSummaries()
+        calls = list()
+
+        def analyze():
+            calls.append(None)
+            if len(calls) == 1:     # recursive call
+                summaries.summary('f', self.state(0, 1), analyze)
+            return self.state(2, 3)
+
+        self.assertEqual(summaries.summary('f', self.state(0, 1), analyze), self.state(2, 3))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(summaries), 0)     # summaries of recursive functions are not kept
+        summaries.summary('g', self.state(0, 1), lambda: self.state(4, 5))
+        self.assertEqual(summaries.summary('g', self.state(0, 1), analyze), self.state(4, 5))
+        self.assertEqual(len(calls), 2)
+
+    def test_contexts(self):
+        runner = ForwardIntervalAnalysisWithSummarization()
+        runner.parse("""
+def f(a: int) -> int:
+    return a + 1
+
+
+x: int = int(input())
+y: int = f(x)
+x: int = 3
+z: int = f(x)
+""")
+        result, interpreter = runner.analyze()
+        self.assertEqual(interpreter.summaries.hits, 1)     # the second call is subsumed
+        for node in runner.cfgs['f'].nodes.values():    # the result is recorded for both calls
+            self.assertEqual(len(result.get_node_result(node)), 2)
@@ -0,0 +1,57 @@
+"""
+Graph Rendering - Unit Tests
+============================
+
+:Author: Caterina Urban
+"""
+import unittest
+
+from lyra.engine.numerical.interval_analysis import ForwardIntervalAnalysisWithSummarization
+from lyra.visualization.graph_renderer import AnalysisResultRenderer
+
+
+class TestGraphRenderer(unittest.TestCase):
+
+    source = """
+def f(x: int) -> int:
+    return x + 1
+
+
+a: int = 0
+while a < 10:
+    b: int = 0
+    while b < a:
+        b: int = f(b)
+    a: int = a + 1
+print(a)
+"""
+
+    def setUp(self):
+        self.runner = ForwardIntervalAnalysisWithSummarization()
+        self.runner.parse(self.source)
+        self.result, _ = self.runner.analyze()
+        self.data = (self.runner.cfgs, self.result)
+
+    def test_clusters(self):
+        source = AnalysisResultRenderer().graph(self.data).source
+        self.assertNotIn('subgraph', source)
+        source = AnalysisResultRenderer(clusters=True).graph(self.data).source
+        clusters = [line.split()[1] for line in source.splitlines() if 'subgraph' in line]
+        self.assertEqual(len(clusters), 4)    # two functions and two loops
+        self.assertIn('cluster_f', clusters)
+        for node in self.runner.cfgs[''].nodes.values():
+            self.assertIn(f"\t{node.identifier} [label=", source)
+
+    def test_budget(self):
+        unlimited = AnalysisResultRenderer()
+        size = len(unlimited.graph(self.data).source)
+        self.assertEqual(unlimited.omitted, 0)
+        limited = AnalysisResultRenderer(budget=100, length=20)
+        self.assertLess(len(limited.graph(self.data).source), size)
+        self.assertGreater(limited.omitted, 0)
+        nodes = sum(len(cfg.nodes) for cfg in self.runner.cfgs.values())
+        self.assertLess(limited.omitted, nodes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Incremental Analysis - Unit Tests
+=================================
+
+:Author: Caterina Urban
+"""
+import unittest
+
+from lyra.engine.incremental import ControlFlowGraphDiff
+from lyra.engine.liveness.liveness_analysis import StrongLivenessAnalysis
+from lyra.engine.usage.usage_analysis import SimpleUsageAnalysis
+
+
+class TestIncremental(unittest.TestCase):
+
+    source = """
+x: int = int(input())
+y: int = 0
+while x > 0:
+    y: int = y + 2
+    x: int = x - 1
+if y > 10:
+    z: int = y
+else:
+    z: int = 0
+print(z)
+"""
+
+    edits = [
+        source.replace("y: int = y + 2", "y: int = y + 3"),
+        source.replace("z: int = 0", "z: int = x"),
+        source.replace("print(z)", "print(y)"),
+        source + "print(x)\n"
+    ]
+
+    @staticmethod
+    def results(runner, result):
+        results = dict()
+        for identifier, node in runner.cfgs[''].nodes.items():
+            states = result.get_node_result(node).values()
+            results[identifier] = [[str(state) for state in ctx] for ctx in states]
+        return results
+
+    def test_diff(self):
+        previous, current = SimpleUsageAnalysis(), SimpleUsageAnalysis()
+        previous.parse(self.source)
+        current.parse(self.source)
+        diff = ControlFlowGraphDiff(previous.cfgs[''], current.cfgs[''])
+        self.assertTrue(diff.unchanged())
+        self.assertEqual(len(diff.matching), len(current.cfgs[''].nodes))
+        current.parse(self.edits[1])
+        diff = ControlFlowGraphDiff(previous.cfgs[''], current.cfgs[''])
+        self.assertFalse(diff.unchanged())
+        changed, affected = diff.changed(), diff.affected()
+        self.assertTrue(any('z: int = x' in str(node.stmts) for node in changed))
+        self.assertTrue(changed <= affected)
+        nodes = current.cfgs[''].nodes.values()
+        loop = [node for node in nodes if 'add(y, 2)' in str(node.stmts)]
+        self.assertTrue(loop and affected.isdisjoint(loop))
+        self.assertFalse(affected.isdisjoint(diff.affected(backward=True)))
+
+    def test_reanalyze(self):
+        for analysis in (StrongLivenessAnalysis, SimpleUsageAnalysis):
+            for edit in self.edits:
+                incremental = analysis()
+                incremental.parse(self.source)
+                incremental.analyze()
+                result, interpreter = incremental.reanalyze(edit)
+                scratch = analysis()
+                scratch.parse(edit)
+                expected, reference = scratch.analyze()
+                with self.subTest(analysis=analysis.__name__, edit=edit):
+                    actual = self.results(incremental, result)
+                    self.assertEqual(actual, self.results(scratch, expected))
+                    self.assertLessEqual(interpreter.visits, reference.visits)
@@ -0,0 +1,49 @@
+"""
+Input Constraints Log - Unit Tests
+==================================
+
+:Author: Caterina Urban
+"""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
+from lyra.engine.assumption.assumption_analysis import TypeRangeAssumptionAnalysis
+
+
+class TestInputLog(unittest.TestCase):
+
+    sources = [
+        "x: int = int(input())\nif x < 0:\n    raise ValueError\nprint(x)\n",
+        "a: int = int(input())\nb: int = int(input())\nif a < b:\n    print(b - a)\n",
+        "n: int = int(input())\nwhile n > 0:\n    n: int = n - int(input())\nprint(n)\n"
+    ]
+
+    @staticmethod
+    def analyze(source):
+        runner = TypeRangeAssumptionAnalysis()
+        runner.parse(source)
+        result, _ = runner.analyze()
+        results = dict()
+        for identifier, node in runner.cfgs[''].nodes.items():
+            states = result.get_node_result(node).values()
+            results[identifier] = [[str(state) for state in ctx] for ctx in states]
+        return results
+
+    def test_ownership(self):
+        runner = TypeRangeAssumptionAnalysis()
+        runner.parse(self.sources[0])
+        first, second = runner.state(), runner.state()
+        self.assertIsNot(first.states[0].inputs, second.states[0].inputs)
+        self.assertIs(deepcopy(first).states[0].inputs, first.states[0].inputs)
+
+    def test_concurrent(self):
+        expected = [self.analyze(source) for source in self.sources]
+        with ThreadPoolExecutor(max_workers=len(self.sources)) as executor:
+            for _ in range(3):
+                results = list(executor.map(self.analyze, self.sources))
+                self.assertEqual(results, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Interning - Unit Tests
+======================
+
+:Author: Caterina Urban
+"""
+import pickle
+import unittest
+from copy import copy, deepcopy
+
+from lyra.core.expressions import VariableIdentifier, Literal, BinaryArithmeticOperation, \
+    ListDisplay, LengthIdentifier, walk
+from lyra.core.types import IntegerLyraType, ListLyraType, BooleanLyraType
+
+
+class TestInterning(unittest.TestCase):
+
+    def test_types(self):
+        self.assertIs(IntegerLyraType(), IntegerLyraType())
+        self.assertIs(ListLyraType(IntegerLyraType()), ListLyraType(IntegerLyraType()))
+        self.assertIsNot(ListLyraType(IntegerLyraType()), ListLyraType(BooleanLyraType()))
+        self.assertFalse(hasattr(ListLyraType(IntegerLyraType()), '__dict__'))
+
+    def test_expressions(self):
+        x = VariableIdentifier(IntegerLyraType(), 'x')
+        add = BinaryArithmeticOperation.Operator.Add
+        left = BinaryArithmeticOperation(IntegerLyraType(), x, add, Literal(IntegerLyraType(), '1'))
+        right = BinaryArithmeticOperation(IntegerLyraType(), x, add, Literal(IntegerLyraType(), '1'))
+        self.assertIs(left, right)
+        self.assertEqual(hash(left), hash(right))
+        self.assertFalse(hasattr(left, '__dict__'))
+        self.assertIs(copy(left), left)
+        self.assertIs(deepcopy(left), left)
+        self.assertIs(pickle.loads(pickle.dumps(left)), left)
+        # identifiers with the same name are equal, even when their types differ
+        y = VariableIdentifier(BooleanLyraType(), 'x')
+        self.assertIsNot(x, y)
+        self.assertEqual(x, y)
+
+    def test_lists(self):
+        x = VariableIdentifier(IntegerLyraType(), 'x')
+        items = [x]
+        display = ListDisplay(ListLyraType(IntegerLyraType()), items)
+        items.append(Literal(IntegerLyraType(), '1'))   # does not affect the display
+        self.assertEqual(display.items, [x])
+        self.assertIs(display, ListDisplay(ListLyraType(IntegerLyraType()), [x]))
+        self.assertEqual(list(walk(LengthIdentifier(display))), [LengthIdentifier(display), display, x])
+
+    def test_rebuild(self):
+        x = VariableIdentifier(IntegerLyraType(), 'x')
+        y = VariableIdentifier(IntegerLyraType(), 'y')
+        add = BinaryArithmeticOperation.Operator.Add
+        expr = BinaryArithmeticOperation(IntegerLyraType(), x, add, x)
+        rebuilt = expr.rebuild(lambda child: y if child is x else child)
+        self.assertIs(rebuilt, BinaryArithmeticOperation(IntegerLyraType(), y, add, y))
+        self.assertEqual(str(expr), "x + x")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Interval Arrays - Unit Tests
+============================
+
+:Author: Caterina Urban
+"""
+import unittest
+from copy import deepcopy
+from math import inf
+
+from lyra.abstract_domains.numerical.interval_array import IntervalArray
+from lyra.abstract_domains.numerical.interval_domain import IntervalStateWithSummarization
+from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.types import IntegerLyraType, ListLyraType
+
+
+class TestIntervalArray(unittest.TestCase):
+
+    def test_bounds(self):
+        array = IntervalArray({'x': IntervalLattice(0, 1), 'y': IntervalLattice(0.5, inf)})
+        array['z'] = IntervalLattice().bottom()
+        copy = deepcopy(array)      # the values are written back into the arrays
+        self.assertEqual(repr(copy.peek('x')), "[0, 1]")
+        self.assertEqual(repr(copy.peek('y')), "[0.5, inf]")
+        self.assertTrue(copy.peek('z').is_bottom())
+        self.assertEqual(copy.bottoms(), ['z'])
+
+    def test_copy(self):
+        original = IntervalArray({'x': IntervalLattice(0, 1), 'y': IntervalLattice(2, 3)})
+        copy = deepcopy(original)
+        copy['x'].join(IntervalLattice(5, 5))
+        self.assertEqual(original.peek('x'), IntervalLattice(0, 1))
+        self.assertEqual(copy.peek('x'), IntervalLattice(0, 5))
+        del copy['x']
+        self.assertEqual(list(copy), ['y'])
+        self.assertEqual(list(original), ['x', 'y'])
+
+    def test_lattice(self):
+        one = IntervalArray({'x': IntervalLattice(0, 1), 'y': IntervalLattice(2, 3)})
+        two = IntervalArray({'y': IntervalLattice(2, 4), 'x': IntervalLattice().bottom()})
+        self.assertFalse(one.less_equal(two))
+        self.assertFalse(two.less_equal(one))
+        joined = deepcopy(one).join(two)
+        self.assertEqual(joined, IntervalArray({'x': IntervalLattice(0, 1), 'y': IntervalLattice(2, 4)}))
+        met = deepcopy(one).meet(two)
+        self.assertTrue(met.peek('x').is_bottom())
+        self.assertEqual(met.peek('y'), IntervalLattice(2, 3))
+        widened = deepcopy(one).widening(joined)
+        self.assertEqual(widened.peek('x'), IntervalLattice(0, 1))
+        self.assertEqual(widened.peek('y'), IntervalLattice(2, inf))
+        widened = deepcopy(two).widening(one)
+        self.assertEqual(widened.peek('x'), IntervalLattice(0, 1))
+        self.assertEqual(widened.peek('y'), IntervalLattice(2, 4))
+
+
+class TestStoreWithArrays(unittest.TestCase):
+
+    def setUp(self):
+        self.x = VariableIdentifier(IntegerLyraType(), 'x')
+        self.l = VariableIdentifier(ListLyraType(IntegerLyraType()), 'l')
+
+    def test_lattice(self):
+        state = IntervalStateWithSummarization({self.x, self.l}, arrays=True)
+        self.assertIsInstance(state.store, IntervalArray)
+        self.assertTrue(state.is_top())
+        copy = deepcopy(state)
+        copy.store[self.x].meet(IntervalLattice(0, 0))
+        self.assertTrue(copy.less_equal(state))
+        self.assertFalse(state.less_equal(copy))
+        self.assertEqual(repr(copy), "l -> [-inf, inf]; x -> [0, 0]")
+        copy.lengths[self.l.length].meet(IntervalLattice(upper=-1))
+        self.assertTrue(copy.is_bottom())
+        state.join(copy)
+        self.assertTrue(state.is_top())
+
+    def test_equivalence(self):
+        states = [IntervalStateWithSummarization({self.x, self.l}, arrays=arrays)
+                  for arrays in (False, True)]
+        for state in states:
+            copy = deepcopy(state)
+            state.store[self.x].meet(IntervalLattice(0, 0))
+            copy.store[self.x].meet(IntervalLattice(1, 1))
+            state.lengths[self.l.length].meet(IntervalLattice(0, 2))
+            copy.lengths[self.l.length].meet(IntervalLattice(0, 3))
+            state.widening(copy)
+        self.assertEqual(repr(states[0]), repr(states[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
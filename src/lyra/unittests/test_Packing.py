@@ -0,0 +1,47 @@
+"""
+Variable Packing - Unit Tests
+=============================
+
+:Author: Caterina Urban
+"""
+import ast
+import unittest
+
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.types import IntegerLyraType
+from lyra.engine.packing import Packing
+from lyra.frontend.cfg_generator import ast_to_cfgs
+
+
+class TestPacking(unittest.TestCase):
+
+    source = """
+a: int = int(input())
+b: int = int(input())
+c: int = a + 1
+d: int = 0
+while d < b:
+    d = d + 2
+e: int = 3
+"""
+
+    def setUp(self):
+        self.cfg = ast_to_cfgs(ast.parse(self.source))['']
+
+    def test_packs(self):
+        packs = Packing(self.cfg).packs()
+        self.assertEqual(packs, [{'a', 'c'}, {'b', 'd'}, {'e'}])
+
+    def test_pack(self):
+        packing = Packing(self.cfg)
+        self.assertEqual(packing.pack('d'), {'b', 'd'})
+        self.assertEqual(packing.pack('e'), {'e'})
+
+    def test_variables(self):
+        f = VariableIdentifier(IntegerLyraType(), 'f')
+        packs = Packing(self.cfg, self.cfg.variables | {f}).packs()
+        self.assertIn({'f'}, packs)
+
+
+if __name__ == '__main__':
+    unittest.main()
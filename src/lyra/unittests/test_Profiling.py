@@ -0,0 +1,69 @@
+"""
+Fixpoint Profiling - Unit Tests
+===============================
+
+:Author: Caterina Urban
+"""
+import io
+import json
+import unittest
+
+from lyra.core.cfg import Loop
+from lyra.engine.numerical.interval_analysis import ForwardIntervalAnalysisWithSummarization
+from lyra.engine.profiling import Profile
+
+
+class TestProfiling(unittest.TestCase):
+
+    source = """
+def f(x: int) -> int:
+    return x + 1
+
+
+a: int = 0
+while a < 100:
+    a: int = f(a)
+print(a)
+"""
+
+    def setUp(self):
+        self.runner = ForwardIntervalAnalysisWithSummarization()
+        self.runner.parse(self.source)
+
+    def test_counters(self):
+        expected, _ = self.runner.analyze()
+        expected = str(expected.get_node_result(self.runner.cfgs[''].out_node))
+        self.runner.profile = profile = Profile()
+        result, interpreter = self.runner.analyze()
+        self.assertEqual(str(result.get_node_result(self.runner.cfgs[''].out_node)), expected)
+        visits = sum(sum(nodes.values()) for nodes in profile.visits.values())
+        self.assertEqual(visits, interpreter.visits)
+        heads = [n for n in self.runner.cfgs[''].nodes.values() if isinstance(n, Loop)]
+        self.assertGreater(profile.iterations['<module>'][heads[0].identifier], 1)
+        self.assertIn('f', profile.visits)
+        self.assertGreater(profile.copies, 0)
+        for operation in ('join', 'widening', 'less_equal', 'semantics Assignment'):
+            self.assertGreater(profile.calls[operation], 0)
+
+    def test_export(self):
+        self.runner.profile = profile = Profile()
+        self.runner.analyze()
+        stream = io.StringIO()
+        profile.dump(stream)
+        exported = json.loads(stream.getvalue())
+        self.assertEqual(exported['copies'], profile.copies)
+        self.assertEqual(exported['operations']['join']['calls'], profile.calls['join'])
+        stream = io.StringIO()
+        profile.dump_collapsed(stream)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), len(profile.stacks))
+        for line in lines:
+            frames, elapsed = line.rsplit(' ', 1)
+            self.assertTrue(frames.startswith('<module>;'))
+            self.assertGreaterEqual(int(elapsed), 0)
+        # the analysis of the called function is nested within the semantics of the call
+        self.assertTrue(any(';f;' in line for line in lines))
+
+
+if __name__ == '__main__':
+    unittest.main()
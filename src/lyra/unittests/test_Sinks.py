@@ -0,0 +1,63 @@
+"""
+Output Sinks - Unit Tests
+=========================
+
+:Author: Caterina Urban
+"""
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from lyra.engine.sinks import DOTSink, HTMLSink, JSONSink, TextSink
+from lyra.engine.usage.usage_analysis import SimpleUsageAnalysis
+
+
+class TestSinks(unittest.TestCase):
+
+    source = "x: int = int(input())\ny: int = x + 1\nprint(y)\n"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'program.py')
+        with open(self.path, 'w') as file:
+            file.write(self.source)
+        self.runner = SimpleUsageAnalysis()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_text(self):
+        stream = io.StringIO()
+        self.runner.headless(TextSink(stream)).main(self.path)
+        self.assertIn("print(y)", stream.getvalue())
+        self.assertEqual(set(self.runner.timing), {'analysis', 'rendering'})
+
+    def test_json(self):
+        result = self.runner.headless(JSONSink()).main(self.path)
+        with open(os.path.join(self.directory.name, 'program.json')) as file:
+            document = json.load(file)
+        self.assertEqual(document['path'], self.path)
+        nodes = document['result']['']
+        for node in self.runner.cfgs[''].nodes.values():
+            states = next(iter(result.get_node_result(node).values()))
+            self.assertEqual(nodes[str(node.identifier)], [[str(state) for state in states]])
+
+    def test_dot(self):
+        self.runner.headless(DOTSink()).main(self.path)
+        with open(os.path.join(self.directory.name, 'program.gv')) as file:
+            self.assertTrue(file.read().startswith('digraph'))
+
+    def test_html(self):
+        self.runner.headless(HTMLSink()).main(self.path)
+        with open(os.path.join(self.directory.name, 'program.html')) as file:
+            self.assertIn('"program.nodes"', file.read())
+        nodes = os.path.join(self.directory.name, 'program.nodes')
+        for identifier in self.runner.cfgs[''].nodes:     # a record per node
+            with open(os.path.join(nodes, f"{identifier}.json")) as file:
+                self.assertEqual(json.load(file)['node'], identifier)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Sparse Analysis - Unit Tests
+============================
+
+:Author: Caterina Urban
+"""
+import unittest
+
+from lyra.engine.liveness.liveness_analysis import StrongLivenessAnalysis
+from lyra.engine.numerical.interval_analysis import ForwardIntervalAnalysisWithSummarization
+from lyra.engine.sparse import Occurrences
+from lyra.engine.usage.usage_analysis import SimpleUsageAnalysis
+
+
+class TestSparse(unittest.TestCase):
+
+    source = """
+a: int = 0
+b: int = 0
+c: int = int(input())
+while a < 100:
+    a: int = a + 1
+    if c < 3:
+        b: int = 1
+    else:
+        b: int = 2
+    print(b)
+d: int = a + b
+print(d)
+"""
+
+    @staticmethod
+    def results(runner, result):
+        results = dict()
+        for identifier, node in runner.cfgs[''].nodes.items():
+            states = result.get_node_result(node).values()
+            results[identifier] = [[str(state) for state in ctx] for ctx in states]
+        return results
+
+    def test_occurrences(self):
+        runner = SimpleUsageAnalysis()
+        runner.parse(self.source)
+        cfg = runner.cfgs['']
+        occurrences = Occurrences.of(cfg, runner.cfgs)
+        self.assertIs(occurrences, Occurrences.of(cfg, runner.cfgs))
+        names = [occurrences.names(node) for node in cfg.nodes.values()]
+        self.assertIn(frozenset({'b'}), names)
+        self.assertNotIn(None, names)
+        # blocks calling user-defined functions always have to be executed
+        occurrences = Occurrences(cfg, {'print'})
+        names = [occurrences.names(node) for node in cfg.nodes.values()]
+        self.assertIn(None, names)
+
+    def test_analyses(self):
+        for analysis in (ForwardIntervalAnalysisWithSummarization,
+                         StrongLivenessAnalysis, SimpleUsageAnalysis):
+            dense, sparse = analysis(), analysis()
+            sparse.sparse = True
+            dense.parse(self.source)
+            sparse.parse(self.source)
+            expected, _ = dense.analyze()
+            result, interpreter = sparse.analyze()
+            self.assertEqual(self.results(sparse, result), self.results(dense, expected))
+            if analysis is ForwardIntervalAnalysisWithSummarization:
+                self.assertGreater(interpreter.skipped, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Store - Unit Tests
+==================
+
+:Author: Caterina Urban
+"""
+import unittest
+from copy import deepcopy
+
+from lyra.abstract_domains.numerical.interval_domain import IntervalStateWithSummarization
+from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+from lyra.abstract_domains.store import CopyOnWriteDict
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.types import IntegerLyraType
+
+
+class TestCopyOnWriteDict(unittest.TestCase):
+
+    def test_copy(self):
+        original = CopyOnWriteDict({'x': IntervalLattice(0, 1), 'y': IntervalLattice(2, 3)})
+        copy = deepcopy(original)
+        self.assertIs(original.peek('x'), copy.peek('x'))
+        copy['x'].join(IntervalLattice(5, 5))     # the shared value is copied before modification
+        self.assertEqual(original['x'], IntervalLattice(0, 1))
+        self.assertEqual(copy['x'], IntervalLattice(0, 5))
+        self.assertIs(original.peek('y'), copy.peek('y'))
+        original['y'].bottom()
+        self.assertTrue(original['y'].is_bottom())
+        self.assertFalse(copy['y'].is_bottom())
+
+    def test_hash(self):
+        original = CopyOnWriteDict({'x': IntervalLattice(0, 1)})
+        copy = deepcopy(original)
+        self.assertEqual(original, copy)
+        self.assertEqual(hash(original), hash(copy))
+        copy['x'].join(IntervalLattice(5, 5))     # the cached hash is reset before modification
+        self.assertNotEqual(original, copy)
+        self.assertEqual(hash(copy), hash(CopyOnWriteDict({'x': IntervalLattice(0, 5)})))
+
+    def test_versions(self):
+        original = CopyOnWriteDict({'x': IntervalLattice(0, 1), 'y': IntervalLattice(2, 3)})
+        self.assertIsNone(original.version('x'))  # might still be modified
+        copy = deepcopy(original)
+        self.assertIsNotNone(original.version('x'))
+        self.assertEqual(original.version('x'), copy.version('x'))
+        self.assertNotEqual(original.version('x'), original.version('y'))
+        copy['x'].join(IntervalLattice(5, 5))
+        self.assertIsNone(copy.version('x'))
+        self.assertNotEqual(deepcopy(copy).version('x'), original.version('x'))
+        self.assertEqual(copy.version('y'), original.version('y'))
+
+
+class TestStoreCopy(unittest.TestCase):
+
+    def test_deepcopy(self):
+        x, y = VariableIdentifier(IntegerLyraType(), 'x'), VariableIdentifier(IntegerLyraType(), 'y')
+        state = IntervalStateWithSummarization({x, y})
+        copy = deepcopy(state)
+        copy.store[x].meet(IntervalLattice(0, 0))
+        self.assertIs(state.store.peek(y), copy.store.peek(y))
+        self.assertEqual(repr(state), "x -> [-inf, inf]; y -> [-inf, inf]")
+        self.assertEqual(repr(copy), "x -> [0, 0]; y -> [-inf, inf]")
+        self.assertTrue(copy.less_equal(state))
+        self.assertFalse(state.less_equal(copy))
+        copy.add_variable(VariableIdentifier(IntegerLyraType(), 'z'))
+        self.assertEqual(len(state.variables), 2)
+
+    def test_equality(self):
+        x, y = VariableIdentifier(IntegerLyraType(), 'x'), VariableIdentifier(IntegerLyraType(), 'y')
+        state = IntervalStateWithSummarization({x, y})
+        copy = deepcopy(state)
+        self.assertEqual(state, copy)
+        self.assertEqual(hash(state), hash(copy))
+        copy.store[y].meet(IntervalLattice(0, 0))
+        self.assertNotEqual(state, copy)
+        copy.store[y].top()
+        self.assertEqual(state, copy)
+        self.assertEqual(hash(state), hash(copy))
+        self.assertEqual(len({state: 0, copy: 1}), 1)
+
+    def test_join(self):
+        x, y = VariableIdentifier(IntegerLyraType(), 'x'), VariableIdentifier(IntegerLyraType(), 'y')
+        state = IntervalStateWithSummarization({x, y})
+        state.store[x].meet(IntervalLattice(0, 0))
+        other = deepcopy(state)
+        other.store[x].join(IntervalLattice(5, 5))
+        shared, version = other.store.peek(x), other.store.version(y)
+        copy = deepcopy(other)
+        state.join(copy)    # the values of the other store are only read
+        self.assertEqual(repr(state), "x -> [0, 5]; y -> [-inf, inf]")
+        self.assertIs(copy.store.peek(x), other.store.peek(x))
+        self.assertIs(other.store.peek(x), shared)
+        self.assertEqual(copy.store.version(y), version)
+        self.assertEqual(copy.store.version(x), other.store.version(x))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Widening Thresholds and Narrowing - Unit Tests
+==============================================
+
+:Author: Caterina Urban
+"""
+import unittest
+from math import inf
+
+from lyra.abstract_domains.numerical.interval_array import IntervalArray
+from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+from lyra.engine.numerical.interval_analysis import ForwardIntervalAnalysisWithSummarization
+from lyra.engine.thresholds import thresholds
+
+
+class TestThresholds(unittest.TestCase):
+
+    source = """
+a: int = 0
+while a < 100:
+    a: int = a + 1
+print(a)
+"""
+
+    def test_lattice(self):
+        bounds = [-1, 0, 1, 99, 100, 101]
+        widening = IntervalLattice(0, 1).widening_with_thresholds(IntervalLattice(-0.5, 2), bounds)
+        self.assertEqual(widening, IntervalLattice(-1, 99))
+        widening = IntervalLattice(0, 1).widening_with_thresholds(IntervalLattice(0, 200), bounds)
+        self.assertEqual(widening, IntervalLattice(0, inf))
+        widening = IntervalLattice(0, 1).widening_with_thresholds(IntervalLattice(0, 1), bounds)
+        self.assertEqual(widening, IntervalLattice(0, 1))
+
+    def test_array(self):
+        """The array-backed widening with thresholds agrees with the widening of intervals."""
+        bounds = [-1, 0, 0.5, 1, 99, 100, 101]
+        left = {'x': IntervalLattice(0, 1), 'y': IntervalLattice(0, 1), 'z': IntervalLattice()}
+        right = {'x': IntervalLattice(-3, 0.2), 'y': IntervalLattice(0, 200), 'z': IntervalLattice(0, 1)}
+        array = IntervalArray(left).widening(IntervalArray(right), bounds)
+        for key, value in left.items():
+            expected = IntervalLattice(value.lower, value.upper)
+            expected.widening_with_thresholds(right[key], bounds)
+            self.assertEqual(array.peek(key), expected)
+
+    def test_harvest(self):
+        runner = ForwardIntervalAnalysisWithSummarization()
+        runner.parse(self.source)
+        harvested = thresholds(runner.cfgs[''])
+        self.assertIs(harvested, thresholds(runner.cfgs['']))
+        self.assertEqual(harvested, sorted(harvested))
+        for value in (-101, -100, -1, 0, 1, 99, 100, 101):
+            self.assertIn(value, harvested)
+
+    def test_analysis(self):
+        for widening, narrowing in ((True, 0), (False, 2), (True, 2)):
+            runner = ForwardIntervalAnalysisWithSummarization()
+            runner.thresholds, runner.narrowing = widening, narrowing
+            runner.parse(self.source)
+            result, _ = runner.analyze()
+            final = result.get_node_result(runner.cfgs[''].out_node)
+            self.assertEqual(str(next(iter(final.values()))[0]), "a -> [100, 100]")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Input Data Validator - Unit Tests
+=================================
+
+:Author: Caterina Urban
+"""
+import io
+import unittest
+
+from lyra.engine.assumption.validator import DataStream, Validator
+
+
+class TestValidator(unittest.TestCase):
+
+    source = """
+N: int = int(input())
+one: int = 0
+two: int = 0
+three: int = 0
+for i in range(N):
+    num: int = int(input())
+    if num == 1:
+        one: int = one + 1
+    elif num == 2:
+        two: int = two + 1
+    elif num == 3:
+        three: int = three + 1
+    else:
+        raise ValueError
+"""
+
+    assumption = {'repeat': 1, 'constraints': [
+        {'line': 2, 'type': 'Integer'},
+        {'repeat': {'input': [2, 1]}, 'constraints': [
+            {'line': 7, 'type': 'Integer', 'range': [1, 3]}
+        ]}
+    ]}
+
+    @staticmethod
+    def validate(assumption, data, chunk=2):
+        return Validator(assumption, chunk).validate(DataStream.lines(io.StringIO(data), chunk))
+
+    def test_lines(self):
+        self.assertIsNone(self.validate(self.assumption, "5\n1\n2\n3\n3\n1\n"))
+        violation = self.validate(self.assumption, "5\n1\n2\n3\n4\n1\n")
+        self.assertEqual((violation.line, violation.value), (5, '4'))
+        violation = self.validate(self.assumption, "5\n1\n2\n3.5\n3\n1\n")
+        self.assertEqual((violation.line, violation.reason), (4, "not an integer"))
+        violation = self.validate(self.assumption, "5\n1\n2\n")
+        self.assertEqual((violation.line, violation.reason), (4, "missing input data"))
+        violation = self.validate(self.assumption, "1\n1\n2\n")
+        self.assertEqual((violation.line, violation.reason), (3, "unexpected input data"))
+
+    def test_star(self):
+        assumption = {'repeat': 1, 'constraints': [{'line': 2, 'type': 'Float'}, {'star': True}]}
+        self.assertIsNone(self.validate(assumption, "2.5\nanything\n"))
+        self.assertEqual(self.validate(assumption, "nope\n").line, 1)
+        assumption = {'repeat': None, 'constraints': [{'line': 2, 'type': 'Float'}]}
+        self.assertIsNone(self.validate(assumption, "anything\n"))
+
+    def test_strings(self):
+        assumption = {'repeat': 3, 'constraints': [
+            {'line': 2, 'alphabet': {'certainly': ['a'], 'maybe': ['a', 'b']}},
+            {'line': 3, 'words': ['yes', 'no']}
+        ]}
+        self.assertIsNone(self.validate(assumption, "ab\nyes\naa\nno\nba\nno\n"))
+        violation = self.validate(assumption, "ab\nyes\nbb\nno\nba\nno\n")
+        self.assertEqual((violation.line, violation.reason), (3, "missing 'a'"))
+        violation = self.validate(assumption, "ab\nyes\nac\nmaybe\nba\nno\n")
+        self.assertEqual((violation.line, violation.reason), (3, "unexpected characters"))
+
+    def test_csv(self):
+        assumption = {'repeat': 2, 'constraints': [
+            {'line': 2, 'type': 'Boolean'}, {'line': 3, 'range': [None, 0], 'quantity': ['<0', '=0']}
+        ]}
+        data = DataStream.csv(io.StringIO("1;-3\n0;1\n"), delimiter=';', chunk=1)
+        violation = Validator(assumption).validate(data)
+        self.assertEqual((violation.line, violation.column, violation.value), (2, 2, '1'))
+
+    def test_analysis(self):
+        from lyra.engine.assumption.assumption_analysis import TypeRangeAssumptionAnalysis
+        from lyra.engine.sinks import ValidatorSink
+        runner = TypeRangeAssumptionAnalysis()
+        runner.parse(self.source)
+        result, _ = runner.analyze()
+        runner.path = 'program.py'
+        document = ValidatorSink.document(runner, result)
+        self.assertEqual(document['assumption'], self.assumption)
+
+
+if __name__ == '__main__':
+    unittest.main()
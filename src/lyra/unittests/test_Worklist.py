@@ -0,0 +1,62 @@
+"""
+Worklist Scheduling - Unit Tests
+================================
+
+:Author: Caterina Urban
+"""
+import ast
+import unittest
+
+from lyra.core.cfg import Loop
+from lyra.engine.worklist import WeakTopologicalOrder, PriorityWorklist, FIFOWorklist
+from lyra.frontend.cfg_generator import ast_to_cfgs
+
+
+class TestWeakTopologicalOrder(unittest.TestCase):
+
+    source = """
+x: int = 0
+while x < 10:
+    y: int = 0
+    while y < x:
+        y: int = y + 1
+    x: int = x + 1
+print(x)
+"""
+
+    def setUp(self):
+        self.cfg = ast_to_cfgs(ast.parse(self.source))['']
+
+    def test_heads(self):
+        for backward in (False, True):
+            order = WeakTopologicalOrder(self.cfg, backward)
+            loops = {n.identifier for n in self.cfg.nodes.values() if isinstance(n, Loop)}
+            self.assertEqual(len(order.heads), len(loops))
+
+    def test_positions(self):
+        order = WeakTopologicalOrder(self.cfg)
+        self.assertEqual(order.position(self.cfg.in_node), 0)
+        self.assertEqual(len(order.positions), len(self.cfg.nodes))
+        # every node comes after at least one of its predecessors, except for the entry node
+        for node in self.cfg.nodes.values():
+            if node != self.cfg.in_node:
+                predecessors = self.cfg.predecessors(node)
+                self.assertTrue(any(order.position(p) < order.position(node) for p in predecessors))
+
+    def test_duplicates(self):
+        fifo, priority = FIFOWorklist(self.cfg), PriorityWorklist(self.cfg)
+        for worklist in (fifo, priority):
+            for node in self.cfg.nodes.values():
+                worklist.put(node)
+                worklist.put(node)
+        self.assertEqual(priority.saved, len(self.cfg.nodes))
+        nodes = list()
+        while not priority.empty():
+            nodes.append(priority.get())
+        self.assertEqual(len(nodes), len(self.cfg.nodes))
+        self.assertEqual(nodes[0], self.cfg.in_node)
+        self.assertEqual(priority.visits, len(self.cfg.nodes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import html
+import json
 import numbers
+import os
 from itertools import zip_longest
 from uuid import uuid4 as uuid
 
@@ -8,6 +10,7 @@ import graphviz as gv
 from lyra.abstract_domains.state import State
 from lyra.core.cfg import *
 from lyra.engine.result import AnalysisResult
+from lyra.engine.worklist import WeakTopologicalOrder
 
 
 class GraphRenderer(metaclass=ABCMeta):
@@ -73,8 +76,13 @@ class GraphRenderer(metaclass=ABCMeta):
         :param data: the data to be rendered
         """
 
-    def render(self, data, label=None, filename="Graph", directory="graphs", view=True):
-        """Graphviz rendering."""
+    def graph(self, data, label=None) -> gv.Digraph:
+        """Graphviz graph of data, without computing its layout.
+
+        :param data: the data to be rendered
+        :param label: label of the graph
+        :return: Graphviz graph
+        """
 
         # create the Graphviz graph
         graph_attr = self.graph_attr.copy()
@@ -89,6 +97,18 @@ class GraphRenderer(metaclass=ABCMeta):
         self._render(data)
         self._graph = None
         self._rendered = None
+        return graph
+
+    def save(self, data, label=None, filename="Graph", directory="graphs"):
+        """Graphviz DOT source file, without computing the layout of the graph.
+
+        :return: path of the saved DOT source file
+        """
+        return self.graph(data, label).save(f"{filename}.gv", directory)
+
+    def render(self, data, label=None, filename="Graph", directory="graphs", view=True):
+        """Graphviz rendering."""
+        graph = self.graph(data, label)
 
         # display the Graphviz graph
         graph.format = "pdf"
@@ -191,39 +211,193 @@ class CFGRenderer(GraphRenderer):
 
 
 class AnalysisResultRenderer(CFGRenderer):
-    """Graphviz rendering of an analysis result on the analyzed control flow graph."""
+    """Graphviz rendering of an analysis result on the analyzed control flow graph.
+
+    Results on large programs can be rendered with the nodes clustered by function and by loop,
+    and with the labels of the states shortened and limited to a total budget of characters.
+    The states of the nodes beyond the budget are omitted from their labels
+    (and can be looked up in an export of the result).
+    """
+
+    def __init__(self, clusters: bool = False, budget: int = None, length: int = None):
+        """Create a renderer of analysis results.
+
+        :param clusters: whether to cluster the nodes by function and by loop
+        :param budget: maximum total length of the state labels (unlimited by default)
+        :param length: maximum length of each state label (unlimited by default)
+        """
+        self._clusters = clusters
+        self._budget = budget
+        self._length = length
+        self._remaining = None      # remaining budget for state labels
+        self._omitted = 0           # number of nodes whose states have been omitted
+
+    @property
+    def omitted(self):
+        """Number of nodes whose states have been omitted from the latest rendering."""
+        return self._omitted
+
+    def _state_label(self, label):
+        label = label.replace(';', '\n')
+        if self._length is not None and len(label) > self._length:
+            half = max(1, (self._length - 3) // 2)
+            label = label[:half] + "..." + label[-half:]
+        return label
 
     def _basic_node_label(self, node, result: AnalysisResult, fname='', ctx=False):
         results: Dict[State, List[State]] = result.get_node_result(node)
         state = '<font point-size="9">{} </font>'
         node_result = [fname] if fname and ctx else list()      # add function name
         stmt = '<font color="#ffffff" point-size="11">{}</font>'
-        for idx in range(len(node.stmts)):
+        labels = list()     # state labels before each statement and after the last statement
+        for idx in range(len(node.stmts) + 1):
             # ctxs -> states
+            labels.append(list())
             for i, states in enumerate(results.values()):
-                ctx2state = 'ctx{}: {}'.format(i, states[idx]).replace(';', '\n') if fname else str(states[idx]).replace(';', '\n')
-                node_result.append(state.format(html.escape(ctx2state).replace('\n', '<br />')))
+                idx2state = states[idx] if idx < len(node.stmts) else states[-1]
+                ctx2state = 'ctx{}: {}'.format(i, idx2state) if fname else str(idx2state)
+                labels[-1].append(self._state_label(ctx2state))
+        if self._remaining is not None:
+            size = sum(len(label) for before in labels for label in before)
+            if size > self._remaining:      # omit the states
+                self._omitted += 1
+                labels = [[] for _ in labels]
+                labels[-1].append('...')
+            else:
+                self._remaining -= size
+        for idx, before in enumerate(labels):
+            for label in before:
+                node_result.append(state.format(html.escape(label).replace('\n', '<br />')))
             # stmt
-            node_result.append(stmt.format(html.escape(str(node.stmts[idx]))))
-        # last ctx -> states
-        for i, states in enumerate(results.values()):
-            ctx2state = 'ctx{}: {}'.format(i, states[-1]).replace(';', '\n') if fname else str(states[-1]).replace(';', '\n')
-            node_result.append(state.format(html.escape(ctx2state).replace('\n', '<br />')))
+            if idx < len(node.stmts):
+                node_result.append(stmt.format(html.escape(str(node.stmts[idx]))))
         return self._list2table(node_result, escape=False)
 
+    def save_html(self, data, label=None, filename="Graph", directory="graphs", nodes=None):
+        """Interactive HTML view of the graph, laid out in the browser.
+
+        Clicking on a node shows its states, loaded on demand from
+        the record of the node in the analysis result (cf. ``lyra.engine.export.dump_nodes``).
+
+        :param nodes: path of the directory of the node records, relative to the HTML view
+        :return: path of the saved HTML view
+        """
+        source = self.graph(data, label).source
+        page = _html.format(title=html.escape(label or filename),
+                            source=json.dumps(source).replace('</', '<\\/'),
+                            nodes=json.dumps(nodes or f"{filename}.nodes"))
+        path = os.path.join(directory, f"{filename}.html")
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as view:
+            view.write(page)
+        return path
+
+    def _render_nodes(self, nodes, fname, fcfg, result):
+        for node in nodes:
+            fillcolor = self._node_color(node, fcfg)
+            if isinstance(node, (Basic, Loop)):
+                label = self._basic_node_label(node, result, fname, node == fcfg.in_node)
+                self._render_node(node, label, fillcolor)
+            else:
+                label = self._escape_label(self._shorten_label(str(node)))
+                self._render_node(node, label, fillcolor)
+
+    def _render_cluster(self, name, label, render):
+        """Render nodes within a cluster (subgraph) of the graph being rendered."""
+        graph, self._graph = self._graph, gv.Digraph(name=f"cluster_{name}")
+        self._graph.attr('graph', label=self._escape_label(label), style='dashed')
+        render()
+        graph.subgraph(self._graph)
+        self._graph = graph
+
+    def _render_component(self, component, fname, fcfg, result):
+        for element in component:
+            if isinstance(element, list):   # a loop
+                self._render_loop(element, fname, fcfg, result)
+            else:
+                self._render_nodes([element], fname, fcfg, result)
+
+    def _render_loop(self, component, fname, fcfg, result):
+        head = component[0]
+        name = f"{fname}_{head.identifier}" if fname else str(head.identifier)
+        self._render_cluster(name, f"loop {head.identifier}",
+                             lambda: self._render_component(component, fname, fcfg, result))
+
+    def _render_function(self, fname, fcfg, result):
+        order = WeakTopologicalOrder(fcfg)
+        self._render_component(order.components, fname, fcfg, result)
+        unreachable = [node for node in fcfg.nodes.values()
+                       if node.identifier not in order.positions]
+        self._render_nodes(unreachable, fname, fcfg, result)
+
     def _render(self, data):
         (cfgs, result) = data
+        self._remaining = self._budget
+        self._omitted = 0
         previous = None
         for fname, fcfg in cfgs.items():
-            for node in fcfg.nodes.values():
-                fillcolor = self._node_color(node, fcfg)
-                if isinstance(node, (Basic, Loop)):
-                    label = self._basic_node_label(node, result, fname, node == fcfg.in_node)
-                    self._render_node(node, label, fillcolor)
-                else:
-                    label = self._escape_label(self._shorten_label(str(node)))
-                    self._render_node(node, label, fillcolor)
+            if self._clusters:
+                self._render_cluster(fname or 'main', fname or 'main',
+                                     lambda: self._render_function(fname, fcfg, result))
+            else:
+                self._render_nodes(fcfg.nodes.values(), fname, fcfg, result)
             self._render_edges(fcfg)
             if previous:
                 self._graph.edge(str(previous.out_node.identifier), str(fcfg.in_node.identifier), _attributes={'style':'invis'})
             previous = fcfg
+
+
+_html = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="https://unpkg.com/d3@7/dist/d3.min.js"></script>
+<script src="https://unpkg.com/@hpcc-js/wasm@2/dist/graphviz.umd.js"></script>
+<script src="https://unpkg.com/d3-graphviz@5/build/d3-graphviz.js"></script>
+<style>
+body {{ display: flex; margin: 0; font-family: sans-serif; }}
+#graph {{ flex: 3; height: 100vh; overflow: auto; }}
+#states {{
+    flex: 1; height: 100vh; overflow: auto; padding: 1em;
+    white-space: pre-wrap; font-size: small;
+}}
+</style>
+</head>
+<body>
+<div id="graph"></div>
+<div id="states">Click on a node to show its states.</div>
+<script>
+const source = {source};
+const nodes = {nodes};
+const records = new Map();  // node records, each loaded on the first click on its node
+async function load(identifier) {{
+    if (!records.has(identifier)) {{
+        const response = await fetch(nodes + "/" + encodeURIComponent(identifier) + ".json");
+        records.set(identifier, response.ok ? await response.json() : null);
+    }}
+    return records.get(identifier);
+}}
+async function show(identifier) {{
+    const panel = document.getElementById("states");
+    const record = await load(identifier);
+    if (!record) {{ panel.textContent = "No result for node " + identifier; return; }}
+    const lines = ["node " + record.node + " (" + (record.function || "main") + ")"];
+    record.contexts.forEach((context, i) => {{
+        lines.push("", "ctx" + i + (context.context ? ": " + context.context : ""));
+        context.states.forEach((state, j) => {{
+            lines.push("  " + state);
+            if (j < record.statements.length) lines.push("> " + record.statements[j].text);
+        }});
+    }});
+    panel.textContent = lines.join("\\n");
+}}
+d3.select("#graph").graphviz().zoom(true).renderDot(source).on("end", () => {{
+    d3.selectAll(".node").on("click", function () {{
+        show(d3.select(this).select("title").text());
+    }});
+}});
+</script>
+</body>
+</html>
+"""